@@ -0,0 +1,39 @@
+# src/rachel/api/deep_request.py
+
+import asyncio
+from fastapi import Request
+from rachel.clients.deep.base import DeepLLMClient
+from rachel.search_cache import SearchKey, search_cache
+from rachel.utils.common import debug
+from rachel.utils.metrics import increment
+
+DISCONNECT_POLL_SECONDS = 0.5
+
+# nginx's "client closed request"; nobody reads it, but it keeps access logs honest
+CLIENT_CLOSED_REQUEST = 499
+
+
+class ClientDisconnected(Exception):
+    pass
+
+
+async def send_while_connected(request: Request, client: DeepLLMClient, prompt: str, key: SearchKey) -> str:
+    """
+    Await `client.send_async(prompt)` without blocking the event loop. Identical concurrent
+    searches (same `key`) share one call; this request stops waiting as soon as its HTTP
+    client goes away (raises ClientDisconnected), and the call is cancelled once nobody waits.
+    """
+    flight = search_cache.join(key, lambda: client.send_async(prompt))
+    try:
+        while True:
+            # Note: asyncio.wait never cancels the shared task, even if this waiter is cancelled
+            done, _ = await asyncio.wait({flight.task}, timeout=DISCONNECT_POLL_SECONDS)
+            if done:
+                return flight.task.result()
+            if await request.is_disconnected():
+                debug(f"@send_while_connected: client left {request.url.path}; releasing deep call")
+                increment("deep_search.cancelled")
+                raise ClientDisconnected()
+    finally:
+        # Note: native async clients abort the HTTP request; thread-backed ones just stop being awaited
+        search_cache.leave(flight)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 import time
 import json
 from rachel.core.types import DeepSearchRequest, DeepSearchResponse
@@ -6,43 +6,57 @@ from rachel.core.config import get_config
 from rachel.utils.prompts import generate_deepsearch_prompt
 from rachel.runtime.runtime import transcript_archive, transcript_archive_lock
 from rachel.clients.deep.loader import get_deep_llm
+from rachel.search_cache import deepsearch_payload, search_cache, search_key
+from rachel.api.deep_request import CLIENT_CLOSED_REQUEST, ClientDisconnected, send_while_connected
 
 router = APIRouter()
 cfg = get_config()
 client = get_deep_llm()
 
+def attach_deep_search(segment_id: str, response_text: str):
+    with transcript_archive_lock:
+        segment = transcript_archive.get(segment_id)
+        if segment and segment.flags:
+            segment.flags[-1].deep_search = response_text
+
 @router.post(
     "/deepsearch",
     response_model=DeepSearchResponse,
     response_description="Structured deep analysis of the given segment."
 )
-async def deepsearch(req: DeepSearchRequest):
+async def deepsearch(req: DeepSearchRequest, request: Request):
     try:
+        key = search_key("deepsearch", req.segment_id)
+        cached = search_cache.get(key)
+        if cached is not None:
+            payload, response_text = cached
+            attach_deep_search(req.segment_id, response_text)
+            return dict(payload)
+
         prompt = generate_deepsearch_prompt(segment_id=req.segment_id)
         if not prompt:
             return {"error": "Unable to generate prompt from archive."}
 
         start_time = time.time()
-        response_text = client.send(prompt)
+        response_text = await send_while_connected(request, client, prompt, key)
         duration = round(time.time() - start_time, 2)
 
         try:
-            parsed = json.loads(response_text)
+            parsed = deepsearch_payload(response_text, duration)
         except json.JSONDecodeError:
             return {
                 "error": "Model returned invalid JSON.",
                 "raw": response_text
             }
 
-        parsed["query_duration"] = duration
-
-        with transcript_archive_lock:
-            segment = transcript_archive.get(req.segment_id)
-            if segment and segment.flags:
-                segment.flags[-1].deep_search = response_text
+        attach_deep_search(req.segment_id, response_text)
 
+        search_cache.put(key, (dict(parsed), response_text))
         return parsed
 
+    except ClientDisconnected:
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+
     except Exception as e:
         print("❌ Error during DeepSearch:", e)
         return {"error": str(e)}
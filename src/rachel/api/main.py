@@ -1,5 +1,7 @@
 # src/rachel/api/main.py
 
+import argparse
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
@@ -13,12 +15,14 @@ from rachel.api.voice_stream import router as voice_stream_router
 from rachel.api.user_search import router as user_search_router
 from rachel.api.start_stop import router as start_stop_router
 from rachel.core.config import get_config
+from rachel.clients.audio.loader import AUDIO_SOURCE_MAP
 from rachel.transcription import start_transcription
 from rachel.shallow_llm import start_summarization
 from rachel.deep_llm import process_deep_queue
 from rachel.emit import archive_and_emit
 from rachel.runtime.runtime import stop_signal
 from rachel.runtime.threads import ManagedThread
+from rachel.search_cache import search_cache
 
 config = get_config()
 fe_config = config.network.fe
@@ -27,6 +31,8 @@ be_config = config.network.be
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("✅ [FastAPI] Lifespan startup")
+    # Note: deep-search prefetches from the deep engine's loop run their flights here, where /deepsearch can join them
+    search_cache.bind_loop(asyncio.get_running_loop())
     managed_threads = [
         ManagedThread(target=start_transcription, name="TranscriptionThread", stop_signal=stop_signal),
         ManagedThread(target=start_summarization, name="SummarizationThread", stop_signal=stop_signal),
@@ -64,7 +70,25 @@ app.include_router(metrics_router)
 app.include_router(voice_stream_router)
 app.include_router(user_search_router)
 
+def apply_cli_overrides():
+    """Let load tests swap the audio source without editing config.yaml."""
+    parser = argparse.ArgumentParser(description="Run the Rachel backend.")
+    parser.add_argument("--source", choices=list(AUDIO_SOURCE_MAP.keys()), help="Audio source (default: audio.source)")
+    parser.add_argument("--path", help="WAV file (--source wav) or directory of WAV files (--source dir)")
+    parser.add_argument("--speed", type=float, help="Replay speed for non-mic sources: 1 = real time, 4 = 4x, 0 = unthrottled")
+    args = parser.parse_args()
+
+    audio_cfg = config.audio
+    if args.source is not None:
+        audio_cfg.source = args.source
+    if args.path is not None:
+        audio_cfg.source_path = args.path
+    if args.speed is not None:
+        audio_cfg.speed = args.speed
+    audio_cfg.__post_init__()
+
 def main():
+    apply_cli_overrides()
     print(f"🚀 Launching server at {be_config.host}:{be_config.port}")
     uvicorn.run(
         "rachel.api.main:app",
@@ -14,7 +14,9 @@ from rachel.runtime.runtime import (
     shallow_queue_results,
     deep_queue,
     deep_queue_results,
+    deep_engine_state,
 )
+from rachel.utils.metrics import counters_snapshot
 
 router = APIRouter()
 
@@ -44,6 +46,11 @@ async def metrics_stream(request: Request):
                 with transcript_archive_lock:
                     processed = len(transcript_archive)
 
+                counters = counters_snapshot()
+                checked = counters.get("prefilter.checked", 0)
+                deep_requests = counters.get("deep_http.requests", 0)
+                prefetched = counters.get("deep_prefetch.issued", 0)
+
                 payload = {
                     "cpu": cpu,
                     "ram": ram,
@@ -52,9 +59,16 @@ async def metrics_stream(request: Request):
                         "transcript": transcript_queue.qsize(),
                         "shallow_results": shallow_queue_results.qsize(),
                         "deep_queue": deep_queue.qsize(),
+                        "deep_pending": deep_engine_state["pending"],
+                        "deep_in_flight": deep_engine_state["in_flight"],
+                        "deep_prefetching": deep_engine_state["prefetching"],
                         "deep_results": deep_queue_results.qsize(),
                     },
                     "segments_processed": processed,
+                    "prefilter_skip_rate": (counters.get("prefilter.skipped", 0) / checked) if checked else None,
+                    "deep_prefetch_hit_rate": (counters.get("deep_prefetch.hit", 0) / prefetched) if prefetched else None,
+                    "deep_http_reuse_rate": (1 - counters.get("deep_http.new_connections", 0) / deep_requests) if deep_requests else None,
+                    "counters": counters,
                     "timestamp": time.time()
                 }
 
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 import time
 import json
 from rachel.core.config import get_config
@@ -7,6 +7,8 @@ from rachel.runtime.runtime import transcript_archive, transcript_archive_lock
 from rachel.utils.common import debug, parse_gpt_json_response
 from rachel.utils.prompts import generate_user_search_prompt
 from rachel.clients.deep.loader import get_deep_llm
+from rachel.search_cache import search_cache, search_key
+from rachel.api.deep_request import CLIENT_CLOSED_REQUEST, ClientDisconnected, send_while_connected
 
 router = APIRouter()
 cfg = get_config()
@@ -17,8 +19,13 @@ client = get_deep_llm()
     response_model=UserSearchResponse,
     response_description="Structured user-driven deep analysis of the selected transcript section."
 )
-async def user_search(req: UserSearchRequest):
+async def user_search(req: UserSearchRequest, request: Request):
     try:
+        key = search_key("user-search", req.segment_id, req.selected_text, req.query or "")
+        cached = search_cache.get(key)
+        if cached is not None:
+            return cached
+
         prompt = generate_user_search_prompt(
             segment_id=req.segment_id,
             selected_text=req.selected_text,
@@ -30,7 +37,7 @@ async def user_search(req: UserSearchRequest):
         debug("user-search: prompt", prompt)
 
         start_time = time.time()
-        response_text = client.send(prompt)
+        response_text = await send_while_connected(request, client, prompt, key)
         duration = round(time.time() - start_time, 2)
 
         try:
@@ -54,9 +61,13 @@ async def user_search(req: UserSearchRequest):
             if segment and segment.flags:
                 segment.flags[-1].deep_search = response
 
+        search_cache.put(key, response)
         print("user-search:response:", response)
         return response
 
+    except ClientDisconnected:
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+
     except Exception as e:
         print("❌ Error during UserSearch:", e)
         return {"error": str(e)}
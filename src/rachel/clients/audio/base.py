@@ -0,0 +1,94 @@
+# src/rachel/clients/audio/base.py
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Iterator, Optional
+import numpy as np
+
+from rachel.core.config import get_config
+from rachel.utils.metrics import record_metrics
+
+AudioSink = Callable[[np.ndarray], None]
+
+
+class AudioSource(ABC):
+    """
+    Produces mono int16 samples at `audio.rate` and pushes them into a sink.
+
+    Live sources (`live = True`) never wait on the consumer; replay sources apply
+    backpressure so an unthrottled replay runs exactly as fast as the pipeline drains.
+    """
+    live: bool = True
+
+    @abstractmethod
+    def start(self, sink: AudioSink, on_end: Optional[Callable[[], None]] = None):
+        """Begin delivering audio; `on_end` fires once a finite source is exhausted."""
+        pass
+
+    @abstractmethod
+    def stop(self):
+        pass
+
+
+class ReplayAudioSource(AudioSource):
+    """
+    Base for finite, pre-recorded sources. Subclasses yield int16 blocks from
+    `blocks()`; this class paces them at `speed` x real time (0 = unthrottled).
+    """
+    live = False
+
+    def __init__(self):
+        cfg = get_config().audio
+        self.rate = cfg.rate
+        self.speed = cfg.speed
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @abstractmethod
+    def blocks(self) -> Iterator[np.ndarray]:
+        pass
+
+    def start(self, sink: AudioSink, on_end: Optional[Callable[[], None]] = None):
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(sink, on_end),
+            name=f"{type(self).__name__}Replay",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def _run(self, sink: AudioSink, on_end: Optional[Callable[[], None]]):
+        t0 = time.time()
+        frames = 0
+        paced_since, paced_frames = t0, 0
+        speed_label = f"{self.speed}x" if self.speed > 0 else "unthrottled"
+        print(f"▶️ Replaying {type(self).__name__} at {speed_label}")
+
+        try:
+            for block in self.blocks():
+                if self._stop.is_set():
+                    break
+
+                sink(block)
+                frames += len(block)
+
+                if self.speed > 0:
+                    ahead = (frames - paced_frames) / (self.rate * self.speed) - (time.time() - paced_since)
+                    if ahead > 0:
+                        time.sleep(ahead)
+                    elif ahead < -0.5:
+                        # Note: we were blocked (paused/backpressure); don't burst to catch up
+                        paced_since, paced_frames = time.time(), frames
+        except Exception as e:
+            print(f"❌ Error replaying audio source: {e}")
+        finally:
+            print(f"🏁 Replay finished ({speed_label})")
+            record_metrics(f"replay: {type(self).__name__}", t0, audio_duration=frames / self.rate)
+            if on_end:
+                on_end()
@@ -0,0 +1,34 @@
+# src/rachel/clients/audio/directory.py
+
+import os
+from typing import Iterator
+import numpy as np
+
+from rachel.core.config import get_config
+from rachel.utils.file_system import assert_model_path_exists
+from .base import ReplayAudioSource
+from .wav_file import wav_blocks
+
+
+class DirectorySource(ReplayAudioSource):
+    """Replays every .wav file in a directory (sorted by name) as one continuous stream."""
+
+    def __init__(self):
+        super().__init__()
+        audio_cfg = get_config().audio
+        self.path = audio_cfg.source_path
+        self.block_frames = audio_cfg.chunk
+        assert_model_path_exists(self.path)
+
+        self.files = sorted(
+            os.path.join(self.path, f)
+            for f in os.listdir(self.path)
+            if f.lower().endswith(".wav")
+        )
+        if not self.files:
+            raise FileNotFoundError(f"No .wav files found in {self.path}")
+
+    def blocks(self) -> Iterator[np.ndarray]:
+        for path in self.files:
+            print(f"📂 Replaying {path}")
+            yield from wav_blocks(path, self.rate, self.block_frames)
@@ -0,0 +1,40 @@
+# src/rachel/clients/audio/loader.py
+
+from rachel.core.config import get_config
+
+
+def _lazy_import_mic():
+    from .microphone import MicrophoneSource
+    return MicrophoneSource
+
+def _lazy_import_wav():
+    from .wav_file import WavFileSource
+    return WavFileSource
+
+def _lazy_import_stdin():
+    from .stdin_pcm import StdinPcmSource
+    return StdinPcmSource
+
+def _lazy_import_dir():
+    from .directory import DirectorySource
+    return DirectorySource
+
+
+AUDIO_SOURCE_MAP = {
+    "mic": _lazy_import_mic,
+    "wav": _lazy_import_wav,
+    "stdin": _lazy_import_stdin,
+    "dir": _lazy_import_dir,
+}
+
+
+def get_audio_source():
+    source_name = get_config().audio.source
+    try:
+        SourceClass = AUDIO_SOURCE_MAP[source_name]()
+        return SourceClass()
+    except KeyError:
+        raise ValueError(
+            f"❌ Unknown audio source: '{source_name}'. "
+            f"Valid options: {list(AUDIO_SOURCE_MAP.keys())}"
+        )
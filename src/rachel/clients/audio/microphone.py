@@ -0,0 +1,49 @@
+# src/rachel/clients/audio/microphone.py
+
+from typing import Callable, Optional
+import numpy as np
+import pyaudio
+
+from rachel.core.config import get_config
+from rachel.utils.audio import downmix_int16
+from rachel.utils.print_out import print_audio_device_list
+from .base import AudioSource, AudioSink
+
+
+class MicrophoneSource(AudioSource):
+    live = True
+
+    def __init__(self):
+        self.pa = pyaudio.PyAudio()
+        self.stream = None
+        print_audio_device_list(self.pa)
+
+    def start(self, sink: AudioSink, on_end: Optional[Callable[[], None]] = None):
+        audio_cfg = get_config().audio
+
+        # Note: runs on the PortAudio thread; keep it to a copy into the sink
+        def on_audio(in_data, frame_count, time_info, status):
+            sink(downmix_int16(np.frombuffer(in_data, dtype=np.int16), audio_cfg.channels))
+            return None, pyaudio.paContinue
+
+        try:
+            self.stream = self.pa.open(
+                format=pyaudio.paInt16,
+                channels=audio_cfg.channels,
+                rate=audio_cfg.rate,
+                input=True,
+                frames_per_buffer=audio_cfg.chunk,
+                stream_callback=on_audio,
+            )
+        except Exception:
+            self.pa.terminate()
+            raise
+
+        self.stream.start_stream()
+
+    def stop(self):
+        if self.stream is not None:
+            self.stream.stop_stream()
+            self.stream.close()
+            self.stream = None
+        self.pa.terminate()
@@ -0,0 +1,37 @@
+# src/rachel/clients/audio/stdin_pcm.py
+
+import sys
+from typing import Iterator
+import numpy as np
+
+from rachel.core.config import get_config
+from rachel.utils.audio import downmix_int16
+from .base import ReplayAudioSource
+
+
+class StdinPcmSource(ReplayAudioSource):
+    """
+    Raw signed 16-bit little-endian PCM on stdin at `audio.rate` / `audio.channels`, e.g.:
+        ffmpeg -i show.mp3 -f s16le -ar 16000 -ac 1 - | start --source stdin --speed 0
+    """
+
+    def __init__(self):
+        super().__init__()
+        audio_cfg = get_config().audio
+        self.channels = audio_cfg.channels
+        self.block_bytes = audio_cfg.chunk * audio_cfg.channels * 2
+
+    def blocks(self) -> Iterator[np.ndarray]:
+        stream = sys.stdin.buffer
+        pending = b""
+        while True:
+            data = stream.read(self.block_bytes)
+            if not data:
+                break
+
+            # Note: pipes can return partial frames; carry the remainder forward
+            data = pending + data
+            usable = len(data) - len(data) % (2 * self.channels)
+            pending = data[usable:]
+            if usable:
+                yield downmix_int16(np.frombuffer(data[:usable], dtype=np.int16), self.channels)
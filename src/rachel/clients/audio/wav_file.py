@@ -0,0 +1,50 @@
+# src/rachel/clients/audio/wav_file.py
+
+import wave
+from typing import Iterator
+import numpy as np
+
+from rachel.core.config import get_config
+from rachel.utils.audio import downmix_int16
+from rachel.utils.file_system import assert_model_path_exists
+from .base import ReplayAudioSource
+
+
+def resample_int16(samples: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
+    """Linear-interpolation resample; good enough for speech going into Whisper."""
+    if src_rate == dst_rate or samples.size == 0:
+        return samples
+    n_out = int(round(samples.size * dst_rate / src_rate))
+    positions = np.linspace(0, samples.size - 1, n_out)
+    return np.interp(positions, np.arange(samples.size), samples).astype(np.int16)
+
+
+def wav_blocks(path: str, rate: int, block_frames: int) -> Iterator[np.ndarray]:
+    """Yield mono int16 blocks at `rate` from a 16-bit PCM WAV file."""
+    with wave.open(path, "rb") as wf:
+        if wf.getsampwidth() != 2:
+            raise ValueError(f"Only 16-bit PCM WAV is supported, got {wf.getsampwidth() * 8}-bit: {path}")
+
+        channels = wf.getnchannels()
+        src_rate = wf.getframerate()
+        if src_rate != rate:
+            print(f"⚠️ Resampling {path} from {src_rate} Hz to {rate} Hz")
+
+        while True:
+            data = wf.readframes(block_frames)
+            if not data:
+                break
+            samples = downmix_int16(np.frombuffer(data, dtype=np.int16), channels)
+            yield resample_int16(samples, src_rate, rate)
+
+
+class WavFileSource(ReplayAudioSource):
+    def __init__(self):
+        super().__init__()
+        audio_cfg = get_config().audio
+        self.path = audio_cfg.source_path
+        self.block_frames = audio_cfg.chunk
+        assert_model_path_exists(self.path)
+
+    def blocks(self) -> Iterator[np.ndarray]:
+        yield from wav_blocks(self.path, self.rate, self.block_frames)
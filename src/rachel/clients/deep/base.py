@@ -1,5 +1,6 @@
 # src/rachel/clients/deep/base.py
 
+import asyncio
 from abc import ABC, abstractmethod
 
 class DeepLLMClient(ABC):
@@ -7,3 +8,7 @@ class DeepLLMClient(ABC):
     def send(self, prompt: str) -> str:
         """Send a prompt to the deep LLM and return the response string."""
         pass
+
+    async def send_async(self, prompt: str) -> str:
+        """Awaitable `send`; clients with a native async API override this."""
+        return await asyncio.to_thread(self.send, prompt)
@@ -1,4 +1,5 @@
 
+import threading
 from rachel.core.config import get_config
 
 cfg = get_config()
@@ -11,12 +12,21 @@ DEEP_BACKEND_MAP = {
     "openai": _lazy_import_openai,
 }
 
+_deep_llm = None
+_deep_llm_lock = threading.Lock()
+
 def get_deep_llm():
-    try:
-        BackendClass = DEEP_BACKEND_MAP[cfg.model.deep_LLM.client]()
-        return BackendClass()
-    except KeyError:
-        raise ValueError(
-            f"❌ Unknown deep backend: '{cfg.model.deep_LLM.client}'. "
-            f"Valid options: {list(DEEP_BACKEND_MAP.keys())}"
-        )
+    """Shared deep client (one connection pool for the deep engine and the search endpoints)."""
+    global _deep_llm
+    with _deep_llm_lock:
+        if _deep_llm is not None:
+            return _deep_llm
+        try:
+            BackendClass = DEEP_BACKEND_MAP[cfg.model.deep_LLM.client]()
+        except KeyError:
+            raise ValueError(
+                f"❌ Unknown deep backend: '{cfg.model.deep_LLM.client}'. "
+                f"Valid options: {list(DEEP_BACKEND_MAP.keys())}"
+            )
+        _deep_llm = BackendClass()
+        return _deep_llm
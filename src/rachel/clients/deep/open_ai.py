@@ -1,31 +1,132 @@
+import asyncio
+import threading
 import time
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, OpenAI
 from rachel.core.config import get_config
 from rachel.clients.deep.base import DeepLLMClient
-from rachel.utils.metrics import record_metrics
+from rachel.utils.metrics import increment, record_metrics
+
+
+def _count_trace(event_name: str):
+    """httpcore trace events -> connection counters (requests - new_connections = reused)."""
+    if event_name.endswith("send_request_headers.started"):
+        increment("deep_http.requests")
+    elif event_name == "connection.connect_tcp.complete":
+        increment("deep_http.new_connections")
+    elif event_name == "connection.start_tls.complete":
+        increment("deep_http.tls_handshakes")
+
+
+def _trace(event_name: str, info: dict):
+    _count_trace(event_name)
+
+
+async def _trace_async(event_name: str, info: dict):
+    _count_trace(event_name)
+
+
+def _attach_trace(request: httpx.Request):
+    request.extensions["trace"] = _trace
+
+
+async def _attach_trace_async(request: httpx.Request):
+    request.extensions["trace"] = _trace_async
+
 
 class OpenAIDeepClient(DeepLLMClient):
+    """
+    Long-lived OpenAI clients over keep-alive httpx pools. The sync client is shared by
+    every thread; async clients are created per event loop (the API server and the deep
+    engine each run their own), since an httpx async pool is bound to the loop that opened it.
+    """
 
-    def send(self, prompt: str) -> str:
+    def __init__(self):
         cfg = get_config()
+        deep_cfg = cfg.model.deep_LLM
 
-        if not cfg.deep_api_key:
-            raise RuntimeError("❌ Missing deep_api_key — check your config.yaml or get_config() logic")
+        self._api_key = cfg.deep_api_key
+        self._limits = httpx.Limits(
+            max_connections=deep_cfg.max_connections,
+            max_keepalive_connections=deep_cfg.max_keepalive_connections,
+            keepalive_expiry=deep_cfg.keepalive_expiry,
+        )
+        self._timeout = httpx.Timeout(deep_cfg.request_timeout, connect=deep_cfg.connect_timeout)
+        self._max_retries = deep_cfg.max_retries
 
-        client = OpenAI(api_key=cfg.deep_api_key)
+        self._client = None
+        self._async_clients: dict[int, AsyncOpenAI] = {}
+        self._lock = threading.Lock()
 
-        start = time.time()
-        response = client.chat.completions.create(
-            model=cfg.model.deep_LLM.name,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.4,
+        print(
+            f"🔌 OpenAI deep client: pool={deep_cfg.max_connections} keepalive={deep_cfg.max_keepalive_connections} "
+            f"timeout={deep_cfg.request_timeout}s (connect {deep_cfg.connect_timeout}s)"
         )
+
+    def _check_key(self):
+        if not self._api_key:
+            raise RuntimeError("❌ Missing deep_api_key — check your config.yaml or get_config() logic")
+
+    def _sync_client(self) -> OpenAI:
+        with self._lock:
+            if self._client is None:
+                self._check_key()
+                self._client = OpenAI(
+                    api_key=self._api_key,
+                    max_retries=self._max_retries,
+                    http_client=httpx.Client(
+                        limits=self._limits,
+                        timeout=self._timeout,
+                        event_hooks={"request": [_attach_trace]},
+                    ),
+                )
+        return self._client
+
+    def _async_client(self) -> AsyncOpenAI:
+        loop_id = id(asyncio.get_running_loop())
+        with self._lock:
+            client = self._async_clients.get(loop_id)
+            if client is None:
+                self._check_key()
+                client = AsyncOpenAI(
+                    api_key=self._api_key,
+                    max_retries=self._max_retries,
+                    http_client=httpx.AsyncClient(
+                        limits=self._limits,
+                        timeout=self._timeout,
+                        event_hooks={"request": [_attach_trace_async]},
+                    ),
+                )
+                self._async_clients[loop_id] = client
+        return client
+
+    @staticmethod
+    def _request(prompt: str) -> dict:
+        return {
+            "model": get_config().model.deep_LLM.name,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": 0.4,
+        }
+
+    @staticmethod
+    def _finish(prompt: str, response, start: float) -> str:
+        name = get_config().model.deep_LLM.name
         duration = time.time() - start
 
         # Estimate token count (OpenAI client may provide better tools for this, but we assume worst-case)
         token_count = len(prompt.split()) + 512  # crude est: input + expected output
 
-        record_metrics(f"Deep: OpenAI/{cfg.model.deep_LLM.name}", start, tokens=token_count)
+        record_metrics(f"Deep: OpenAI/{name}", start, tokens=token_count)
         print(f"🧠 OpenAI response time: {duration:.2f}s")
 
         return response.choices[0].message.content
+
+    def send(self, prompt: str) -> str:
+        start = time.time()
+        response = self._sync_client().chat.completions.create(**self._request(prompt))
+        return self._finish(prompt, response, start)
+
+    async def send_async(self, prompt: str) -> str:
+        start = time.time()
+        response = await self._async_client().chat.completions.create(**self._request(prompt))
+        return self._finish(prompt, response, start)
@@ -1,6 +1,7 @@
 # src/rachel/clients/semantic/base.py
 
 from abc import ABC, abstractmethod
+from typing import List
 import numpy as np
 
 class SemanticEmbeddingClient(ABC):
@@ -8,3 +9,7 @@ class SemanticEmbeddingClient(ABC):
     def embed(self, text: str) -> np.ndarray:
         """Return a normalized embedding vector for the given text."""
         pass
+
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        """Return a (len(texts), dim) matrix of normalized embeddings. Default: one call each."""
+        return np.stack([self.embed(text) for text in texts])
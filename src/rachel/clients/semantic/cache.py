@@ -0,0 +1,52 @@
+# src/rachel/clients/semantic/cache.py
+
+from typing import Dict, List
+import numpy as np
+
+from rachel.utils.cache import LRUCache
+from rachel.utils.metrics import increment
+from .base import SemanticEmbeddingClient
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+class CachedEmbeddingClient(SemanticEmbeddingClient):
+    """
+    LRU of embeddings keyed by whitespace-normalized text in front of another client.
+    Bounded to `max_entries` vectors; misses in a batch are encoded in one call.
+    """
+
+    def __init__(self, inner: SemanticEmbeddingClient, max_entries: int):
+        self.inner = inner
+        self.cache = LRUCache(max_entries)
+        print(f"🗃️ Embedding cache: {max_entries} entries")
+
+    def embed(self, text: str) -> np.ndarray:
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        keys = [normalize_text(text) for text in texts]
+        found: Dict[str, np.ndarray] = {}
+        missing: List[str] = []
+
+        # Note: duplicates inside one batch are looked up and encoded once
+        for key in dict.fromkeys(keys):
+            vec = self.cache.get(key)
+            if vec is None:
+                missing.append(key)
+            else:
+                found[key] = vec
+
+        increment("embedding_cache.hit", len(found))
+        increment("embedding_cache.miss", len(missing))
+
+        if missing:
+            for key, vec in zip(missing, self.inner.embed_batch(missing)):
+                vec = np.asarray(vec, dtype=np.float32)
+                vec.setflags(write=False)
+                self.cache.put(key, vec)
+                found[key] = vec
+
+        return np.stack([found[key] for key in keys])
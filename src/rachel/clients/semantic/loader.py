@@ -8,18 +8,30 @@ def _lazy_import_sentence():
     return SentenceTransformerClient
 
 
+def _lazy_import_onnx():
+    from .onnx_minilm import OnnxMiniLMClient
+    return OnnxMiniLMClient
+
+
 EMBEDDING_CLIENT_MAP = {
     "sentence-transformer": _lazy_import_sentence,
+    "onnx": _lazy_import_onnx,
 }
 
 
 def get_semantic_filter():
-    backend_name = get_config().model.semantic.backend
+    semantic_cfg = get_config().model.semantic
+    backend_name = semantic_cfg.backend
     try:
         ClientClass = EMBEDDING_CLIENT_MAP[backend_name]()
-        return ClientClass()
     except KeyError:
         raise ValueError(
             f"❌ Unknown embedding backend: '{backend_name}'. "
             f"Valid options: {list(EMBEDDING_CLIENT_MAP.keys())}"
         )
+
+    client = ClientClass()
+    if semantic_cfg.cache_size > 0:
+        from .cache import CachedEmbeddingClient
+        client = CachedEmbeddingClient(client, semantic_cfg.cache_size)
+    return client
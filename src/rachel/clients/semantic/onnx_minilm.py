@@ -0,0 +1,117 @@
+# src/rachel/clients/semantic/onnx_minilm.py
+
+import json
+import time
+from pathlib import Path
+from typing import List
+import numpy as np
+
+import onnxruntime as ort
+from huggingface_hub import snapshot_download
+from tokenizers import Tokenizer
+
+from rachel.core.config import get_config
+from rachel.utils.file_system import get_model_subdir_path, assert_model_path_exists
+from rachel.utils.metrics import record_metrics
+from .base import SemanticEmbeddingClient
+
+QUANTIZED_FILE = "model_quantized.onnx"
+FP32_FILE = "onnx/model.onnx"
+TOKENIZER_FILES = ["tokenizer.json", "config.json", "sentence_bert_config.json", "special_tokens_map.json"]
+
+
+class OnnxMiniLMClient(SemanticEmbeddingClient):
+    """
+    Sentence embeddings from an int8 ONNX export of the sentence-transformers model,
+    run with ONNX Runtime and a Rust `tokenizers` tokenizer: no torch at runtime.
+    Pooling matches SentenceTransformer (attention-masked mean, then L2 normalize).
+    """
+
+    def __init__(self):
+        cfg = get_config()
+        semantic_cfg = cfg.model.semantic
+
+        model_path = Path(get_model_subdir_path(
+            cfg.embedded_filter_root,
+            semantic_cfg.backend,
+            semantic_cfg.name
+        ))
+
+        onnx_file = model_path / semantic_cfg.onnx_file
+        if not onnx_file.exists():
+            print(f"📦 Downloading {semantic_cfg.onnx_file} + tokenizer from {semantic_cfg.repo} → {model_path}")
+            snapshot_download(
+                repo_id=semantic_cfg.repo,
+                local_dir=model_path,
+                local_dir_use_symlinks=False,
+                allow_patterns=TOKENIZER_FILES + [semantic_cfg.onnx_file],
+            )
+
+        # Note: repos without a pre-quantized export get their fp32 graph quantized here, once
+        if not onnx_file.exists():
+            onnx_file = model_path / QUANTIZED_FILE
+            if not onnx_file.exists():
+                self._quantize(semantic_cfg.repo, model_path)
+
+        assert_model_path_exists(onnx_file)
+
+        t0 = time.time()
+        print(f"✅ Loading ONNX embedding model from: {onnx_file}")
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if semantic_cfg.onnx_threads > 0:
+            options.intra_op_num_threads = semantic_cfg.onnx_threads
+        self.session = ort.InferenceSession(str(onnx_file), options, providers=["CPUExecutionProvider"])
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+        self.tokenizer = Tokenizer.from_file(str(model_path / "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=self._max_seq_length(model_path))
+        self.tokenizer.enable_padding()
+        record_metrics("Semantic: onnx (load)", t0)
+
+    @staticmethod
+    def _max_seq_length(model_path: Path) -> int:
+        """Use the sentence-transformers truncation length (256 for all-MiniLM), not the model's 512."""
+        try:
+            with open(model_path / "sentence_bert_config.json") as f:
+                return int(json.load(f)["max_seq_length"])
+        except (FileNotFoundError, KeyError, ValueError):
+            return 256
+
+    @staticmethod
+    def _quantize(repo: str, model_path: Path):
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        print(f"📦 Downloading {FP32_FILE} from {repo}")
+        snapshot_download(
+            repo_id=repo,
+            local_dir=model_path,
+            local_dir_use_symlinks=False,
+            allow_patterns=[FP32_FILE],
+        )
+        assert_model_path_exists(model_path / FP32_FILE)
+
+        print(f"🗜️ Quantizing embedding model to int8: {model_path / QUANTIZED_FILE}")
+        quantize_dynamic(
+            str(model_path / FP32_FILE),
+            str(model_path / QUANTIZED_FILE),
+            weight_type=QuantType.QUInt8,
+        )
+
+    def embed(self, text: str) -> np.ndarray:
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self.input_names:
+            feeds["token_type_ids"] = np.array([e.type_ids for e in encodings], dtype=np.int64)
+
+        hidden = self.session.run(None, feeds)[0]
+
+        mask = attention_mask[..., None].astype(np.float32)
+        pooled = (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+        return (pooled / np.maximum(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12)).astype(np.float32)
@@ -3,6 +3,7 @@
 from sentence_transformers import SentenceTransformer
 from huggingface_hub import snapshot_download
 from pathlib import Path
+from typing import List
 import numpy as np
 
 from rachel.core.config import get_config
@@ -36,3 +37,6 @@ class SentenceTransformerClient(SemanticEmbeddingClient):
 
     def embed(self, text: str) -> np.ndarray:
         return self.model.encode(text, normalize_embeddings=True)
+
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        return self.model.encode(texts, normalize_embeddings=True, convert_to_numpy=True)
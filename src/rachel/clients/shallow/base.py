@@ -1,7 +1,20 @@
 # clients/shallow/clients/base.py
 from abc import ABC, abstractmethod
+from typing import List
 
 class ShallowLLMClient(ABC):
     @abstractmethod
     def generate(self, prompt: str, **kwargs) -> str:
-        pass
\ No newline at end of file
+        pass
+
+    def warm_prefix(self, prefix: str):
+        """Precompute state for a prompt prefix shared by every call. Default: no caching."""
+        pass
+
+    def generate_batch(self, prompts: List[str], **kwargs) -> List[str]:
+        """Generate for several prompts at once (outputs in prompt order). Default: one call each."""
+        return [self.generate(prompt, **kwargs) for prompt in prompts]
+
+    def close(self):
+        """Release backend resources (worker processes etc.)."""
+        pass
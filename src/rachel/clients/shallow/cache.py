@@ -0,0 +1,215 @@
+# src/rachel/clients/shallow/cache.py
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional
+
+from rachel.core.config import get_config
+from rachel.clients.shallow.base import ShallowLLMClient
+from rachel.utils.cache import LRUCache
+from rachel.utils.common import debug
+from rachel.utils.metrics import increment
+
+
+def normalize_prompt(prompt: str) -> str:
+    return " ".join(prompt.split())
+
+
+def shallow_cache_key(prompt: str) -> str:
+    """sha256 over the normalized prompt plus everything that changes what the model returns."""
+    shallow_cfg = get_config().model.shallow_LLM
+    material = {
+        "prompt": normalize_prompt(prompt),
+        "repo": shallow_cfg.repo,
+        "name": shallow_cfg.name,
+        "adapter": shallow_cfg.adapter,
+        "adapter_type": shallow_cfg.adapter_type,
+        "backend": shallow_cfg.backend,
+        "max_tokens": shallow_cfg.max_tokens,
+        "do_sample": shallow_cfg.do_sample,
+        "temperature": shallow_cfg.temperature,
+        "top_p": shallow_cfg.top_p,
+        "top_k": shallow_cfg.top_k,
+        "repetition_penalty": shallow_cfg.repetition_penalty,
+        "constrained_output": shallow_cfg.constrained_output,
+    }
+    return hashlib.sha256(json.dumps(material, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class ShallowDiskCache:
+    """
+    One JSON file per entry under `root`, bounded to `max_entries` (oldest written are
+    evicted first) with entries expiring `ttl_seconds` after they were written. The
+    directory is indexed once at startup, dropping expired entries and stray temp files,
+    so misses never touch the disk and the sweep on each write only looks at the front.
+    """
+
+    def __init__(self, root: Path, max_entries: int, ttl_seconds: Optional[float] = None):
+        self.root = root
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._index: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def _load_index(self):
+        entries = []
+        for path in self.root.glob("*/*"):
+            if path.suffix == ".tmp":
+                path.unlink(missing_ok=True)
+            elif path.suffix == ".json":
+                try:
+                    entries.append((path.stat().st_mtime, path.stem))
+                except FileNotFoundError:
+                    pass
+
+        # Note: entries are written once (write-then-rename), so mtime is the creation time
+        for stored_at, key in sorted(entries):
+            self._index[key] = stored_at
+
+        with self._lock:
+            removed = self._prune()
+        print(f"🗃️ Shallow disk cache: {len(self._index)} entries in {self.root} (pruned {removed})")
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - stored_at > self.ttl_seconds
+
+    def _prune(self) -> int:
+        """Drop expired entries and trim to max_entries; caller holds the lock."""
+        now = time.time()
+        removed = 0
+        while self._index:
+            key, stored_at = next(iter(self._index.items()))
+            if len(self._index) <= self.max_entries and not self._expired(stored_at, now):
+                break
+            del self._index[key]
+            self._path(key).unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            stored_at = self._index.get(key)
+            if stored_at is None:
+                return None
+            if self._expired(stored_at, time.time()):
+                del self._index[key]
+                self._path(key).unlink(missing_ok=True)
+                return None
+
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f).get("output")
+        except (FileNotFoundError, json.JSONDecodeError):
+            with self._lock:
+                self._index.pop(key, None)
+            return None
+
+    def put(self, key: str, output: str):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Note: write-then-rename so a crash never leaves a truncated entry behind
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        stored_at = time.time()
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"output": output, "created_at": stored_at}, f)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._index.pop(key, None)
+            self._index[key] = stored_at
+            self._prune()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+class CachedShallowLLMClient(ShallowLLMClient):
+    """
+    Content-hash result cache in front of another shallow client: an in-memory LRU,
+    optionally backed by one JSON file per entry under `<shallow_root>/cache`.
+    """
+
+    def __init__(self, inner: ShallowLLMClient, memory: Optional[LRUCache] = None, disk: Optional[ShallowDiskCache] = None):
+        cfg = get_config()
+        shallow_cfg = cfg.model.shallow_LLM
+
+        self.inner = inner
+        self.memory = memory
+        if self.memory is None and shallow_cfg.cache_size > 0:
+            self.memory = LRUCache(shallow_cfg.cache_size, shallow_cfg.cache_ttl)
+        self.disk = disk
+        if self.disk is None and shallow_cfg.disk_cache:
+            self.disk = ShallowDiskCache(
+                Path(cfg.shallow_root) / "cache", shallow_cfg.disk_cache_max_entries, shallow_cfg.cache_ttl
+            )
+
+        print(
+            f"🗃️ Shallow result cache: memory={shallow_cfg.cache_size} ttl={shallow_cfg.cache_ttl} "
+            f"disk={self.disk.root if self.disk is not None else None}"
+        )
+
+    def warm_prefix(self, prefix: str):
+        self.inner.warm_prefix(prefix)
+
+    def close(self):
+        self.inner.close()
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        key = shallow_cache_key(prompt)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        output = self.inner.generate(prompt, **kwargs)
+        self._store(key, output)
+        return output
+
+    def generate_batch(self, prompts: List[str], **kwargs) -> List[str]:
+        keys = [shallow_cache_key(prompt) for prompt in prompts]
+        outputs = [self._lookup(key) for key in keys]
+
+        # Note: only the misses go to the model, still as one batch
+        missing = [i for i, output in enumerate(outputs) if output is None]
+        if missing:
+            generated = self.inner.generate_batch([prompts[i] for i in missing], **kwargs)
+            for i, output in zip(missing, generated):
+                outputs[i] = output
+                self._store(keys[i], output)
+
+        return outputs
+
+    def stats(self) -> dict:
+        return self.memory.stats() if self.memory is not None else {}
+
+    def _lookup(self, key: str) -> Optional[str]:
+        output = self.memory.get(key) if self.memory is not None else None
+        if output is None and self.disk is not None:
+            output = self.disk.get(key)
+            if output is not None and self.memory is not None:
+                self.memory.put(key, output)
+
+        if output is None:
+            increment("shallow_cache.miss")
+            return None
+
+        increment("shallow_cache.hit")
+        debug(f"@CachedShallowLLMClient: cache hit {key[:12]}")
+        return output
+
+    def _store(self, key: str, output: str):
+        if self.memory is not None:
+            self.memory.put(key, output)
+        if self.disk is not None:
+            self.disk.put(key, output)
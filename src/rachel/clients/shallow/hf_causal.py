@@ -1,6 +1,8 @@
+import copy
 import time
+from typing import List, Optional
 import torch
-from transformers import AutoModelForCausalLM, AutoTokenizer, pipeline
+from transformers import AutoModelForCausalLM, AutoTokenizer, DynamicCache, pipeline
 from huggingface_hub import snapshot_download
 from peft import PeftModel
 from pathlib import Path
@@ -11,6 +13,7 @@ from rachel.utils.file_system import get_model_subdir_path, assert_model_path_ex
 from rachel.utils.metrics import record_metrics
 from rachel.utils.common import debug
 from rachel.clients.shallow.base import ShallowLLMClient
+from rachel.clients.shallow.hf_grammar import HfShallowGrammar
 
 
 class HuggingFaceCausalClient(ShallowLLMClient):
@@ -69,6 +72,11 @@ class HuggingFaceCausalClient(ShallowLLMClient):
 
         self.model = base_model
 
+        # Note: batched generation pads on the left so every row continues from its own last token
+        self.tokenizer.padding_side = "left"
+        if self.tokenizer.pad_token is None:
+            self.tokenizer.pad_token = self.tokenizer.eos_token
+
         self.pipeline = pipeline(
             "text-generation",
             model=self.model,
@@ -77,10 +85,100 @@ class HuggingFaceCausalClient(ShallowLLMClient):
             return_full_text=False,
         )
 
-    def generate(self, prompt: str, **kwargs) -> str:
+        self._prefix_ids: Optional[torch.Tensor] = None
+        self._prefix_cache: Optional[DynamicCache] = None
+
+        self.draft_model = None
+        if shallow_cfg.draft_repo:
+            self.draft_model = self._load_draft_model(cfg, torch_dtype)
+
+        self.grammar = None
+        if shallow_cfg.constrained_output:
+            print("🧩 Building constrained-output token tables")
+            self.grammar = HfShallowGrammar(self.tokenizer)
+
+    def _load_draft_model(self, cfg, torch_dtype):
+        """Small model sharing the main tokenizer, used to propose tokens for assisted generation."""
+        shallow_cfg = cfg.model.shallow_LLM
+        draft_dir = get_model_subdir_path(
+            cfg.shallow_root,
+            shallow_cfg.backend,
+            shallow_cfg.draft_repo.split("/")[-1].replace(".", "_").replace("-", "_")
+        )
+
+        print(f"📦 Loading or syncing draft model from: {shallow_cfg.draft_repo} to: {draft_dir}")
+        draft_path = snapshot_download(
+            repo_id=shallow_cfg.draft_repo,
+            use_auth_token=cfg.hf_token,
+            local_dir=draft_dir,
+            local_dir_use_symlinks=False,
+        )
+
+        draft_model = AutoModelForCausalLM.from_pretrained(
+            draft_path,
+            torch_dtype=torch_dtype,
+            trust_remote_code=shallow_cfg.trust_remote_code,
+        ).to(self.model.device)
+        draft_model.eval()
+
+        # Note: assisted generation compares token ids directly, so the vocabularies must line up
+        main_vocab = self.model.get_output_embeddings().weight.shape[0]
+        draft_vocab = draft_model.get_output_embeddings().weight.shape[0]
+        if main_vocab != draft_vocab:
+            raise ValueError(
+                f"❌ Draft model {shallow_cfg.draft_repo} has vocab size {draft_vocab}, "
+                f"main model has {main_vocab}; the draft must share the main tokenizer."
+            )
+
+        # One call to lm_head per forward pass: counts verification passes and proposed tokens
+        self._forward_calls = {"main": 0, "draft": 0}
+        self.model.get_output_embeddings().register_forward_hook(lambda *_: self._count_forward("main"))
+        draft_model.get_output_embeddings().register_forward_hook(lambda *_: self._count_forward("draft"))
+        return draft_model
+
+    def _count_forward(self, which: str):
+        self._forward_calls[which] += 1
+
+    def _generate_assisted(self, prompt: str) -> str:
+        """Greedy-equivalent assisted generation: the draft proposes, the main model verifies."""
         shallow_cfg = get_config().model.shallow_LLM
         t0 = time.time()
 
+        inputs = self.tokenizer(prompt, return_tensors="pt").to(self.model.device)
+        self._forward_calls = {"main": 0, "draft": 0}
+        with torch.no_grad():
+            output_ids = self.model.generate(
+                **inputs,
+                **self._generation_kwargs(),
+                assistant_model=self.draft_model,
+                pad_token_id=self.tokenizer.pad_token_id,
+            )
+
+        new_tokens = output_ids[0, inputs["input_ids"].shape[1]:]
+        text = self.tokenizer.decode(new_tokens, skip_special_tokens=True)
+
+        # Each verification pass contributes one token of its own; the rest were accepted drafts
+        generated = len(new_tokens)
+        proposed = self._forward_calls["draft"]
+        accepted = max(0, generated - self._forward_calls["main"])
+        elapsed = max(time.time() - t0, 1e-6)
+        record_metrics(
+            f'Shallow: {shallow_cfg.backend} (assisted)',
+            t0,
+            tokens=inputs["input_ids"].shape[1] + generated,
+            extra={
+                "draft_proposed": proposed,
+                "draft_accepted": accepted,
+                "acceptance": f"{accepted / proposed:.0%}" if proposed else "n/a",
+                "tok/s": f"{generated / elapsed:.1f}",
+            },
+        )
+        debug("@HuggingFaceCausalClient: RAW OUTPUT:\n", text)
+        return text
+
+    def _generation_kwargs(self) -> dict:
+        shallow_cfg = get_config().model.shallow_LLM
+
         generation_kwargs = {
             "max_new_tokens": shallow_cfg.max_tokens,
             "do_sample": shallow_cfg.do_sample,
@@ -92,9 +190,128 @@ class HuggingFaceCausalClient(ShallowLLMClient):
             generation_kwargs["top_k"] = shallow_cfg.top_k
             generation_kwargs["top_p"] = shallow_cfg.top_p
 
-        output = self.pipeline(prompt, **generation_kwargs)
+        # Note: grammar state is per generation, so every call gets a fresh constraint
+        if self.grammar is not None:
+            generation_kwargs.update(self.grammar.constraint().processors())
+
+        return generation_kwargs
+
+    def warm_prefix(self, prefix: str):
+        """Run the shared prompt prefix through the model once and keep its KV cache."""
+        shallow_cfg = get_config().model.shallow_LLM
+        if self.draft_model is not None:
+            print("ℹ️ Prefix cache skipped: assisted generation keeps its own draft/main caches")
+            return
+
+        t0 = time.time()
+
+        prefix_ids = self.tokenizer(prefix, return_tensors="pt")["input_ids"].to(self.model.device)
+        with torch.no_grad():
+            out = self.model(input_ids=prefix_ids, past_key_values=DynamicCache(), use_cache=True)
+
+        self._prefix_ids = prefix_ids[0]
+        self._prefix_cache = out.past_key_values
+        record_metrics(f'Shallow: {shallow_cfg.backend} (prefix warm)', t0, tokens=len(self._prefix_ids))
+
+    def _prefixed_ids(self, prompt: str) -> Optional[torch.Tensor]:
+        """Token ids for `prompt` if they start with the cached prefix, else None."""
+        if self._prefix_cache is None:
+            return None
+
+        ids = self.tokenizer(prompt, return_tensors="pt")["input_ids"][0].to(self.model.device)
+        n = len(self._prefix_ids)
+
+        # Note: a merge across the prefix/tail boundary changes the prefix tokens; fall back to a full prefill
+        if len(ids) <= n or not torch.equal(ids[:n], self._prefix_ids):
+            return None
+        return ids
+
+    def _generate_from_prefix(self, rows: List[torch.Tensor]) -> torch.Tensor:
+        """
+        Generate from the cached prefix for one or more prompts. The prefix stays at
+        positions [0, n) in every row so one cache fits them all; tails are padded on the
+        left of the tail region and masked out. Returns only the new tokens.
+        """
+        n = len(self._prefix_ids)
+        width = max(len(row) for row in rows)
+        pad_id = self.tokenizer.pad_token_id
+
+        input_ids = torch.full((len(rows), width), pad_id, dtype=torch.long, device=self.model.device)
+        attention_mask = torch.zeros_like(input_ids)
+        for i, row in enumerate(rows):
+            tail_start = n + width - len(row)
+            input_ids[i, :n] = row[:n]
+            input_ids[i, tail_start:] = row[n:]
+            attention_mask[i, :n] = 1
+            attention_mask[i, tail_start:] = 1
+
+        cache = copy.deepcopy(self._prefix_cache)
+        if len(rows) > 1:
+            cache.batch_repeat_interleave(len(rows))
+
+        with torch.no_grad():
+            output_ids = self.model.generate(
+                input_ids=input_ids,
+                attention_mask=attention_mask,
+                past_key_values=cache,
+                **self._generation_kwargs(),
+                pad_token_id=pad_id,
+            )
+        return output_ids[:, width:]
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        shallow_cfg = get_config().model.shallow_LLM
+        t0 = time.time()
+
+        if self.draft_model is not None:
+            return self._generate_assisted(prompt)
+
+        ids = self._prefixed_ids(prompt)
+        if ids is not None:
+            new_tokens = self._generate_from_prefix([ids])
+            text = self.tokenizer.decode(new_tokens[0], skip_special_tokens=True)
+            token_count = len(ids) - len(self._prefix_ids) + new_tokens.shape[1]
+            record_metrics(f'Shallow: {shallow_cfg.backend} (prefix cached)', t0, tokens=token_count)
+            debug("@HuggingFaceCausalClient: RAW OUTPUT:\n", text)
+            return text
+
+        output = self.pipeline(prompt, **self._generation_kwargs())
 
         token_count = len(self.tokenizer(prompt)["input_ids"]) + shallow_cfg.max_tokens
         record_metrics(f'Shallow: {shallow_cfg.backend}', t0, tokens=token_count)
         debug("@HuggingFaceCausalClient: RAW OUTPUT:\n", output[0]["generated_text"])
         return output[0]["generated_text"]
+
+    def generate_batch(self, prompts: List[str], **kwargs) -> List[str]:
+        """Left-padded batched generation: one forward pass per step for the whole batch."""
+        # Note: assisted generation only supports one sequence at a time
+        if len(prompts) == 1 or self.draft_model is not None:
+            return [self.generate(prompt, **kwargs) for prompt in prompts]
+
+        shallow_cfg = get_config().model.shallow_LLM
+        t0 = time.time()
+
+        rows = [self._prefixed_ids(prompt) for prompt in prompts]
+        if all(row is not None for row in rows):
+            new_tokens = self._generate_from_prefix(rows)
+            outputs = self.tokenizer.batch_decode(new_tokens, skip_special_tokens=True)
+            token_count = sum(len(row) - len(self._prefix_ids) for row in rows) + new_tokens.numel()
+            record_metrics(f'Shallow: {shallow_cfg.backend} (batched, prefix cached)', t0, segment_count=len(prompts), tokens=token_count)
+            debug("@HuggingFaceCausalClient: RAW BATCH OUTPUT:\n", outputs)
+            return outputs
+
+        inputs = self.tokenizer(prompts, return_tensors="pt", padding=True).to(self.model.device)
+        with torch.no_grad():
+            output_ids = self.model.generate(
+                **inputs,
+                **self._generation_kwargs(),
+                pad_token_id=self.tokenizer.pad_token_id,
+            )
+
+        new_tokens = output_ids[:, inputs["input_ids"].shape[1]:]
+        outputs = self.tokenizer.batch_decode(new_tokens, skip_special_tokens=True)
+
+        token_count = int(inputs["attention_mask"].sum()) + new_tokens.numel()
+        record_metrics(f'Shallow: {shallow_cfg.backend} (batched)', t0, segment_count=len(prompts), tokens=token_count)
+        debug("@HuggingFaceCausalClient: RAW BATCH OUTPUT:\n", outputs)
+        return outputs
@@ -0,0 +1,120 @@
+# src/rachel/clients/shallow/hf_grammar.py
+
+from typing import Dict, List, Optional
+import torch
+from transformers import LogitsProcessor, LogitsProcessorList, StoppingCriteria, StoppingCriteriaList
+
+from rachel.utils.shallow_grammar import ShallowGrammarVocab, State, START, DONE
+
+
+def hf_token_texts(tokenizer) -> List[str]:
+    """
+    Surface text of every token id as it reads mid-sequence. Decoding after an anchor
+    token keeps SentencePiece leading spaces; special tokens map to "" (never allowed).
+    """
+    anchor_ids = tokenizer.encode("a", add_special_tokens=False)
+    anchor_text = tokenizer.decode(anchor_ids)
+    special_ids = set(tokenizer.all_special_ids)
+
+    texts = []
+    for token_id in range(len(tokenizer)):
+        if token_id in special_ids:
+            texts.append("")
+            continue
+        texts.append(tokenizer.decode(anchor_ids + [token_id])[len(anchor_text):])
+    return texts
+
+
+class HfShallowGrammar:
+    """Per-client grammar tables: token texts and cached per-state id tensors."""
+
+    def __init__(self, tokenizer):
+        self.vocab = ShallowGrammarVocab(hf_token_texts(tokenizer), [tokenizer.eos_token_id])
+        self._id_tensors: Dict[tuple, torch.Tensor] = {}
+
+    def allowed_ids(self, state: State, device) -> torch.Tensor:
+        key = (state, str(device))
+        ids = self._id_tensors.get(key)
+        if ids is None:
+            ids = torch.tensor(sorted(self.vocab.allowed(state)), dtype=torch.long, device=device)
+            self._id_tensors[key] = ids
+        return ids
+
+    def constraint(self) -> "ShallowGrammarConstraint":
+        return ShallowGrammarConstraint(self)
+
+
+class ShallowGrammarConstraint:
+    """
+    Per-generation FSM state for every row, shared by the logits processor and stopping
+    criteria. Keeps the state after each generated token so it can rewind when assisted
+    decoding scores draft candidates and then keeps a shorter (or different) continuation.
+    """
+
+    def __init__(self, grammar: HfShallowGrammar):
+        self.grammar = grammar
+        self.states: Optional[List[Optional[State]]] = None
+        self._prompt_len = 0
+        self._tokens: List[List[int]] = []
+        self._history: List[List[Optional[State]]] = []
+
+    def sync(self, input_ids: torch.LongTensor):
+        if self.states is None:
+            # Note: the first call sees only the prompt; generation starts from here
+            self.states = [START] * input_ids.shape[0]
+            self._prompt_len = input_ids.shape[1]
+            self._history = [self.states]
+            return
+
+        generated = input_ids[:, self._prompt_len:].T.tolist()
+
+        # Rewind to the longest prefix we've already seen
+        keep = 0
+        while keep < min(len(generated), len(self._tokens)) and generated[keep] == self._tokens[keep]:
+            keep += 1
+        self._tokens = self._tokens[:keep]
+        self._history = self._history[:keep + 1]
+
+        for column in generated[keep:]:
+            states = [
+                self.grammar.vocab.next_state(state, token_id) if state is not None else None
+                for state, token_id in zip(self._history[-1], column)
+            ]
+            self._tokens.append(column)
+            self._history.append(states)
+
+        self.states = self._history[-1]
+
+    def processors(self) -> dict:
+        return {
+            "logits_processor": LogitsProcessorList([ShallowGrammarLogitsProcessor(self)]),
+            "stopping_criteria": StoppingCriteriaList([ShallowGrammarStoppingCriteria(self)]),
+        }
+
+
+class ShallowGrammarLogitsProcessor(LogitsProcessor):
+    def __init__(self, constraint: ShallowGrammarConstraint):
+        self.constraint = constraint
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor) -> torch.FloatTensor:
+        self.constraint.sync(input_ids)
+
+        mask = torch.full_like(scores, float("-inf"))
+        for i, state in enumerate(self.constraint.states):
+            if state is None:
+                # Note: should be unreachable; leave the row unconstrained rather than emit garbage
+                mask[i] = 0
+                continue
+            mask[i, self.constraint.grammar.allowed_ids(state, scores.device)] = 0
+        return scores + mask
+
+
+class ShallowGrammarStoppingCriteria(StoppingCriteria):
+    """Stops each row as soon as its output closes the SemanticSummary string."""
+
+    def __init__(self, constraint: ShallowGrammarConstraint):
+        self.constraint = constraint
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs) -> torch.BoolTensor:
+        self.constraint.sync(input_ids)
+        return torch.tensor([state == DONE for state in self.constraint.states], device=input_ids.device)
@@ -2,13 +2,15 @@
 
 import os
 import time
-from llama_cpp import Llama
+import numpy as np
+from llama_cpp import Llama, LlamaGrammar
 from huggingface_hub import snapshot_download
 
 from rachel.core.config import get_config
 from rachel.utils.metrics import record_metrics
 from rachel.utils.file_system import get_model_subdir_path, assert_model_path_exists
 from rachel.clients.shallow.base import ShallowLLMClient
+from rachel.utils.shallow_grammar import SHALLOW_OUTPUT_GBNF
 
 
 class LlamaCppClient(ShallowLLMClient):
@@ -39,13 +41,42 @@ class LlamaCppClient(ShallowLLMClient):
         full_model_path = os.path.join(model_path, gguf_files[0])
         print(f"🧠 Loading GGUF model from: {full_model_path}")
 
-        self.llm = Llama(model_path=full_model_path, n_ctx=shallow_cfg.ctx_window_tokens)
+        # Note: several in-process replicas split the cores (weights are mmapped, so memory is shared)
+        workers = cfg.summarization.shallow_workers
+        n_threads = max(1, (os.cpu_count() or 1) // workers) if workers > 1 else None
+
+        self.llm = Llama(model_path=full_model_path, n_ctx=shallow_cfg.ctx_window_tokens, n_threads=n_threads)
+        self._prefix_state = None
+        self._prefix_tokens = None
+        self.grammar = LlamaGrammar.from_string(SHALLOW_OUTPUT_GBNF) if shallow_cfg.constrained_output else None
+
+    def warm_prefix(self, prefix: str):
+        """Evaluate the shared prompt prefix once and snapshot the context state."""
+        shallow_cfg = get_config().model.shallow_LLM
+        t0 = time.time()
+
+        tokens = self.llm.tokenize(prefix.encode("utf-8"))
+        self.llm.reset()
+        self.llm.eval(tokens)
+        self._prefix_state = self.llm.save_state()
+        self._prefix_tokens = np.asarray(tokens, dtype=self.llm.input_ids.dtype)
+        record_metrics(f"{shallow_cfg.backend} (prefix warm)", t0, tokens=len(tokens))
+
+    def _prefix_in_context(self) -> bool:
+        """
+        llama.cpp already reuses the longest token prefix shared with the previous call, so the
+        snapshot is only needed when the last evaluation diverged inside the preamble.
+        """
+        n = len(self._prefix_tokens)
+        return self.llm.n_tokens >= n and np.array_equal(self.llm.input_ids[:n], self._prefix_tokens)
 
     def generate(self, prompt: str, **kwargs) -> str:
         cfg = get_config()
         shallow_cfg = cfg.model.shallow_LLM
 
         t0 = time.time()
-        result = self.llm(prompt, max_tokens=shallow_cfg.max_tokens)
+        if self._prefix_state is not None and not self._prefix_in_context():
+            self.llm.load_state(self._prefix_state)
+        result = self.llm(prompt, max_tokens=shallow_cfg.max_tokens, grammar=self.grammar)
         record_metrics(shallow_cfg.backend, t0, tokens=result["usage"]["total_tokens"])
         return result["choices"][0]["text"]
@@ -11,20 +11,59 @@ def _lazy_import_gguf():
     from .llama_cpp import LlamaCppClient
     return LlamaCppClient
 
+def _lazy_import_onnx():
+    from .onnx_runtime import OnnxRuntimeCausalClient
+    return OnnxRuntimeCausalClient
+
 
 SHALLOW_CLIENT_MAP = {
     "hf-causal": _lazy_import_hf,
     "gguf": _lazy_import_gguf,
+    "onnx": _lazy_import_onnx,
 }
 
 
-def get_shallow_llm():
+def create_shallow_backend():
+    """Build the configured backend client itself (no cache, no worker process)."""
     backend_name = get_config().model.shallow_LLM.backend
     try:
         ClientClass = SHALLOW_CLIENT_MAP[backend_name]()
-        return ClientClass()
     except KeyError:
         raise ValueError(
             f"❌ Unknown shallow LLM backend: '{backend_name}'. "
             f"Valid options: {list(SHALLOW_CLIENT_MAP.keys())}"
         )
+    return ClientClass()
+
+
+def _with_cache(client, memory=None, disk=None):
+    shallow_cfg = get_config().model.shallow_LLM
+    if shallow_cfg.cache_size > 0 or shallow_cfg.disk_cache:
+        from .cache import CachedShallowLLMClient
+        client = CachedShallowLLMClient(client, memory=memory, disk=disk)
+    return client
+
+
+def get_shallow_llm():
+    return _with_cache(create_shallow_backend())
+
+
+def get_shallow_llm_pool(workers: int) -> list:
+    """
+    `workers` independent shallow replicas. llama.cpp releases the GIL and mmaps the
+    GGUF weights, so its replicas live in-process and share pages; torch / ONNX Runtime
+    replicas each get a worker process. All replicas share one result cache.
+    """
+    if workers == 1:
+        return [get_shallow_llm()]
+
+    if get_config().model.shallow_LLM.backend == "gguf":
+        replicas = [create_shallow_backend() for _ in range(workers)]
+    else:
+        from .process import ProcessShallowLLMClient
+        replicas = [ProcessShallowLLMClient(index=i) for i in range(workers)]
+
+    first = _with_cache(replicas[0])
+    memory = getattr(first, "memory", None)
+    disk = getattr(first, "disk", None)
+    return [first] + [_with_cache(replica, memory=memory, disk=disk) for replica in replicas[1:]]
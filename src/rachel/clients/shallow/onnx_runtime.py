@@ -0,0 +1,178 @@
+# clients/shallow/onnx_runtime.py
+
+import json
+import shutil
+import time
+from pathlib import Path
+from typing import List
+
+import torch
+from huggingface_hub import snapshot_download
+from transformers import AutoModelForCausalLM, AutoTokenizer
+from optimum.onnxruntime import ORTModelForCausalLM
+from onnxruntime.quantization import QuantType, quantize_dynamic
+
+from rachel.core.config import get_config
+from rachel.utils.file_system import get_model_subdir_path, assert_model_path_exists
+from rachel.utils.metrics import record_metrics
+from rachel.utils.common import debug
+from rachel.clients.shallow.base import ShallowLLMClient
+from rachel.clients.shallow.hf_grammar import HfShallowGrammar
+
+QUANTIZED_FILE = "model_quantized.onnx"
+EXPORT_MANIFEST = "export.json"
+
+
+def onnx_artifact_name(shallow_cfg) -> str:
+    """One artifact per base repo + adapter combination."""
+    name = shallow_cfg.repo.split("/")[-1]
+    if shallow_cfg.adapter:
+        name += f"__{shallow_cfg.adapter_type}_{shallow_cfg.adapter}"
+    return (name + "__int8").replace(".", "_").replace("-", "_").replace("/", "_")
+
+
+class OnnxRuntimeCausalClient(ShallowLLMClient):
+    """
+    CPU shallow backend: base model (+ merged adapter) exported to ONNX once, weights
+    dynamically quantized to int8, served through ONNX Runtime with a KV cache.
+    """
+
+    def __init__(self):
+        cfg = get_config()
+        shallow_cfg = cfg.model.shallow_LLM
+
+        onnx_dir = Path(get_model_subdir_path(cfg.shallow_root, "onnx", onnx_artifact_name(shallow_cfg)))
+        if not (onnx_dir / QUANTIZED_FILE).exists():
+            self._export(cfg, onnx_dir)
+
+        print(f"🧠 Loading int8 ONNX model from: {onnx_dir}")
+        self.model = ORTModelForCausalLM.from_pretrained(
+            onnx_dir,
+            file_name=QUANTIZED_FILE,
+            use_cache=True,
+            use_io_binding=False,
+            provider="CPUExecutionProvider",
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(onnx_dir)
+
+        self.tokenizer.padding_side = "left"
+        if self.tokenizer.pad_token is None:
+            self.tokenizer.pad_token = self.tokenizer.eos_token
+
+        self.grammar = None
+        if shallow_cfg.constrained_output:
+            print("🧩 Building constrained-output token tables")
+            self.grammar = HfShallowGrammar(self.tokenizer)
+
+    def _export(self, cfg, onnx_dir: Path):
+        """Merge adapter, export fp32 ONNX with past key values, then quantize weights to int8."""
+        shallow_cfg = cfg.model.shallow_LLM
+        t0 = time.time()
+        merged_dir = onnx_dir / "merged"
+        fp32_dir = onnx_dir / "fp32"
+
+        base_dir = get_model_subdir_path(
+            cfg.shallow_root,
+            "hf-causal",
+            shallow_cfg.repo.split("/")[-1].replace(".", "_").replace("-", "_")
+        )
+        print(f"📦 Loading or syncing base model from: {shallow_cfg.repo} to: {base_dir}")
+        base_model_path = snapshot_download(
+            repo_id=shallow_cfg.repo,
+            use_auth_token=cfg.hf_token,
+            local_dir=base_dir,
+            local_dir_use_symlinks=False,
+        )
+
+        model = AutoModelForCausalLM.from_pretrained(
+            base_model_path,
+            torch_dtype=torch.float32,
+            trust_remote_code=shallow_cfg.trust_remote_code,
+        )
+        tokenizer_dir = base_model_path
+
+        if shallow_cfg.adapter and shallow_cfg.adapter_type:
+            from peft import PeftModel
+
+            adapter_dir = Path(cfg.adapter_root) / shallow_cfg.adapter_type / shallow_cfg.adapter / "adapter"
+            tokenizer_dir = Path(cfg.adapter_root) / shallow_cfg.adapter_type / shallow_cfg.adapter / "tokenizer"
+            assert_model_path_exists(adapter_dir)
+            assert_model_path_exists(tokenizer_dir)
+
+            print(f"✅ Merging {shallow_cfg.adapter_type.upper()} adapter from {adapter_dir}")
+            model = PeftModel.from_pretrained(model, adapter_dir).merge_and_unload()
+
+        print(f"🛠️ Exporting merged model to ONNX (one-off): {fp32_dir}")
+        model.save_pretrained(merged_dir)
+        AutoTokenizer.from_pretrained(tokenizer_dir).save_pretrained(merged_dir)
+        del model
+
+        ort_model = ORTModelForCausalLM.from_pretrained(merged_dir, export=True, use_cache=True)
+        ort_model.save_pretrained(fp32_dir)
+        del ort_model
+
+        print(f"🗜️ Quantizing ONNX weights to int8: {onnx_dir / QUANTIZED_FILE}")
+        quantize_dynamic(
+            str(fp32_dir / "model.onnx"),
+            str(onnx_dir / QUANTIZED_FILE),
+            weight_type=QuantType.QInt8,
+            use_external_data_format=True,
+        )
+
+        # Note: keep config + tokenizer next to the quantized graph; drop the fp32 intermediates
+        for path in fp32_dir.glob("*.json"):
+            shutil.copy(path, onnx_dir / path.name)
+        AutoTokenizer.from_pretrained(merged_dir).save_pretrained(onnx_dir)
+        shutil.rmtree(fp32_dir, ignore_errors=True)
+        shutil.rmtree(merged_dir, ignore_errors=True)
+
+        with open(onnx_dir / EXPORT_MANIFEST, "w") as f:
+            json.dump({
+                "repo": shallow_cfg.repo,
+                "adapter": shallow_cfg.adapter,
+                "adapter_type": shallow_cfg.adapter_type,
+                "weight_type": "int8",
+                "exported_at": time.time(),
+            }, f, indent=2)
+
+        record_metrics("Shallow: onnx (export + quantize)", t0)
+
+    def _generation_kwargs(self) -> dict:
+        shallow_cfg = get_config().model.shallow_LLM
+
+        generation_kwargs = {
+            "max_new_tokens": shallow_cfg.max_tokens,
+            "do_sample": shallow_cfg.do_sample,
+            "repetition_penalty": shallow_cfg.repetition_penalty,
+            "use_cache": True,
+            "pad_token_id": self.tokenizer.pad_token_id,
+        }
+
+        if shallow_cfg.do_sample:
+            generation_kwargs["temperature"] = shallow_cfg.temperature
+            generation_kwargs["top_k"] = shallow_cfg.top_k
+            generation_kwargs["top_p"] = shallow_cfg.top_p
+
+        if self.grammar is not None:
+            generation_kwargs.update(self.grammar.constraint().processors())
+
+        return generation_kwargs
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        return self.generate_batch([prompt], **kwargs)[0]
+
+    def generate_batch(self, prompts: List[str], **kwargs) -> List[str]:
+        shallow_cfg = get_config().model.shallow_LLM
+        t0 = time.time()
+
+        inputs = self.tokenizer(prompts, return_tensors="pt", padding=True)
+        with torch.no_grad():
+            output_ids = self.model.generate(**inputs, **self._generation_kwargs())
+
+        new_tokens = output_ids[:, inputs["input_ids"].shape[1]:]
+        outputs = self.tokenizer.batch_decode(new_tokens, skip_special_tokens=True)
+
+        token_count = int(inputs["attention_mask"].sum()) + new_tokens.numel()
+        record_metrics(f'Shallow: {shallow_cfg.backend}', t0, segment_count=len(prompts), tokens=token_count)
+        debug("@OnnxRuntimeCausalClient: RAW OUTPUT:\n", outputs)
+        return outputs
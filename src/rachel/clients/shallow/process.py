@@ -0,0 +1,66 @@
+# src/rachel/clients/shallow/process.py
+
+import os
+import time
+from typing import List
+
+from .base import ShallowLLMClient
+from rachel.core.config import get_config, set_config
+from rachel.runtime.processes import WorkerProcess, serve_requests
+
+
+def setup(cfg):
+    """Worker side: load one shallow model replica and return its request handler."""
+    set_config(cfg)
+
+    from .loader import create_shallow_backend
+
+    client = create_shallow_backend()
+
+    def handle(request):
+        kind, payload = request
+        if kind == "warm":
+            return client.warm_prefix(payload)
+        if len(payload) == 1:
+            return [client.generate(payload[0])]
+        return client.generate_batch(payload)
+
+    return handle
+
+
+class ProcessShallowLLMClient(ShallowLLMClient):
+    """
+    One shallow model replica hosted in its own worker process. Used for the torch /
+    ONNX Runtime backends when summarization runs several shallow workers, so each
+    replica gets its own interpreter instead of contending for the GIL. Only prompts
+    and generated text cross the pipe.
+    """
+
+    def __init__(self, index: int = 0):
+        cfg = get_config()
+        shallow_cfg = cfg.model.shallow_LLM
+        workers = cfg.summarization.shallow_workers
+
+        # Split the cores between replicas instead of letting each one grab them all
+        env = {"OMP_NUM_THREADS": str(max(1, (os.cpu_count() or 1) // workers))}
+
+        print(f"🧵 Starting {shallow_cfg.backend} shallow worker process #{index}")
+        t0 = time.time()
+        self.worker = WorkerProcess("rachel.clients.shallow.process", "Shallow worker process", cfg, env=env)
+        print(f"✅ Shallow worker #{index} ready in {time.time() - t0:.1f}s (pid={self.worker.pid})")
+
+    def warm_prefix(self, prefix: str):
+        self.worker.call(("warm", prefix))
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        return self.worker.call(("generate", [prompt]))[0]
+
+    def generate_batch(self, prompts: List[str], **kwargs) -> List[str]:
+        return self.worker.call(("generate", prompts))
+
+    def close(self):
+        self.worker.close()
+
+
+if __name__ == "__main__":
+    serve_requests(setup)
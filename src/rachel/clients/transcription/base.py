@@ -1,13 +1,30 @@
 # src/rachel/clients/transcription/base.py
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional, Tuple, Union
+import numpy as np
 from rachel.core.model import RawTranscriptSegment
 
 class TranscriptionBackend(ABC):
     @abstractmethod
-    def transcribe(self, audio_bytes: bytes, chunk_offset: float, started_at: float) -> List[RawTranscriptSegment]:
+    def transcribe(self, audio: Union[np.ndarray, bytes], chunk_offset: float, started_at: float) -> List[RawTranscriptSegment]:
+        """`audio` is mono float32 in [-1, 1]; raw int16 PCM bytes are still accepted."""
         pass
 
+    def transcribe_batch(
+        self,
+        items: List[Tuple[Union[np.ndarray, bytes], float, Optional[float]]]
+    ) -> List[List[RawTranscriptSegment]]:
+        """
+        Transcribe several (audio, chunk_offset, started_at) chunks at once; results
+        come back per chunk with chunk-relative timestamps, exactly like `transcribe`.
+        Default: one call per chunk. Backends with a real batched path override this.
+        """
+        return [self.transcribe(audio, offset, started_at) for audio, offset, started_at in items]
+
     def warm(self):
         """Optional: preload model weights."""
+        pass  # default is no-op
+
+    def close(self):
+        """Optional: release workers or other resources on shutdown."""
         pass  # default is no-op
\ No newline at end of file
@@ -3,13 +3,15 @@
 import os
 import time
 import numpy as np
-from faster_whisper import WhisperModel
+from faster_whisper import WhisperModel, BatchedInferencePipeline
 from huggingface_hub import snapshot_download
-from typing import List, Optional
+from typing import List, Optional, Tuple, Union
 
 from .base import TranscriptionBackend
 from rachel.core.model import RawTranscriptSegment, RawTranscriptWord
 from rachel.core.config import get_config
+from rachel.utils.audio import pad_to_clip_windows, to_float32_audio
+from rachel.utils.common import split_segments_by_window
 from rachel.utils.file_system import get_model_subdir_path, assert_model_path_exists
 from rachel.utils.hardware import resolve_device_and_type
 from rachel.utils.metrics import record_metrics
@@ -40,10 +42,11 @@ class FasterWhisperBackend(TranscriptionBackend):
             cpu_threads=os.cpu_count() // 2 if device == "cpu" else 1,
             num_workers=1
         )
+        self.batched = BatchedInferencePipeline(model=self.model)
 
     def transcribe(
         self,
-        audio_bytes: bytes,
+        audio: Union[np.ndarray, bytes],
         chunk_offset: Optional[float],
         started_at: Optional[float]
     ) -> List[RawTranscriptSegment]:
@@ -52,8 +55,8 @@ class FasterWhisperBackend(TranscriptionBackend):
 
         t0 = time.time()
 
-        # Convert PCM bytes to float32
-        audio_array = np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32) / 32768.0
+        # Note: capture already hands over float32; only legacy PCM bytes get converted here
+        audio_array = to_float32_audio(audio)
 
         segments_gen, info = self.model.transcribe(
             audio_array,
@@ -61,7 +64,8 @@ class FasterWhisperBackend(TranscriptionBackend):
             word_timestamps=True,
             language=tcfg.lang,
             temperature=tcfg.temp,
-            vad_filter=True,
+            # Note: utterances cut by the capture-side VAD are already trimmed to speech
+            vad_filter=cfg.audio.chunking != "vad",
             vad_parameters={
                 "min_silence_duration_ms": 500,
                 "speech_pad_ms": 400
@@ -70,6 +74,50 @@ class FasterWhisperBackend(TranscriptionBackend):
 
         record_metrics(tcfg.backend, t0, audio_duration=len(audio_array) / cfg.audio.rate)
 
+        return self._to_raw_segments(segments_gen, getattr(info, 'language', tcfg.lang))
+
+    def transcribe_batch(
+        self,
+        items: List[Tuple[Union[np.ndarray, bytes], float, Optional[float]]]
+    ) -> List[List[RawTranscriptSegment]]:
+        """
+        Pads every chunk to its own decode window and runs them through one
+        BatchedInferencePipeline call (one clip per window), then routes segments
+        back to their chunk by window.
+        """
+        cfg = get_config()
+        tcfg = cfg.model.transcription
+        rate = cfg.audio.rate
+        window_s = self.model.feature_extractor.chunk_length
+
+        arrays = [to_float32_audio(audio) for audio, _, _ in items]
+        if any(len(a) > rate * window_s for a in arrays):
+            return super().transcribe_batch(items)
+
+        t0 = time.time()
+
+        # Note: faster-whisper packs touching clips into shared decode windows, where a segment could
+        # straddle two chunks and fixed-mode overlap audio would be transcribed twice; full-window clips never share
+        audio, clips = pad_to_clip_windows(arrays, rate, window_s)
+
+        segments_gen, info = self.batched.transcribe(
+            audio,
+            beam_size=tcfg.beam_size,
+            word_timestamps=True,
+            language=tcfg.lang,
+            temperature=tcfg.temp,
+            vad_filter=False,
+            clip_timestamps=clips,
+            batch_size=len(arrays),
+        )
+        segments = self._to_raw_segments(segments_gen, getattr(info, 'language', tcfg.lang))
+
+        speech_s = sum(len(a) for a in arrays) / rate
+        record_metrics(f"{tcfg.backend} (batched)", t0, audio_duration=speech_s, segment_count=len(arrays))
+
+        return split_segments_by_window(segments, window_s, len(arrays))
+
+    def _to_raw_segments(self, segments_gen, language: Optional[str]) -> List[RawTranscriptSegment]:
         results = []
         for segment in segments_gen:
             words = []
@@ -90,8 +138,9 @@ class FasterWhisperBackend(TranscriptionBackend):
                     text=segment.text.strip(),
                     words=words,
                     confidence=getattr(segment, 'avg_logprob', None),
-                    language=getattr(info, 'language', tcfg.lang)
+                    language=language
                 )
             )
 
         return results
+
@@ -6,6 +6,10 @@ def _lazy_import_faster_whisper():
     from .faster_whisper import FasterWhisperBackend
     return FasterWhisperBackend
 
+def _lazy_import_process():
+    from .process import ProcessTranscriptionBackend
+    return ProcessTranscriptionBackend
+
 def _lazy_import_mlx():
     from .mlx import MlxWhisperClient
     return MlxWhisperClient
@@ -17,8 +21,14 @@ TRANSCRIPTION_BACKEND_MAP = {
 }
 
 
-def get_transcription_backend():
-    backend_name = get_config().model.transcription.backend
+def get_transcription_backend(isolate: bool = True):
+    tcfg = get_config().model.transcription
+    backend_name = tcfg.backend
+
+    # Note: the worker process calls back in with isolate=False to build the real backend
+    if isolate and tcfg.isolate_process:
+        return _lazy_import_process()()
+
     try:
         BackendClass = TRANSCRIPTION_BACKEND_MAP[backend_name]()
         return BackendClass()
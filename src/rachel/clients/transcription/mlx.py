@@ -4,12 +4,13 @@ import os
 import time
 import numpy as np
 import mlx_whisper
-from typing import List, Optional
+from typing import List, Optional, Union
 from huggingface_hub import snapshot_download
 
 from rachel.core.model import RawTranscriptSegment, RawTranscriptWord
 from rachel.core.config import get_config
 from rachel.utils.common import debug
+from rachel.utils.audio import to_float32_audio
 from rachel.utils.file_system import get_model_subdir_path, assert_model_path_exists
 from rachel.runtime.metrics import record_metrics
 from rachel.clients.transcription.base import TranscriptionBackend
@@ -34,7 +35,7 @@ class MlxWhisperClient(TranscriptionBackend):
 
     def transcribe(
         self,
-        audio_bytes: bytes,
+        audio: Union[np.ndarray, bytes],
         chunk_offset: Optional[float],
         started_at: Optional[float]
     ) -> List[RawTranscriptSegment]:
@@ -43,8 +44,8 @@ class MlxWhisperClient(TranscriptionBackend):
 
         t0 = time.time()
 
-        # Convert PCM bytes to numpy float32 array
-        audio_array = np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32) / 32768.0
+        # Note: capture already hands over float32; only legacy PCM bytes get converted here
+        audio_array = to_float32_audio(audio)
 
         result = mlx_whisper.transcribe(
             audio_array,
@@ -0,0 +1,100 @@
+# src/rachel/clients/transcription/process.py
+
+import threading
+import time
+from typing import List, Optional, Tuple, Union
+import numpy as np
+
+from .base import TranscriptionBackend
+from rachel.core.config import get_config, set_config
+from rachel.core.model import RawTranscriptSegment
+from rachel.runtime.processes import WorkerProcess, serve_requests
+from rachel.utils.audio import SharedAudioRing, to_float32_audio
+
+
+class RingWorker:
+    """Worker side: the real backend plus the shared audio ring its requests point into."""
+
+    def __init__(self, backend: TranscriptionBackend, ring: SharedAudioRing):
+        self.backend = backend
+        self.ring = ring
+
+    def __call__(self, request):
+        items = [(self.ring.read(start, n), offset, started_at) for start, n, offset, started_at in request]
+        if len(items) == 1:
+            audio, offset, started_at = items[0]
+            return [self.backend.transcribe(audio, offset, started_at)]
+        return self.backend.transcribe_batch(items)
+
+    def close(self):
+        self.ring.close()
+
+
+def setup(handshake) -> RingWorker:
+    cfg, ring_name, capacity = handshake
+    set_config(cfg)
+
+    from .loader import get_transcription_backend
+
+    return RingWorker(get_transcription_backend(isolate=False), SharedAudioRing(capacity, name=ring_name))
+
+
+class ProcessTranscriptionBackend(TranscriptionBackend):
+    """
+    Runs the configured transcription backend in a dedicated worker process so
+    Whisper decoding doesn't share a GIL or torch thread pool with the shallow LLM,
+    the semantic filter and the API. Audio goes over a shared-memory ring; only
+    small descriptors and the resulting RawTranscriptSegments cross the pipe.
+    """
+
+    def __init__(self):
+        cfg = get_config()
+        tcfg = cfg.model.transcription
+
+        # Room for a full batch of the longest windows any chunking mode produces
+        # (incremental mode caps its buffer at max_utterance_duration + step_duration)
+        longest = max(cfg.audio.chunk_duration, cfg.audio.max_utterance_duration) + cfg.audio.step_duration
+        capacity = int(cfg.audio.rate * longest * tcfg.batch_size)
+
+        self.ring = SharedAudioRing(capacity)
+        self._lock = threading.Lock()
+
+        print(f"🧵 Starting {tcfg.backend} in a separate transcription process")
+        t0 = time.time()
+        self.worker = WorkerProcess(
+            "rachel.clients.transcription.process", "Transcription process", (cfg, self.ring.name, capacity)
+        )
+        print(f"✅ Transcription process ready in {time.time() - t0:.1f}s (pid={self.worker.pid})")
+
+    def transcribe(
+        self,
+        audio: Union[np.ndarray, bytes],
+        chunk_offset: Optional[float],
+        started_at: Optional[float]
+    ) -> List[RawTranscriptSegment]:
+        return self.transcribe_batch([(audio, chunk_offset, started_at)])[0]
+
+    def transcribe_batch(
+        self,
+        items: List[Tuple[Union[np.ndarray, bytes], float, Optional[float]]]
+    ) -> List[List[RawTranscriptSegment]]:
+        arrays = [to_float32_audio(audio) for audio, _, _ in items]
+        total = sum(len(a) for a in arrays)
+        if total > self.ring.capacity:
+            raise ValueError(f"Batch of {total} frames exceeds shared ring capacity {self.ring.capacity}")
+
+        # Note: one request in flight at a time, so the ring never laps unread audio
+        with self._lock:
+            request = [
+                (self.ring.write(audio), len(audio), offset, started_at)
+                for audio, (_, offset, started_at) in zip(arrays, items)
+            ]
+            return self.worker.call(request)
+
+    def close(self):
+        self.worker.close()
+        self.ring.close()
+
+
+if __name__ == "__main__":
+    serve_requests(setup)
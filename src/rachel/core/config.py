@@ -48,12 +48,34 @@ class AudioConfig:
     chunk_duration: float
     overlap_duration: float
     silence_threshold: float
+    chunking: str = "fixed"
+    vad_frame_ms: int = 30
+    vad_min_silence_ms: int = 500
+    vad_min_speech_ms: int = 250
+    vad_speech_pad_ms: int = 200
+    max_utterance_duration: float = 15.0
+    step_duration: float = 1.0
+    source: str = "mic"
+    source_path: Optional[str] = None
+    speed: float = 1.0
 
     def __post_init__(self):
         if self.rate <= 0:
             raise ConfigError(f"Audio rate must be positive, got {self.rate}")
         if self.chunk_duration <= 0:
             raise ConfigError(f"Chunk duration must be positive, got {self.chunk_duration}")
+        if self.chunking not in ("fixed", "vad", "incremental"):
+            raise ConfigError(f"chunking must be 'fixed', 'vad' or 'incremental', got {self.chunking}")
+        if self.step_duration <= 0:
+            raise ConfigError(f"step_duration must be positive, got {self.step_duration}")
+        if not (0 < self.max_utterance_duration <= 30):
+            raise ConfigError(f"max_utterance_duration must be between 0 and 30s (Whisper window), got {self.max_utterance_duration}")
+        if self.vad_speech_pad_ms > self.vad_min_silence_ms:
+            raise ConfigError("vad_speech_pad_ms must not exceed vad_min_silence_ms")
+        if self.source in ("wav", "dir") and not self.source_path:
+            raise ConfigError(f"Audio source '{self.source}' requires source_path")
+        if self.speed < 0:
+            raise ConfigError(f"speed must be >= 0 (0 = unthrottled), got {self.speed}")
         
 @dataclass
 class SemanticFilterConfig:
@@ -63,6 +85,16 @@ class SemanticFilterConfig:
     similarity_threshold: float
     context_minutes: int
     context_limit: int
+    index: str = "exact"
+    ivf_nlist: int = 0
+    ivf_nprobe: int = 8
+    hnsw_m: int = 16
+    hnsw_ef_construction: int = 200
+    hnsw_ef_search: int = 64
+    cache_size: int = 2048
+    persist_window: bool = True
+    onnx_file: str = "onnx/model_quint8_avx2.onnx"
+    onnx_threads: int = 0
 
     def __post_init__(self):
         if not (0.0 < self.similarity_threshold <= 1.0):
@@ -71,6 +103,16 @@ class SemanticFilterConfig:
             raise ConfigError(f"context_minutes must be positive, got {self.context_minutes}")
         if self.context_limit <= 0:
             raise ConfigError(f"context_limit must be positive, got {self.context_limit}")
+        if self.index not in {"exact", "ivf", "hnsw"}:
+            raise ConfigError(f"semantic index must be one of exact, ivf, hnsw, got {self.index}")
+        if self.ivf_nlist < 0 or self.ivf_nprobe < 1:
+            raise ConfigError(f"ivf_nlist must be >= 0 and ivf_nprobe >= 1, got {self.ivf_nlist}/{self.ivf_nprobe}")
+        if self.hnsw_m < 2 or self.hnsw_ef_construction < 1 or self.hnsw_ef_search < 1:
+            raise ConfigError("hnsw_m must be >= 2 and hnsw_ef_construction / hnsw_ef_search >= 1")
+        if self.cache_size < 0:
+            raise ConfigError(f"semantic cache_size must be >= 0, got {self.cache_size}")
+        if self.onnx_threads < 0:
+            raise ConfigError(f"semantic onnx_threads must be >= 0 (0 = onnxruntime default), got {self.onnx_threads}")
 
 
 @dataclass
@@ -85,10 +127,14 @@ class TranscriptionModelConfig:
     temp: float = 0.3
     beam_size: int = 3
     tolerance: float = 0.1
+    batch_size: int = 8
+    isolate_process: bool = False
 
     def __post_init__(self):
         if not self.repo:
             raise ConfigError("Transcription model 'repo' is required")
+        if self.batch_size < 1:
+            raise ConfigError(f"batch_size must be >= 1, got {self.batch_size}")
         if self.temp < 0 or self.temp > 1:
             raise ConfigError(f"Temperature must be between 0 and 1, got {self.temp}")
 
@@ -110,6 +156,23 @@ class ShallowLLMConfig:
     top_k: int = 40
     repetition_penalty: float = 1.1
     do_extra_pass: bool = False
+    prefix_cache: bool = False
+    constrained_output: bool = False
+    cache_size: int = 1024
+    cache_ttl: Optional[float] = None
+    disk_cache: bool = False
+    disk_cache_max_entries: int = 50000
+    draft_repo: Optional[str] = None
+
+    def __post_init__(self):
+        if self.cache_size < 0:
+            raise ConfigError(f"cache_size must be >= 0, got {self.cache_size}")
+        if self.cache_ttl is not None and self.cache_ttl <= 0:
+            raise ConfigError(f"cache_ttl must be positive or null, got {self.cache_ttl}")
+        if self.disk_cache_max_entries < 1:
+            raise ConfigError(f"disk_cache_max_entries must be >= 1, got {self.disk_cache_max_entries}")
+        if self.draft_repo and self.backend != "hf-causal":
+            raise ConfigError(f"draft_repo is only supported by the hf-causal backend, got {self.backend}")
 
 @dataclass
 class DeepLLMConfig:
@@ -118,6 +181,34 @@ class DeepLLMConfig:
     deep_search_temp: float = 0.4
     temp: float = 0.3
     recentFlagSize: int = 10
+    max_in_flight: int = 4
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0
+    connect_timeout: float = 5.0
+    request_timeout: float = 60.0
+    max_retries: int = 2
+    search_cache_size: int = 256
+    search_cache_ttl: Optional[float] = None
+    prefetch_deepsearch: bool = False
+    prefetch_min_severity: float = 0.7
+    prefetch_budget_per_hour: int = 30
+
+    def __post_init__(self):
+        if self.max_in_flight < 1:
+            raise ConfigError(f"deep_LLM max_in_flight must be >= 1, got {self.max_in_flight}")
+        if self.max_connections < 1 or not (0 <= self.max_keepalive_connections <= self.max_connections):
+            raise ConfigError("deep_LLM max_connections must be >= 1 and 0 <= max_keepalive_connections <= max_connections")
+        if self.keepalive_expiry < 0 or self.connect_timeout <= 0 or self.request_timeout <= 0:
+            raise ConfigError("deep_LLM keepalive_expiry must be >= 0 and connect/request timeouts positive")
+        if self.max_retries < 0:
+            raise ConfigError(f"deep_LLM max_retries must be >= 0, got {self.max_retries}")
+        if self.search_cache_size < 0 or (self.search_cache_ttl is not None and self.search_cache_ttl <= 0):
+            raise ConfigError("deep_LLM search_cache_size must be >= 0 and search_cache_ttl positive (or null)")
+        if self.prefetch_budget_per_hour < 0:
+            raise ConfigError(f"deep_LLM prefetch_budget_per_hour must be >= 0, got {self.prefetch_budget_per_hour}")
+        if self.prefetch_deepsearch and self.search_cache_size == 0:
+            raise ConfigError("deep_LLM prefetch_deepsearch needs search_cache_size > 0 to keep its results")
 
 @dataclass
 class ModelConfig:
@@ -131,6 +222,21 @@ class SummarizationConfig:
     shallow_context_window: int
     deep_context_window: int
     silence_timeout: float
+    shallow_batch_size: int = 4
+    shallow_workers: int = 1
+    prefilter: bool = False
+    prefilter_threshold: float = 0.5
+    prefilter_rare_min_length: int = 7
+
+    def __post_init__(self):
+        if self.shallow_batch_size < 1:
+            raise ConfigError(f"shallow_batch_size must be >= 1, got {self.shallow_batch_size}")
+        if self.shallow_workers < 1:
+            raise ConfigError(f"shallow_workers must be >= 1, got {self.shallow_workers}")
+        if self.prefilter_threshold < 0:
+            raise ConfigError(f"prefilter_threshold must be >= 0, got {self.prefilter_threshold}")
+        if self.prefilter_rare_min_length < 1:
+            raise ConfigError(f"prefilter_rare_min_length must be >= 1, got {self.prefilter_rare_min_length}")
 
 @dataclass
 class RachelConfig:
@@ -1,59 +1,211 @@
 # src/rachel/deep_api.py
 
-import time
+import asyncio
+import itertools
 import json
-import threading
+import time
 import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Optional, Set
 from rachel.clients.deep.loader import get_deep_llm
+from rachel.core.config import get_config
 from rachel.core.model import Flag, FlagSource, ShallowTranscriptContext
 from rachel.core.types import SegmentStatus
-from rachel.runtime.runtime import deep_queue, deep_queue_results, recent_flags_window, stop_signal
+from rachel.runtime.runtime import (
+    deep_queue,
+    deep_queue_results,
+    deep_queue_results_lock,
+    deep_engine_state,
+    recent_flags_window,
+    stop_signal,
+)
 from rachel.utils.common import parse_deep_response, debug
+from rachel.utils.metrics import increment
 from rachel.utils.print_out import print_deep_client_result, print_deep_client_inputs
-from rachel.utils.prompts import generate_deep_prompt
+from rachel.utils.prompts import generate_deep_prompt, generate_deepsearch_prompt
+from rachel.search_cache import deepsearch_payload, search_cache, search_key
 
-is_processing = threading.Event()
-is_processing.set()
+deep_cfg = get_config().model.deep_LLM
 
 llm_client = get_deep_llm()
 
-def process_deep_queue():
-    while not stop_signal.is_set():
-        if not deep_queue.empty() and is_processing.is_set():
-            try:
-                shallow_context: ShallowTranscriptContext = deep_queue.get(timeout=0.5)
-            except queue.Empty:
-                continue
-            is_processing.clear()
-
-            prompt = generate_deep_prompt(shallow_context, recent_flags_window)
-            print_deep_client_inputs(shallow_context, prompt)
-
-            try:
-                start = time.time()
-                raw = llm_client.send(prompt)
-                duration = time.time() - start
-                print_deep_client_result(raw, duration)
-
-                flag = parse_deep_response(raw, prompt, shallow_context.current.id)
-                if flag:
-                    flags = shallow_context.current.flags or []
-                    for i, f in enumerate(flags):
-                        if f.source == FlagSource.SHALLOW and set(f.matches) == set(flag.matches):
-                            flags[i] = flag
-                            break
-                    else:
-                        flags.append(flag)
-
-                    shallow_context.current.flags = flags
-                    shallow_context.current.status = SegmentStatus.COMPLETE
-                    recent_flags_window.append(flag)
-
-                deep_queue_results.put(shallow_context)
-
-            except Exception as e:
-                print(f"❌ Error processing deep LLM request: {e}")
-            finally:
-                is_processing.set()
+PREFETCH_CAPACITY_POLL_SECONDS = 0.25
+PREFETCH_ARCHIVE_ATTEMPTS = 10   # the emit thread archives the segment shortly after the deep result
+
+prefetch_issued_at: Deque[float] = deque()
+prefetch_tasks: Set[asyncio.Task] = set()
+
+
+def deep_priority(shallow_context: ShallowTranscriptContext) -> tuple:
+    """
+    Sort key for pending deep work (lowest first): highest flag severity, then most
+    matched claims, then the most recent segment. Shallow flags currently carry
+    severity 0.0, so in practice match count and recency decide.
+    """
+    flags = shallow_context.current.flags or []
+    severity = max((f.severity for f in flags), default=0.0)
+    matches = sum(len(f.matches) for f in flags)
+    return (-severity, -matches, -(shallow_context.current.start or 0.0))
+
+
+def merge_deep_result(shallow_context: ShallowTranscriptContext, raw: str, prompt: str) -> Optional[Flag]:
+    flag = parse_deep_response(raw, prompt, shallow_context.current.id)
+
+    with deep_queue_results_lock:
+        if flag:
+            flags = shallow_context.current.flags or []
+            for i, f in enumerate(flags):
+                if f.source == FlagSource.SHALLOW and set(f.matches) == set(flag.matches):
+                    flags[i] = flag
+                    break
+            else:
+                flags.append(flag)
+
+            shallow_context.current.flags = flags
+            shallow_context.current.status = SegmentStatus.COMPLETE
+            recent_flags_window.append(flag)
+
+        deep_queue_results.put(shallow_context)
+
+    return flag
+
+
+def take_prefetch_budget() -> bool:
+    """At most `prefetch_budget_per_hour` speculative searches in any rolling hour."""
+    now = time.time()
+    while prefetch_issued_at and now - prefetch_issued_at[0] > 3600:
+        prefetch_issued_at.popleft()
+    if len(prefetch_issued_at) >= deep_cfg.prefetch_budget_per_hour:
+        return False
+    prefetch_issued_at.append(now)
+    return True
+
+
+def has_spare_capacity() -> bool:
+    busy = deep_engine_state["in_flight"] + deep_engine_state["prefetching"]
+    return deep_engine_state["pending"] == 0 and busy < deep_cfg.max_in_flight
+
+
+async def prefetch_deepsearch(segment_id: str):
+    """Run the /deepsearch call for a high-severity segment ahead of the host clicking it."""
+    key = search_key("deepsearch", segment_id)
+
+    prompt = None
+    for _ in range(PREFETCH_ARCHIVE_ATTEMPTS):
+        # Note: only ever use idle slots; real deep work always goes first
+        while not has_spare_capacity():
+            await asyncio.sleep(PREFETCH_CAPACITY_POLL_SECONDS)
+        if search_cache.known(key):
+            return
+        prompt = generate_deepsearch_prompt(segment_id=segment_id)
+        if prompt:
+            break
+        await asyncio.sleep(1.0)
+
+    if not prompt:
+        debug(f"@prefetch_deepsearch: {segment_id} never reached the archive; dropping")
+        return
+
+    deep_engine_state["prefetching"] += 1
+    try:
+        start = time.time()
+        response_text, claimed = await search_cache.prefetch(key, lambda: llm_client.send_async(prompt))
+        payload = deepsearch_payload(response_text, round(time.time() - start, 2))
+        if claimed:
+            # Note: already counted as a prefetch hit when the request attached to the flight
+            search_cache.put(key, (payload, response_text))
         else:
-            time.sleep(0.2)
+            search_cache.put_prefetched(key, (payload, response_text))
+        debug(f"@prefetch_deepsearch: cached deep search for {segment_id}")
+    except json.JSONDecodeError:
+        debug(f"@prefetch_deepsearch: invalid JSON for {segment_id}; not cached")
+    except Exception as e:
+        print(f"❌ Error prefetching deep search: {e}")
+    finally:
+        deep_engine_state["prefetching"] -= 1
+
+
+def maybe_prefetch(shallow_context: ShallowTranscriptContext, flag: Optional[Flag]):
+    if not deep_cfg.prefetch_deepsearch or flag is None or flag.severity < deep_cfg.prefetch_min_severity:
+        return
+    if search_cache.known(search_key("deepsearch", shallow_context.current.id)):
+        return
+    if not take_prefetch_budget():
+        increment("deep_prefetch.over_budget")
+        return
+
+    increment("deep_prefetch.issued")
+    task = asyncio.create_task(prefetch_deepsearch(shallow_context.current.id))
+    prefetch_tasks.add(task)
+    task.add_done_callback(prefetch_tasks.discard)
+
+
+async def analyze(shallow_context: ShallowTranscriptContext):
+    prompt = generate_deep_prompt(shallow_context, recent_flags_window)
+    print_deep_client_inputs(shallow_context, prompt)
+
+    try:
+        start = time.time()
+        raw = await llm_client.send_async(prompt)
+        duration = time.time() - start
+        print_deep_client_result(raw, duration)
+
+        flag = merge_deep_result(shallow_context, raw, prompt)
+        increment("deep.completed")
+        maybe_prefetch(shallow_context, flag)
+
+    except Exception as e:
+        increment("deep.errors")
+        print(f"❌ Error processing deep LLM request: {e}")
+
+
+async def feed(pending: asyncio.PriorityQueue):
+    """Move flagged segments from the thread-side `deep_queue` onto the priority queue."""
+    loop = asyncio.get_running_loop()
+    order = itertools.count()  # tie-breaker so contexts themselves are never compared
+
+    while not stop_signal.is_set():
+        try:
+            # Note: blocks in an executor thread; the timeout only bounds shutdown latency
+            shallow_context = await loop.run_in_executor(None, deep_queue.get, True, 0.5)
+        except queue.Empty:
+            continue
+
+        await pending.put((deep_priority(shallow_context), next(order), shallow_context))
+        deep_engine_state["pending"] = pending.qsize()
+
+
+async def work(pending: asyncio.PriorityQueue):
+    while True:
+        _, _, shallow_context = await pending.get()
+        deep_engine_state["pending"] = pending.qsize()
+        deep_engine_state["in_flight"] += 1
+        try:
+            await analyze(shallow_context)
+        finally:
+            deep_engine_state["in_flight"] -= 1
+            pending.task_done()
+
+
+async def run_deep_engine():
+    # Note: the feeder and any thread-backed send_async share the default executor; size it so none starve
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=deep_cfg.max_in_flight + 1, thread_name_prefix="DeepWorker")
+    )
+
+    pending: asyncio.PriorityQueue = asyncio.PriorityQueue()
+    workers = [asyncio.create_task(work(pending)) for _ in range(deep_cfg.max_in_flight)]
+    print(f"🧠 Deep engine running with {deep_cfg.max_in_flight} request(s) in flight")
+
+    try:
+        await feed(pending)
+    finally:
+        for task in [*workers, *prefetch_tasks]:
+            task.cancel()
+        await asyncio.gather(*workers, *prefetch_tasks, return_exceptions=True)
+        debug(f"@run_deep_engine: stopped with {pending.qsize()} pending")
+
+
+def process_deep_queue():
+    asyncio.run(run_deep_engine())
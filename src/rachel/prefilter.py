@@ -0,0 +1,139 @@
+# src/rachel/prefilter.py
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List
+
+from rachel.core.config import get_config
+from rachel.utils.metrics import increment
+
+# Note: closed-class words, fillers and very common verbs; anything long and outside this set counts as rare
+COMMON_WORDS = set("""
+a about above across after again against all almost also although always am among an and another any anybody
+anyone anything anyway are around as ask asked at away back be because become been before being believe below
+best better between big both but by call called came can cannot could course did didn't different do does
+doesn't doing don't done down during each either else enough even ever every everybody everyone everything
+exactly example few find first for from get gets getting give given go goes going gone good got great guess
+had has hasn't have haven't having he he's her here hers herself him himself his how however i i'd i'll i'm
+i've if important in instead interesting into is isn't it it's its itself just keep kind know knew known last
+least less let like likely little long look looking lot lots made make makes making many may maybe me mean
+means might mind more most much must my myself need never new next no nobody none nor not nothing now of off
+often oh okay on once one only or other others our ours ourselves out over own part people perhaps point
+pretty probably put quite rather re really right said same saw say saying says see seem seems seen she she's
+should show since so some somebody someone something sometimes sort still stuff such sure take talk talking
+tell than thank thanks that that's the their theirs them themselves then there there's these they they're
+thing things think thinking this those though thought through time to today together too totally toward
+true try trying um uh under understand until up upon us use used very want wanted was wasn't way we we're
+we've well went were weren't what what's whatever when where whether which while who who's whole whom whose
+why will with within without won't wonder word words work world would wouldn't yeah yes yet you you'd you'll
+you're you've your yours yourself absolutely actually agree anymore basically certainly completely definitely
+especially everywhere literally obviously personally seriously simply somewhere whatever alright cool nice
+wow huh hmm fine awesome anyways honestly sorry please hey hello hi bye ah oh ok exciting incredible amazing
+""".split())
+
+NUMBER_WORDS = set("""
+hundred hundreds thousand thousands million millions billion billions trillion trillions dozen dozens
+twenty thirty forty fifty sixty seventy eighty ninety half quarter percent
+""".split())
+
+DATE_WORDS = set("""
+january february march april may june july august september october november december monday tuesday
+wednesday thursday friday saturday sunday century centuries decade decades bc ad bce ce
+""".split())
+
+UNIT_WORDS = set("""
+percent percentage dollars dollar euros pounds yen miles mile kilometers kilometres meters metres feet foot
+inches pounds kilograms kilos grams tons tonnes degrees celsius fahrenheit years months weeks days hours
+minutes seconds acres gallons liters litres calories volts watts megawatts gigawatts
+""".split())
+
+WORD_RE = re.compile(r"[A-Za-z][A-Za-z'’.-]*|\d[\d,.:/%-]*")
+SENTENCE_END_RE = re.compile(r"[.?!]$")
+
+# Weights per signal (counts are capped at 2 per signal so one long list can't dominate)
+DEFAULT_WEIGHTS: Dict[str, float] = {
+    "proper_noun": 1.0,
+    "number": 1.0,
+    "date": 1.0,
+    "quantity": 1.0,
+    "rare_term": 0.5,
+}
+SIGNAL_CAP = 2
+
+
+@dataclass
+class PrefilterScore:
+    score: float
+    signals: Dict[str, int]
+
+
+def extract_signals(text: str, rare_min_length: int = 7) -> Dict[str, int]:
+    """Count cheap lexical signals that usually accompany something worth flagging."""
+    signals = {name: 0 for name in DEFAULT_WEIGHTS}
+    tokens: List[str] = WORD_RE.findall(text)
+
+    words = [token.lower().replace("’", "'").strip(".'-") for token in tokens]
+
+    sentence_start = True
+    for i, token in enumerate(tokens):
+        lower = words[i]
+        is_word = token[0].isalpha()
+        unit_follows = i + 1 < len(words) and words[i + 1] in UNIT_WORDS
+
+        if not is_word:
+            signals["number"] += 1
+            if token.endswith("%") or unit_follows:
+                signals["quantity"] += 1
+            if re.fullmatch(r"(1[0-9]|20)\d\d(s)?", token.rstrip(".,")):
+                signals["date"] += 1
+        elif lower in NUMBER_WORDS:
+            signals["number"] += 1
+            if unit_follows:
+                signals["quantity"] += 1
+        elif lower in DATE_WORDS and (lower != "may" or token[0].isupper()):
+            signals["date"] += 1
+        elif token[0].isupper() and lower not in COMMON_WORDS:
+            # Note: sentence-initial capitals only count when they aren't also a rare-looking lowercase word
+            if not sentence_start or len(lower) < rare_min_length:
+                signals["proper_noun"] += 1
+            else:
+                signals["rare_term"] += 1
+        elif len(lower) >= rare_min_length and lower not in COMMON_WORDS:
+            signals["rare_term"] += 1
+
+        sentence_start = bool(SENTENCE_END_RE.search(token))
+
+    # Note: "$5" and "5 billion dollars" style quantities
+    signals["quantity"] += text.count("$")
+    return signals
+
+
+def score_text(text: str, weights: Dict[str, float] = DEFAULT_WEIGHTS, rare_min_length: int = 7) -> PrefilterScore:
+    signals = extract_signals(text, rare_min_length)
+    score = sum(weights.get(name, 0.0) * min(count, SIGNAL_CAP) for name, count in signals.items())
+    return PrefilterScore(score=score, signals=signals)
+
+
+class SegmentPrefilter:
+    """
+    First-tier scorer that runs before the shallow LLM. Segments scoring below the
+    threshold (pure conversation, no entities/numbers/rare terms) skip the model.
+    """
+
+    def __init__(self):
+        cfg = get_config().summarization
+        self.enabled: bool = cfg.prefilter
+        self.threshold: float = cfg.prefilter_threshold
+        self.rare_min_length: int = cfg.prefilter_rare_min_length
+
+    def should_skip(self, text: str) -> bool:
+        if not self.enabled:
+            return False
+
+        result = score_text(text, rare_min_length=self.rare_min_length)
+        skip = result.score < self.threshold
+
+        increment("prefilter.checked")
+        if skip:
+            increment("prefilter.skipped")
+        return skip
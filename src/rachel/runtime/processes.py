@@ -0,0 +1,110 @@
+# src/rachel/runtime/processes.py
+
+import os
+import sys
+import subprocess
+import threading
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+SRC_ROOT = Path(__file__).resolve().parents[2]
+
+
+class WorkerProcess:
+    """
+    Parent side of a worker hosted in a fresh interpreter (`python -m <module>`, not
+    multiprocessing spawn, so the child never re-imports the app). Requests and
+    ("ready" | "ok" | "error", payload) responses travel over a pair of pipes; one
+    request is in flight at a time.
+    """
+
+    def __init__(self, module: str, label: str, handshake: Any, env: Optional[Dict[str, str]] = None):
+        self.label = label
+        self._lock = threading.Lock()
+
+        to_child_r, to_child_w = os.pipe()
+        to_parent_r, to_parent_w = os.pipe()
+        child_env = dict(os.environ)
+        child_env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_ROOT), child_env.get("PYTHONPATH")]))
+        for name, value in (env or {}).items():
+            child_env.setdefault(name, value)
+
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", module, str(to_child_r), str(to_parent_w)],
+            pass_fds=(to_child_r, to_parent_w),
+            env=child_env,
+        )
+        os.close(to_child_r)
+        os.close(to_parent_w)
+
+        self._requests = Connection(to_child_w, readable=False)
+        self._responses = Connection(to_parent_r, writable=False)
+        self._requests.send(handshake)
+
+        # Note: blocks until the worker has loaded its model (or failed to)
+        self._receive()
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    def call(self, request: Any) -> Any:
+        with self._lock:
+            self._requests.send(request)
+            _, payload = self._receive()
+        return payload
+
+    def close(self):
+        try:
+            self._requests.send(None)
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.terminate()
+
+    def _receive(self):
+        try:
+            status, payload = self._responses.recv()
+        except EOFError:
+            raise RuntimeError(f"❌ {self.label} exited (code={self.process.poll()})")
+        if status == "error":
+            raise RuntimeError(f"❌ {self.label} error: {payload}")
+        return status, payload
+
+
+def serve_requests(setup: Callable[[Any], Callable[[Any], Any]]):
+    """
+    Worker side, run from the module's `__main__`: hand the handshake to `setup`, which
+    loads whatever the worker hosts and returns the request handler, then answer
+    requests until the parent sends None or goes away. A handler with a `close()`
+    is closed on the way out.
+    """
+    requests = Connection(int(sys.argv[1]), writable=False)
+    responses = Connection(int(sys.argv[2]), readable=False)
+
+    try:
+        handle = setup(requests.recv())
+    except Exception as e:
+        responses.send(("error", f"{type(e).__name__}: {e}"))
+        return
+
+    responses.send(("ready", None))
+
+    while True:
+        try:
+            request = requests.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+
+        try:
+            responses.send(("ok", handle(request)))
+        except Exception as e:
+            responses.send(("error", f"{type(e).__name__}: {e}"))
+
+    if hasattr(handle, "close"):
+        handle.close()
@@ -9,6 +9,8 @@ from threading import Lock
 
 from rachel.core.config import get_config
 from rachel.core.model import TranscriptSegment
+from rachel.utils.file_system import get_model_subdir_path
+from rachel.utils.semantic_index import build_semantic_index
 
 # Load summarization and deep model config
 cfg = get_config()
@@ -27,6 +29,13 @@ voice_signal = {
     "latest_volume_rms": 0.0,
 }
 
+# Deep engine occupancy (written by the deep engine, read by /metrics)
+deep_engine_state = {
+    "pending": 0,
+    "in_flight": 0,
+    "prefetching": 0,
+}
+
 # Save to disk
 transcript_archive: dict[str, TranscriptSegment] = {}
 ARCHIVE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "transcripts"))
@@ -52,4 +61,7 @@ flag_history = deque(maxlen=50)
 context_window = deque(maxlen=summarization_cfg.shallow_context_window)
 deep_context_window = deque(maxlen=summarization_cfg.deep_context_window)
 recent_flags_window = deque(maxlen=deep_llm_cfg.recentFlagSize)
-semantic_window = deque(maxlen=semantic_cfg.context_limit)
+semantic_window = build_semantic_index(
+    semantic_cfg,
+    path=get_model_subdir_path(cfg.embedded_filter_root, "window", semantic_cfg.name) if semantic_cfg.persist_window else None,
+)
@@ -0,0 +1,77 @@
+# src/rachel/scripts/bench_semantic_embeddings.py
+#
+# Compare semantic embedding backends: load time, resident memory, per-call latency,
+# and cosine agreement with the first backend listed.
+# Usage: PYTHONPATH=src python -m rachel.scripts.bench_semantic_embeddings --backends sentence-transformer onnx
+
+import argparse
+import time
+import numpy as np
+import psutil
+
+from rachel.core.config import get_config
+from rachel.clients.semantic.loader import EMBEDDING_CLIENT_MAP
+
+SAMPLE_TEXTS = [
+    "The council approved a 4.2 million dollar budget for the new bridge.",
+    "Speaker claims unemployment fell to 3 percent last quarter.",
+    "Discussion of the upcoming vote on the housing bill.",
+    "Officials said the vaccine rollout will finish by March.",
+    "A brief exchange about the weather and travel delays.",
+    "The company reported record revenue of 12 billion in 2023.",
+    "The mayor says crime is down twenty percent since January.",
+    "Questions about the timeline for the transit expansion.",
+]
+
+
+def bench(backend: str, texts, rounds: int):
+    process = psutil.Process()
+    rss_before = process.memory_info().rss
+
+    get_config().model.semantic.backend = backend
+    t0 = time.perf_counter()
+    client = EMBEDDING_CLIENT_MAP[backend]()()
+    load_s = time.perf_counter() - t0
+    rss_mb = (process.memory_info().rss - rss_before) / 2**20
+
+    client.embed(texts[0])
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        for text in texts:
+            client.embed(text)
+    single_ms = (time.perf_counter() - t0) / (rounds * len(texts)) * 1e3
+
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        vecs = client.embed_batch(texts)
+    batch_ms = (time.perf_counter() - t0) / (rounds * len(texts)) * 1e3
+
+    return np.asarray(vecs, dtype=np.float32), load_s, rss_mb, single_ms, batch_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark semantic embedding backends.")
+    parser.add_argument("--backends", nargs="+", default=["sentence-transformer", "onnx"])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--tolerance", type=float, default=0.99, help="Minimum cosine vs the reference backend.")
+    args = parser.parse_args()
+
+    # Note: load order matters for the RSS delta; run one backend per process for clean numbers
+    reference = None
+    for backend in args.backends:
+        vecs, load_s, rss_mb, single_ms, batch_ms = bench(backend, SAMPLE_TEXTS, args.rounds)
+        line = (
+            f"  {backend:<22} load={load_s:6.2f}s  rss=+{rss_mb:7.1f}MB  "
+            f"embed={single_ms:6.2f}ms/text  embed_batch={batch_ms:6.2f}ms/text"
+        )
+        if reference is None:
+            reference = vecs
+        else:
+            cosine = np.sum(vecs * reference, axis=1)
+            ok = "✅" if cosine.min() >= args.tolerance else "❌"
+            line += f"  cos(min/mean)={cosine.min():.4f}/{cosine.mean():.4f} {ok}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
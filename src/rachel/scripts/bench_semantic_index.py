@@ -0,0 +1,84 @@
+# src/rachel/scripts/bench_semantic_index.py
+#
+# Compare the exact ring-matrix semantic window with the ANN options at several sizes.
+# Usage: PYTHONPATH=src python -m rachel.scripts.bench_semantic_index --sizes 1000 10000 100000
+
+import argparse
+import time
+import numpy as np
+
+from rachel.utils.semantic_index import RingMatrixIndex, IvfRingIndex, HnswRingIndex
+
+
+def synthetic_embeddings(n: int, dim: int, topics: int, noise: float, rng) -> np.ndarray:
+    """Unit vectors clustered around `topics` random directions (summaries repeat themes)."""
+    centers = rng.standard_normal((topics, dim)).astype(np.float32)
+    x = centers[rng.integers(0, topics, n)] + noise * rng.standard_normal((n, dim)).astype(np.float32)
+    return x / np.linalg.norm(x, axis=1, keepdims=True)
+
+
+def build_indexes(size: int, args) -> dict:
+    indexes = {
+        "exact": RingMatrixIndex(size),
+        f"ivf(nprobe={args.nprobe})": IvfRingIndex(size, nprobe=args.nprobe),
+    }
+    try:
+        indexes[f"hnsw(ef={args.ef_search})"] = HnswRingIndex(size, ef_search=args.ef_search)
+    except ImportError:
+        print("⚠️ hnswlib not installed; skipping HNSW")
+    return indexes
+
+
+def bench(size: int, args, rng):
+    data = synthetic_embeddings(size + args.queries, args.dim, max(10, size // 50), args.noise, rng)
+    stored, queries = data[:size], data[size:]
+    indexes = build_indexes(size, args)
+
+    print(f"\n📏 {size} vectors (dim={args.dim})")
+    exact_best = None
+    for name, index in indexes.items():
+        t0 = time.perf_counter()
+        for i, vec in enumerate(stored):
+            index.add(vec, float(i))
+        build_s = time.perf_counter() - t0
+
+        # Note: first query may cluster (IVF); keep it out of the latency numbers
+        t0 = time.perf_counter()
+        index.max_similarity(queries[0], since=-1.0)
+        warm_s = time.perf_counter() - t0
+
+        best = np.empty(len(queries))
+        t0 = time.perf_counter()
+        for i, vec in enumerate(queries):
+            best[i] = index.max_similarity(vec, since=-1.0)[0]
+        query_us = (time.perf_counter() - t0) / len(queries) * 1e6
+
+        if exact_best is None:
+            exact_best = best
+        recall = float(np.mean(np.abs(best - exact_best) < 1e-5))
+        same_decision = float(np.mean((best > args.threshold) == (exact_best > args.threshold)))
+        print(
+            f"  {name:<16} build={build_s:6.2f}s  first-query={warm_s * 1e3:7.1f}ms  "
+            f"query={query_us:8.1f}µs  recall@1={recall:6.1%}  same-dedup-decision={same_decision:6.1%}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark semantic dedup indexes (exact vs IVF vs HNSW).")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--dim", type=int, default=384, help="Embedding size (all-MiniLM-L6-v2 = 384).")
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--noise", type=float, default=0.6, help="Spread of summaries around their topic.")
+    parser.add_argument("--threshold", type=float, default=0.80, help="Dedup similarity threshold.")
+    parser.add_argument("--nprobe", type=int, default=8)
+    parser.add_argument("--ef-search", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    for size in args.sizes:
+        bench(size, args, rng)
+
+
+if __name__ == "__main__":
+    main()
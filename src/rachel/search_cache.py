@@ -0,0 +1,153 @@
+# src/rachel/search_cache.py
+
+import asyncio
+import json
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from rachel.core.config import get_config
+from rachel.utils.cache import LRUCache
+from rachel.utils.common import debug
+from rachel.utils.metrics import increment
+
+SearchKey = Tuple[str, str, str, str]
+
+
+def search_key(kind: str, segment_id: str, selected_text: str = "", query: str = "") -> SearchKey:
+    """(kind, segment_id, selected_text, query) with whitespace normalized so trivial edits still coalesce."""
+    return (kind, segment_id, " ".join(selected_text.split()), " ".join(query.split()))
+
+
+@dataclass
+class Flight:
+    key: SearchKey
+    task: asyncio.Task
+    waiters: int = 0
+    prefetch: bool = False   # started speculatively by the deep engine
+    claimed: bool = False    # a /deepsearch request attached while it ran
+
+
+class SearchCache:
+    """
+    Deep search coalescing: identical concurrent requests share one in-flight call
+    (single-flight), and completed payloads are kept in an LRU so repeats are served
+    without touching the model. The shared call is only cancelled when every waiter
+    has gone away. Flights belong to the event loop that started them (the API server's);
+    `prefetch` hops onto that loop so endpoint requests can attach to speculative calls.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: Optional[float] = None):
+        self.results: Optional[LRUCache] = LRUCache(max_entries, ttl_seconds) if max_entries > 0 else None
+        self._flights: Dict[SearchKey, Flight] = {}
+        self._prefetched: Set[SearchKey] = set()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop):
+        """Run every flight on `loop` (the API server's), wherever it is started from."""
+        self._loop = loop
+
+    def get(self, key: SearchKey) -> Optional[Any]:
+        if self.results is None:
+            return None
+        payload = self.results.get(key)
+        increment("search_cache.hit" if payload is not None else "search_cache.miss")
+
+        with self._lock:
+            first_use = payload is not None and key in self._prefetched
+            self._prefetched.discard(key)
+        if first_use:
+            increment("deep_prefetch.hit")
+        return payload
+
+    def put(self, key: SearchKey, payload: Any):
+        if self.results is not None:
+            self.results.put(key, payload)
+
+    def __contains__(self, key: SearchKey) -> bool:
+        return self.results is not None and key in self.results
+
+    def put_prefetched(self, key: SearchKey, payload: Any):
+        """Store a speculative result; its first later `get` counts as a prefetch hit."""
+        if self.results is None:
+            return
+        self.results.put(key, payload)
+        with self._lock:
+            self._prefetched.add(key)
+            # Note: forget markers for entries the LRU has already evicted
+            self._prefetched = {k for k in self._prefetched if k in self.results}
+
+    def known(self, key: SearchKey) -> bool:
+        """Cached or currently being fetched."""
+        with self._lock:
+            if key in self._flights:
+                return True
+        return key in self
+
+    def join(self, key: SearchKey, start: Callable[[], Awaitable[str]], prefetch: bool = False) -> Flight:
+        """Attach to the in-flight call for `key`, starting it with `start()` if there is none."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None or flight.task.done():
+                flight = Flight(key=key, task=asyncio.ensure_future(start()), prefetch=prefetch)
+                self._flights[key] = flight
+                flight.task.add_done_callback(lambda _, f=flight: self._finished(f))
+            else:
+                increment("search_cache.coalesced")
+                debug(f"@SearchCache: joined in-flight {key[0]} for {key[1]}")
+                if flight.prefetch and not prefetch and not flight.claimed:
+                    flight.claimed = True
+                    increment("deep_prefetch.hit")
+            flight.waiters += 1
+        return flight
+
+    async def prefetch(self, key: SearchKey, start: Callable[[], Awaitable[str]]) -> Tuple[str, bool]:
+        """
+        Run `start()` as a flight for `key` on the bound loop, so a /deepsearch request arriving
+        meanwhile attaches to it instead of paying for a second call. Returns the response text
+        and whether a request claimed it while in flight. Callable from any event loop.
+        """
+        loop = self._loop
+        if loop is None or loop is asyncio.get_running_loop():
+            return await self._prefetch_flight(key, start)
+        # Note: cancelling the wrapper (deep engine shutdown) cancels _prefetch_flight on the API loop
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self._prefetch_flight(key, start), loop))
+
+    async def _prefetch_flight(self, key: SearchKey, start: Callable[[], Awaitable[str]]) -> Tuple[str, bool]:
+        flight = self.join(key, start, prefetch=True)
+        try:
+            # Note: the prefetch holds a waiter of its own, so a request that joins and then
+            # disconnects never cancels the speculative call
+            await asyncio.wait({flight.task})
+            # Note: a flight the prefetch merely joined was started by a request, so it counts as claimed
+            return flight.task.result(), flight.claimed or not flight.prefetch
+        finally:
+            self.leave(flight)
+
+    def leave(self, flight: Flight):
+        with self._lock:
+            flight.waiters -= 1
+            abandoned = flight.waiters == 0 and not flight.task.done()
+            # Note: the task only reports done() once the loop runs again; unregister it now so
+            # a join in between starts a fresh call instead of inheriting the cancellation
+            if abandoned and self._flights.get(flight.key) is flight:
+                del self._flights[flight.key]
+        if abandoned:
+            flight.task.cancel()
+
+    def _finished(self, flight: Flight):
+        with self._lock:
+            if self._flights.get(flight.key) is flight:
+                del self._flights[flight.key]
+
+
+def deepsearch_payload(response_text: str, duration: float) -> dict:
+    """Parsed /deepsearch payload; raises json.JSONDecodeError on malformed model output."""
+    parsed = json.loads(response_text)
+    parsed["query_duration"] = duration
+    return parsed
+
+
+deep_cfg = get_config().model.deep_LLM
+search_cache = SearchCache(deep_cfg.search_cache_size, deep_cfg.search_cache_ttl)
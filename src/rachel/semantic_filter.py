@@ -1,7 +1,6 @@
 import time
-from typing import Optional
+from typing import List, Optional
 import numpy as np
-from sentence_transformers import util
 
 from rachel.clients.semantic.loader import get_semantic_filter
 from rachel.core.config import get_config
@@ -20,23 +19,37 @@ class SemanticFilter:
 
     def is_duplicate(self, text: str, now: Optional[float] = None) -> bool:
         t0 = time.time()
-        now = now or t0
+        vec = np.asarray(self._embedding_client.embed(text), dtype=np.float32)
+        return self._check(text, vec, now or t0, t0)
 
-        vec = self._embedding_client.embed(text)
+    def is_duplicate_batch(self, texts: List[str], now: Optional[float] = None) -> List[bool]:
+        """
+        Embed all `texts` in one forward pass, then check them in order: a text is also
+        compared against the earlier non-duplicates of the same batch.
+        """
+        if not texts:
+            return []
 
-        with semantic_lock:
-            recent = [(v, ts) for (v, ts) in semantic_window if now - ts < self.context_window_seconds]
-            recent_vectors = [v for (v, _) in recent]
+        t0 = time.time()
+        vecs = np.asarray(self._embedding_client.embed_batch(texts), dtype=np.float32)
+        return [self._check(text, vec, now or t0, t0) for text, vec in zip(texts, vecs)]
 
-            is_dup = False
-            if recent_vectors:
-                sims = util.cos_sim(vec, recent_vectors)[0]
-                if float(sims.max()) > self.similarity_threshold:
-                    debug(f"[SemanticFilter] Duplicate detected (sim={float(sims.max()):.3f}): {text}")
-                    is_dup = True
+    def _check(self, text: str, vec: np.ndarray, now: float, t0: float) -> bool:
+        # Note: embeddings should already be unit-norm; cheap to guarantee so the matvec is cosine
+        norm = float(np.linalg.norm(vec))
+        if norm > 0:
+            vec = vec / norm
+
+        with semantic_lock:
+            t_lookup = time.perf_counter()
+            best, live_count = semantic_window.max_similarity(vec, since=now - self.context_window_seconds)
+            lookup_us = (time.perf_counter() - t_lookup) * 1e6
 
-            if not is_dup:
-                semantic_window.append((vec, now))
+            is_dup = best is not None and best > self.similarity_threshold
+            if is_dup:
+                debug(f"[SemanticFilter] Duplicate detected (sim={best:.3f}): {text}")
+            else:
+                semantic_window.add(vec, now)
 
-        record_metrics("semantic-dedup", t0, segment_count=len(recent_vectors))
+        record_metrics("semantic-dedup", t0, segment_count=live_count, extra={"lookup_us": f"{lookup_us:.0f}"})
         return is_dup
@@ -1,8 +1,13 @@
-from queue import Empty
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from queue import Empty, Queue
+from typing import Deque, List, Optional, Tuple
 from rachel.core.model import ShallowTranscriptContext, TranscriptSegment, Flag, FlagSource, ExitReason
 from rachel.core.types import SegmentStatus
-from rachel.clients.shallow.loader import get_shallow_llm
+from rachel.clients.shallow.loader import get_shallow_llm_pool
 from rachel.semantic_filter import SemanticFilter
+from rachel.prefilter import SegmentPrefilter
 from rachel.runtime.runtime import (
     deep_queue,
     shallow_queue_results,
@@ -12,6 +17,7 @@ from rachel.runtime.runtime import (
     stop_signal,
 )
 from rachel.utils.common import debug, parse_shallow_output
+from rachel.utils.shallow_grammar import parse_constrained_shallow_output
 from rachel.utils.print_out import (
     print_shallow_config,
     print_shallow_prompt,
@@ -22,6 +28,7 @@ from rachel.utils.print_out import (
 from .utils.prompts import (
     generate_shallow_prompt,
     shallow_to_prompt_context,
+    SHALLOW_PROMPT_PREAMBLE,
 )
 from .core.config import get_config
 
@@ -30,14 +37,29 @@ summarization_cfg = get_config().summarization
 print_shallow_config(shallow_cfg)
 
 # Cilents
-llm = get_shallow_llm()
+if shallow_cfg.prefix_cache and shallow_cfg.adapter:
+    print(
+        f"⚠️ prefix_cache puts the shallow instructions before the transcript; make sure adapter "
+        f"'{shallow_cfg.adapter}' was trained on that layout (set prefix_cache: false for the original one)"
+    )
+
+llms = get_shallow_llm_pool(summarization_cfg.shallow_workers)
+replicas: Queue = Queue()
+for client in llms:
+    if shallow_cfg.prefix_cache:
+        client.warm_prefix(SHALLOW_PROMPT_PREAMBLE)
+    replicas.put(client)
 semantic_filter = SemanticFilter()
+prefilter = SegmentPrefilter()
+
+# Note: constrained decoding guarantees the output shape, so the lenient regex fallbacks are skipped
+parse_output = parse_constrained_shallow_output if shallow_cfg.constrained_output else parse_shallow_output
 
 
-def process_segment(segment: TranscriptSegment):
+def prepare_segment(segment: TranscriptSegment, context: List[TranscriptSegment]) -> Tuple[ShallowTranscriptContext, str]:
     shallow_context = ShallowTranscriptContext(
         current=segment,
-        context=list(context_window)
+        context=context
     )
 
     # Note: offload to /stream immediately and continue to enrich; FE will merge/dedupe via id
@@ -47,9 +69,18 @@ def process_segment(segment: TranscriptSegment):
     prompt = generate_shallow_prompt(sc)
 
     print_shallow_prompt(prompt)
-
-    raw_llm_output = llm.generate(prompt)
-    parsed_flag_output, semantic_summary = parse_shallow_output(raw_llm_output)
+    return shallow_context, prompt
+
+
+def finalize_segment(
+    segment: TranscriptSegment,
+    shallow_context: ShallowTranscriptContext,
+    prompt: str,
+    raw_llm_output: str,
+    parsed: Optional[Tuple[list, str]] = None,
+    duplicate: Optional[bool] = None,
+):
+    parsed_flag_output, semantic_summary = parsed or parse_output(raw_llm_output)
     print_shallow_outputs(raw_llm_output, parsed_flag_output, semantic_summary)
 
     if parsed_flag_output:
@@ -73,7 +104,10 @@ def process_segment(segment: TranscriptSegment):
         # Note: We're not spamming the queues with the same thing; each flag data is different.
         shallow_queue_results.put(ShallowTranscriptContext(current=segment, context=list(context_window)))
 
-        if not semantic_filter.is_duplicate(semantic_summary):
+        if duplicate is None:
+            duplicate = semantic_filter.is_duplicate(semantic_summary)
+
+        if not duplicate:
             deep_queue.put(ShallowTranscriptContext(current=segment, context=list(deep_context_window)))
         else:
             segment.flags[0].exit_reason = ExitReason.DUPLICATE
@@ -89,13 +123,123 @@ def process_segment(segment: TranscriptSegment):
     deep_context_window.append(segment)
 
 
+def skip_segment(segment: TranscriptSegment):
+    """Segment failed the prefilter: complete it without touching the shallow LLM."""
+    debug(f"@skip_segment: prefilter skipped {segment.id}")
+    segment.status = SegmentStatus.COMPLETE
+    shallow_queue_results.put(ShallowTranscriptContext(current=segment, context=list(context_window)))
+
+    context_window.append(segment)
+    deep_context_window.append(segment)
+
+
+@dataclass
+class ShallowJob:
+    """One unit of dispatched work; `future` is None for prefilter skips."""
+    segments: List[TranscriptSegment]
+    prepared: List[Tuple[ShallowTranscriptContext, str]] = field(default_factory=list)
+    future: Optional[Future] = None
+
+
+def generate_on_replica(prompts: List[str]) -> List[str]:
+    replica = replicas.get()
+    try:
+        if len(prompts) == 1:
+            return [replica.generate(prompts[0])]
+        return replica.generate_batch(prompts)
+    finally:
+        replicas.put(replica)
+
+
+def dispatch(segments: List[TranscriptSegment], window: deque, executor: ThreadPoolExecutor) -> ShallowJob:
+    """Build prompts in start order (context comes from `window`, not the finalized state) and submit."""
+    prepared = []
+    for seg in segments:
+        prepared.append(prepare_segment(seg, list(window)))
+        window.append(seg)
+
+    future = executor.submit(generate_on_replica, [prompt for _, prompt in prepared])
+    return ShallowJob(segments=segments, prepared=prepared, future=future)
+
+
+def finalize_job(job: ShallowJob):
+    if job.future is None:
+        for seg in job.segments:
+            skip_segment(seg)
+        return
+
+    outputs = job.future.result()
+    parsed = [parse_output(raw_llm_output) for raw_llm_output in outputs]
+
+    # Note: one encoder pass for the batch's flagged summaries, checked in segment order
+    verdicts = iter(semantic_filter.is_duplicate_batch([summary for flags, summary in parsed if flags]))
+    duplicates = [next(verdicts) if flags else None for flags, _ in parsed]
+
+    for seg, (shallow_context, prompt), raw_llm_output, parsed_output, duplicate in zip(
+        job.segments, job.prepared, outputs, parsed, duplicates
+    ):
+        finalize_segment(seg, shallow_context, prompt, raw_llm_output, parsed_output, duplicate)
+
+
+def finalize_ready(jobs: Deque[ShallowJob]):
+    # Note: reorder buffer; jobs finish in any order but are applied strictly in dispatch (start) order
+    while jobs and (jobs[0].future is None or jobs[0].future.done()):
+        finalize_job(jobs.popleft())
+
+
 def start_summarization():
-    while not stop_signal.is_set():
-        try:
-            item = transcript_queue.get(timeout=0.1)
-        except Empty:
-            continue
-
-        segments = item if isinstance(item, list) else [item]
-        for seg in segments:
-            process_segment(seg)
+    batch_size = summarization_cfg.shallow_batch_size
+    workers = len(llms)
+    jobs: Deque[ShallowJob] = deque()
+
+    # Context as it will be once everything dispatched so far is finalized
+    window = deque(context_window, maxlen=context_window.maxlen)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ShallowWorker") as executor:
+        while not stop_signal.is_set():
+            finalize_ready(jobs)
+
+            # Note: with every replica busy, let the queue build up into fuller batches
+            in_flight = [job.future for job in jobs if job.future is not None and not job.future.done()]
+            if len(in_flight) >= workers:
+                wait(in_flight, timeout=0.1, return_when=FIRST_COMPLETED)
+                continue
+
+            try:
+                item = transcript_queue.get(timeout=0.1)
+            except Empty:
+                continue
+
+            segments = item if isinstance(item, list) else [item]
+
+            # Note: drain whatever queued up while the previous batch was generating
+            while len(segments) < batch_size:
+                try:
+                    item = transcript_queue.get_nowait()
+                except Empty:
+                    break
+                segments.extend(item if isinstance(item, list) else [item])
+
+            pending = []
+            for seg in segments:
+                if prefilter.should_skip(seg.text):
+                    if pending:
+                        jobs.append(dispatch(pending, window, executor))
+                        pending = []
+                    window.append(seg)
+                    jobs.append(ShallowJob(segments=[seg]))
+                    continue
+
+                pending.append(seg)
+                if len(pending) == batch_size:
+                    jobs.append(dispatch(pending, window, executor))
+                    pending = []
+
+            if pending:
+                jobs.append(dispatch(pending, window, executor))
+
+        while jobs:
+            finalize_job(jobs.popleft())
+
+    for client in llms:
+        client.close()
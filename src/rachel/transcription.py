@@ -2,93 +2,208 @@
 import time
 import queue
 import uuid
-import pyaudio
-import audioop
-from difflib import SequenceMatcher
+import numpy as np
 
-from rachel.core.model import TranscriptSegment, RawTranscriptSegment
+from rachel.core.model import TranscriptSegment, ShallowTranscriptContext
 from rachel.core.types import SegmentStatus
-from rachel.runtime.runtime import transcript_queue, task_queue_lock, voice_signal, pause_event, stop_signal
+from rachel.runtime.runtime import (
+    transcript_queue,
+    shallow_queue_results,
+    task_queue_lock,
+    voice_signal,
+    pause_event,
+    stop_signal,
+)
 from rachel.runtime.threads import ManagedThread
-from rachel.utils.common import debug, merge_segments_by_words_with_cutoff
-from rachel.utils.print_out import print_audio_capture_started, print_audio_device_list, print_audio_config
+from rachel.utils.common import debug, collect_words_with_cutoff
+from rachel.utils.audio import AudioRingBuffer, VadSegmenter, rms_int16
+from rachel.utils.local_agreement import LocalAgreement
+from rachel.utils.word_dedup import WordDeduplicator
+from rachel.utils.print_out import print_audio_capture_started, print_audio_config
 from rachel.clients.transcription.loader import get_transcription_backend
+from rachel.clients.audio.loader import get_audio_source
 from rachel.core.config import get_config
 
 # Load audio config from global config
 audio_cfg = get_config().audio
-
-# Static values
-FORMAT = pyaudio.paInt16
+transcription_cfg = get_config().model.transcription
 
 # Transcription client
 backend = get_transcription_backend()
 
-# Print configuration
-print_audio_config(audio_cfg, FORMAT)
-
 # Locals
-audio_queue = queue.Queue()
+audio_queue = queue.Queue(maxsize=32)
 frames_per_chunk = int(audio_cfg.rate * audio_cfg.chunk_duration)
 overlap_frames = int(audio_cfg.rate * audio_cfg.overlap_duration)
+step_frames = int(audio_cfg.rate * audio_cfg.step_duration)
+# Note: incremental re-decodes never see more than one full utterance plus the step that closes it
+max_buffer_frames = int(audio_cfg.rate * (audio_cfg.max_utterance_duration + audio_cfg.step_duration))
+ring_frames = max(frames_per_chunk, int(audio_cfg.rate * audio_cfg.max_utterance_duration)) * 4
+
+def update_voice_signal(samples: np.ndarray):
+    rms = rms_int16(samples)
+    voice_signal["latest_volume_rms"] = rms
+    if rms > audio_cfg.silence_threshold:
+        voice_signal["last_non_silent_time"] = time.time()
+
+
+def frame_wall_time(ring: AudioRingBuffer, frame_index: int) -> float:
+    """Approximate wall-clock time at which `frame_index` was captured."""
+    return time.time() - (ring.written - frame_index) / audio_cfg.rate
+
+
+def queue_audio(item, live: bool):
+    """
+    Hand a window to the transcriber. Live audio is dropped while paused; replayed
+    audio waits, and a full `audio_queue` pushes back on replay sources.
+    """
+    while pause_event.is_set():
+        if live or stop_signal.is_set():
+            return
+        time.sleep(0.2)
+
+    while not stop_signal.is_set():
+        try:
+            audio_queue.put(item, timeout=0.5)
+            return
+        except queue.Full:
+            continue
+
+
+def emit_fixed_windows(ring: AudioRingBuffer, live: bool, window: int = frames_per_chunk, overlap: int = overlap_frames):
+    """
+    Cut the ring into fixed `chunk_duration` windows overlapping by `overlap_duration`
+    and hand each one to the transcriber as a float32 array.
+    """
+    start = 0
+    step = window - overlap
+
+    while not stop_signal.is_set():
+        end = start + window
+        if not ring.wait_for(end, timeout=0.5):
+            if ring.closed:
+                # Note: flush the tail of a finished source as a short final window
+                if ring.written > start + overlap:
+                    queue_audio((start / audio_cfg.rate, ring.read_float32(start, ring.written), frame_wall_time(ring, start)), live)
+                break
+            continue
+
+        if start < ring.oldest:
+            debug(f"[audio_capture] ring overrun; skipping {ring.oldest - start} frames")
+            start = ring.oldest
+            continue
+
+        pipeline_started_at = frame_wall_time(ring, min(start + overlap, end))
+        queue_audio((start / audio_cfg.rate, ring.read_float32(start, end), pipeline_started_at), live)
+
+        start += step
+        ring.release(start)
+
+
+def emit_vad_segments(ring: AudioRingBuffer, live: bool):
+    """
+    Walk the ring frame by frame, cut utterances at pauses and queue only the
+    voiced windows. Pure silence never reaches the transcription backend.
+    """
+    segmenter = VadSegmenter(
+        rate=audio_cfg.rate,
+        frame_ms=audio_cfg.vad_frame_ms,
+        silence_threshold=audio_cfg.silence_threshold,
+        min_silence_ms=audio_cfg.vad_min_silence_ms,
+        min_speech_ms=audio_cfg.vad_min_speech_ms,
+        speech_pad_ms=audio_cfg.vad_speech_pad_ms,
+        max_utterance_s=audio_cfg.max_utterance_duration,
+    )
+    frame = segmenter.frame_frames
+    position = 0
+
+    def queue_window(window):
+        start, end = window
+        start = max(start, ring.oldest)
+        if end > start:
+            queue_audio((start / audio_cfg.rate, ring.read_float32(start, end), frame_wall_time(ring, start)), live)
+
+    while not stop_signal.is_set():
+        if not ring.wait_for(position + frame, timeout=0.5):
+            if ring.closed:
+                break
+            continue
+
+        if position < ring.oldest:
+            debug(f"[audio_capture] ring overrun; skipping {ring.oldest - position} frames")
+            position = ring.oldest
+
+        window = segmenter.push(position, rms_int16(ring.view(position, position + frame)))
+        position += frame
+        if window:
+            queue_window(window)
+        ring.release(segmenter.retain_from(position))
+
+    window = segmenter.flush(ring.written)
+    if window:
+        queue_window(window)
+
+
+def emit_step_windows(ring: AudioRingBuffer, live: bool):
+    """Back-to-back `step_duration` slices for the incremental transcriber."""
+    emit_fixed_windows(ring, live, window=step_frames, overlap=0)
+
+
+CHUNKING_MODES = {
+    "fixed": emit_fixed_windows,
+    "vad": emit_vad_segments,
+    "incremental": emit_step_windows,
+}
+
 
 def audio_capture():
-    offset = 0.0
-    pa = pyaudio.PyAudio()
+    print_audio_config(audio_cfg)
+    ring = AudioRingBuffer(ring_frames)
 
-    print_audio_device_list(pa)
+    try:
+        source = get_audio_source()
+    except Exception as e:
+        print("Error opening audio source:", e)
+        return
+
+    def on_audio(samples: np.ndarray):
+        update_voice_signal(samples)
+        ring.write(samples, block=not source.live)
 
     try:
-        stream = pa.open(
-            format=FORMAT,
-            channels=audio_cfg.channels,
-            rate=audio_cfg.rate,
-            input=True,
-            frames_per_buffer=audio_cfg.chunk
-        )
+        source.start(on_audio, on_end=ring.close)
     except Exception as e:
         print("Error opening audio stream:", e)
         return
 
-    buf = b""
-    buffer_start_time = None
-
     print_audio_capture_started()
 
     try:
-        while not stop_signal.is_set():
-            chunk = stream.read(audio_cfg.chunk, exception_on_overflow=False)
-            rms = audioop.rms(chunk, 2)
-            voice_signal["latest_volume_rms"] = rms
-            if rms > audio_cfg.silence_threshold:
-                voice_signal["last_non_silent_time"] = time.time()
-
-            if buffer_start_time is None:
-                buffer_start_time = time.time()
-
-            buf += chunk
-
-            if len(buf) >= frames_per_chunk * pa.get_sample_size(FORMAT):
-                to_process = buf[:frames_per_chunk * pa.get_sample_size(FORMAT)]
-                buf = buf[-overlap_frames * pa.get_sample_size(FORMAT):]
-                if not pause_event.is_set():
-                    audio_queue.put((offset, to_process, buffer_start_time))
-                buffer_start_time = None
-                offset += (audio_cfg.chunk_duration - audio_cfg.overlap_duration)
-
+        CHUNKING_MODES[audio_cfg.chunking](ring, source.live)
     finally:
-        if 'stream' in locals():
-            stream.stop_stream()
-            stream.close()
-        pa.terminate()
+        ring.close()
+        source.stop()
 
 
-def is_similar(a: str, b: str, threshold: float = 0.85) -> bool:
-    return SequenceMatcher(None, a, b).ratio() >= threshold
+def drain_audio_batch(first) -> tuple[list, bool]:
+    """
+    Pull up to `batch_size` pending chunks without waiting. Returns the batch and
+    whether the kill signal (None) was seen while draining.
+    """
+    batch = [first]
+    while len(batch) < transcription_cfg.batch_size:
+        try:
+            item = audio_queue.get_nowait()
+        except queue.Empty:
+            break
+        if item is None:
+            return batch, True
+        batch.append(item)
+    return batch, False
+
 
 def transcribe_worker():
-    last_end_time = 0.0
-    previous_text = ""
+    dedup = WordDeduplicator(tolerance=transcription_cfg.tolerance)
 
     while not stop_signal.is_set():
         if pause_event.is_set():
@@ -104,39 +219,167 @@ def transcribe_worker():
         if item is None:
             break
 
+        # Note: only batches when the box has fallen behind; a lone chunk takes the normal path
+        batch, stopping = drain_audio_batch(item)
+        if len(batch) > 1:
+            debug(f"[transcribe_worker] catching up: batching {len(batch)} chunks")
+            batch_segments = backend.transcribe_batch([(audio, offset, started) for offset, audio, started in batch])
+        else:
+            chunk_offset, audio_data, pipeline_started_at = item
+            batch_segments = [backend.transcribe(audio_data, chunk_offset, pipeline_started_at)]
+
+        for (chunk_offset, _, pipeline_started_at), raw_segments in zip(batch, batch_segments):
+            if not raw_segments:
+                continue
+
+            words = dedup.trim(collect_words_with_cutoff(raw_segments, chunk_offset))
+            if not words:
+                debug("[transcribe_worker] chunk was entirely re-transcribed overlap")
+                continue
+
+            dedup.commit(words)
+            abs_start, abs_end = words[0][0], words[-1][1]
+            merged_text = " ".join(w for _, _, w in words)
+
+            debug(f"[transcribe_worker] merged output text: {merged_text!r}")
+
+            t0 = time.time()
+            ts = TranscriptSegment(
+                id=str(uuid.uuid4()),
+                text=merged_text,
+                start=abs_start,
+                end=abs_end,
+                created_at=t0,
+                pipeline_started_at=pipeline_started_at,
+                status=SegmentStatus.IN_PROGRESS
+            )
+
+            with task_queue_lock:
+                transcript_queue.put(ts)
+
+        if stopping:
+            break
 
-        chunk_offset, audio_data, pipeline_started_at = item
-        raw_segments: list[RawTranscriptSegment] = backend.transcribe(audio_data, chunk_offset, pipeline_started_at)
-        if not raw_segments:
-            continue
+def publish_utterance(utterance_id: str, words: list, created_at: float, pipeline_started_at: float, final: bool):
+    """
+    Provisional text goes straight to /stream (the FE merges by id); only the final,
+    fully committed utterance enters transcript_queue for shallow analysis.
+    """
+    if not words:
+        return
 
-        result = merge_segments_by_words_with_cutoff(raw_segments, chunk_offset, cutoff=last_end_time)
-        if not result:
+    ts = TranscriptSegment(
+        id=utterance_id,
+        text=" ".join(w[2] for w in words),
+        start=words[0][0],
+        end=words[-1][1],
+        created_at=created_at,
+        pipeline_started_at=pipeline_started_at,
+        status=SegmentStatus.IN_PROGRESS
+    )
+
+    if final:
+        with task_queue_lock:
+            transcript_queue.put(ts)
+    else:
+        shallow_queue_results.put(ShallowTranscriptContext(current=ts))
+
+
+def incremental_transcribe_worker():
+    """
+    Streaming mode: re-decode a growing buffer every `step_duration`, commit the word
+    prefix two consecutive hypotheses agree on, and show the rest as provisional.
+    An utterance is closed (and the buffer trimmed) at a committed sentence end or
+    once the buffer reaches `max_utterance_duration`.
+    """
+    rate = audio_cfg.rate
+    agreement = LocalAgreement(tolerance=transcription_cfg.tolerance)
+    buffer = np.zeros(0, dtype=np.float32)
+    buffer_offset = None
+
+    utterance_id = str(uuid.uuid4())
+    utterance_created_at = time.time()
+    utterance_started_at = None
+    committed = []
+
+    def close_utterance():
+        nonlocal utterance_id, utterance_created_at, utterance_started_at, committed
+        publish_utterance(utterance_id, committed, utterance_created_at, utterance_started_at, final=True)
+        utterance_id = str(uuid.uuid4())
+        utterance_created_at = time.time()
+        utterance_started_at = None
+        committed = []
+
+    while not stop_signal.is_set():
+        if pause_event.is_set():
+            time.sleep(0.2)
             continue
 
-        abs_start, abs_end, merged_text = result
-        if is_similar(merged_text, previous_text):
-            debug("[transcribe_worker] skipping near-duplicate segment")
+        try:
+            item = audio_queue.get(timeout=0.5)
+        except queue.Empty:
             continue
 
-        debug(f"[transcribe_worker] merged output text: {merged_text!r}")
+        if item is None:
+            break
 
-        t0 = time.time()
-        ts = TranscriptSegment(
-            id=str(uuid.uuid4()),
-            text=merged_text,
-            start=abs_start,
-            end=abs_end,
-            created_at=t0,
-            pipeline_started_at=pipeline_started_at,
-            status=SegmentStatus.IN_PROGRESS
-        )
+        # Note: if decoding fell behind, fold every pending step into one re-decode
+        steps, stopping = [item], False
+        while True:
+            try:
+                nxt = audio_queue.get_nowait()
+            except queue.Empty:
+                break
+            if nxt is None:
+                stopping = True
+                break
+            steps.append(nxt)
+
+        if buffer_offset is None:
+            buffer_offset = steps[0][0]
+        if utterance_started_at is None:
+            utterance_started_at = steps[0][2]
+        buffer = np.concatenate([buffer] + [audio for _, audio, _ in steps])
+        if len(buffer) > max_buffer_frames:
+            debug(f"[incremental_transcribe_worker] dropping {(len(buffer) - max_buffer_frames) / rate:.1f}s of unagreed audio")
+            buffer_offset += (len(buffer) - max_buffer_frames) / rate
+            buffer = buffer[-max_buffer_frames:]
+
+        raw_segments = backend.transcribe(buffer, buffer_offset, utterance_started_at)
+        words = [
+            (buffer_offset + w.start, buffer_offset + w.end, w.text.strip())
+            for seg in raw_segments
+            for w in (seg.words or [])
+            if w.text.strip()
+        ]
+
+        agreed, provisional = agreement.update(words)
+        committed.extend(agreed)
+        publish_utterance(utterance_id, committed + provisional, utterance_created_at, utterance_started_at, final=False)
+
+        if stopping:
+            break
 
-        last_end_time = abs_end
-        previous_text = merged_text
+        buffer_duration = len(buffer) / rate
+        sentence_closed = committed and committed[-1][2].endswith((".", "?", "!"))
+        if sentence_closed or buffer_duration >= audio_cfg.max_utterance_duration:
+            if committed:
+                cut = int((agreement.committed_end - buffer_offset) * rate)
+                buffer, buffer_offset = buffer[max(cut, 0):], agreement.committed_end
+                close_utterance()
+            else:
+                # Note: nothing agreed on in a full buffer (noise/silence); keep only the last step
+                keep = min(len(buffer), step_frames)
+                buffer_offset += (len(buffer) - keep) / rate
+                buffer = buffer[-keep:]
+        elif not words and buffer_duration > 2 * audio_cfg.step_duration:
+            keep = min(len(buffer), step_frames)
+            buffer_offset += (len(buffer) - keep) / rate
+            buffer = buffer[-keep:]
+
+    committed.extend(agreement.flush())
+    close_utterance()
 
-        with task_queue_lock:
-            transcript_queue.put(ts)
 
 def start_transcription():
     capture_thread = ManagedThread(
@@ -145,7 +388,7 @@ def start_transcription():
         stop_signal=stop_signal,
     )
     transcribe_thread = ManagedThread(
-        target=transcribe_worker,
+        target=incremental_transcribe_worker if audio_cfg.chunking == "incremental" else transcribe_worker,
         name="TranscribeWorker",
         stop_signal=stop_signal,
     )
@@ -160,6 +403,10 @@ def start_transcription():
         print("KeyboardInterrupt received — stopping threads.")
         stop_signal.set()
     finally:
-        audio_queue.put(None) 
+        try:
+            audio_queue.put_nowait(None)
+        except queue.Full:
+            pass
         capture_thread.stop()
         transcribe_thread.stop()
+        backend.close()
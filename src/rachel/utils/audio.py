@@ -0,0 +1,347 @@
+# src/rachel/utils/audio.py
+
+import threading
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+
+INT16_SCALE = 1.0 / 32768.0
+
+
+def to_float32_audio(audio: Union[np.ndarray, bytes]) -> np.ndarray:
+    """
+    Normalize any supported audio payload to mono float32 in [-1, 1].
+    float32 arrays pass through untouched (no copy); int16 arrays and raw
+    PCM bytes are converted once.
+    """
+    if isinstance(audio, (bytes, bytearray, memoryview)):
+        audio = np.frombuffer(audio, dtype=np.int16)
+
+    if audio.dtype == np.float32:
+        return audio
+
+    return np.multiply(audio, INT16_SCALE, dtype=np.float32)
+
+
+def rms_int16(samples: np.ndarray) -> float:
+    """Root-mean-square of int16 samples (same scale as audioop.rms)."""
+    if samples.size == 0:
+        return 0.0
+    as_float = samples.astype(np.float32)
+    return float(np.sqrt(np.dot(as_float, as_float) / as_float.size))
+
+
+def downmix_int16(samples: np.ndarray, channels: int) -> np.ndarray:
+    """Average interleaved channels down to a mono int16 signal."""
+    if channels <= 1:
+        return samples
+    return samples.reshape(-1, channels).mean(axis=1).astype(np.int16)
+
+
+def pad_to_clip_windows(
+    arrays: List[np.ndarray], rate: int, window_s: float
+) -> Tuple[np.ndarray, List[Dict[str, float]]]:
+    """
+    Lay each chunk at the start of its own `window_s`-second slot of silence and return
+    the padded audio with one clip (in seconds) spanning each whole slot. faster-whisper
+    packs consecutive clips into decode windows of up to its chunk_length, so clips that
+    already fill a window are each decoded alone.
+    """
+    window = int(rate * window_s)
+    padded = np.zeros(window * len(arrays), dtype=np.float32)
+    for i, audio in enumerate(arrays):
+        if len(audio) > window:
+            raise ValueError(f"Chunk of {len(audio)} frames exceeds the {window}-frame decode window")
+        padded[i * window:i * window + len(audio)] = audio
+    clips = [{"start": i * window / rate, "end": (i + 1) * window / rate} for i in range(len(arrays))]
+    return padded, clips
+
+
+class AudioRingBuffer:
+    """
+    Preallocated int16 ring buffer addressed by absolute frame index.
+
+    A single producer (e.g. a PyAudio callback) appends with `write()`; consumers
+    wait for a frame index with `wait_for()` and pull windows out with `view()`
+    or `read_float32()`. Nothing is reallocated after construction.
+    """
+
+    def __init__(self, capacity_frames: int):
+        if capacity_frames <= 0:
+            raise ValueError(f"Ring buffer capacity must be positive, got {capacity_frames}")
+
+        self.capacity = capacity_frames
+        self._buf = np.zeros(capacity_frames, dtype=np.int16)
+        self._cond = threading.Condition()
+        self.written = 0          # absolute number of frames ever written
+        self.released = 0         # frames the consumer is done with (backpressure for replay)
+        self.closed = False
+
+    @property
+    def oldest(self) -> int:
+        """Oldest absolute frame index still held in the buffer."""
+        return max(0, self.written - self.capacity)
+
+    def write(self, samples: np.ndarray, block: bool = False):
+        """
+        Append samples. Live producers write with block=False and overwrite the oldest
+        frames on overrun; replay producers write with block=True and wait until the
+        consumer has `release()`d enough room.
+        """
+        if block:
+            step = max(1, self.capacity // 2)
+            for i in range(0, len(samples), step):
+                piece = samples[i:i + step]
+                with self._cond:
+                    self._cond.wait_for(
+                        lambda: self.written + len(piece) - self.released <= self.capacity or self.closed
+                    )
+                    if self.closed:
+                        return
+                self._write(piece)
+            return
+
+        self._write(samples)
+
+    def _write(self, samples: np.ndarray):
+        n = len(samples)
+        if n == 0:
+            return
+
+        # Note: a write larger than the whole ring only keeps its tail
+        if n > self.capacity:
+            with self._cond:
+                self.written += n - self.capacity
+            samples = samples[-self.capacity:]
+            n = self.capacity
+
+        pos = self.written % self.capacity
+        first = min(n, self.capacity - pos)
+        self._buf[pos:pos + first] = samples[:first]
+        if first < n:
+            self._buf[:n - first] = samples[first:]
+
+        with self._cond:
+            self.written += n
+            self._cond.notify_all()
+
+    def release(self, frame_index: int):
+        """Consumer no longer needs frames before `frame_index`; unblocks replay writers."""
+        with self._cond:
+            if frame_index > self.released:
+                self.released = frame_index
+                self._cond.notify_all()
+
+    def close(self):
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    def wait_for(self, frame_index: int, timeout: Optional[float] = None) -> bool:
+        """Block until `frame_index` frames have been written (or the buffer is closed)."""
+        with self._cond:
+            self._cond.wait_for(lambda: self.written >= frame_index or self.closed, timeout)
+            return self.written >= frame_index
+
+    def view(self, start: int, end: int) -> np.ndarray:
+        """
+        int16 samples for absolute frames [start, end). Returns a zero-copy view when
+        the window is contiguous in memory, otherwise a single concatenated copy.
+        """
+        self._check_window(start, end)
+        a = start % self.capacity
+        b = a + (end - start)
+        if b <= self.capacity:
+            return self._buf[a:b]
+        return np.concatenate((self._buf[a:], self._buf[:b - self.capacity]))
+
+    def read_float32(self, start: int, end: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Convert frames [start, end) straight from the ring into a float32 array."""
+        self._check_window(start, end)
+        n = end - start
+        if out is None:
+            out = np.empty(n, dtype=np.float32)
+
+        a = start % self.capacity
+        first = min(n, self.capacity - a)
+        np.multiply(self._buf[a:a + first], INT16_SCALE, out=out[:first], casting="unsafe")
+        if first < n:
+            np.multiply(self._buf[:n - first], INT16_SCALE, out=out[first:n], casting="unsafe")
+        return out
+
+    def _check_window(self, start: int, end: int):
+        if end < start:
+            raise ValueError(f"Invalid window [{start}, {end})")
+        if end > self.written:
+            raise ValueError(f"Window end {end} is ahead of written frames {self.written}")
+        if start < self.oldest:
+            raise ValueError(f"Window start {start} was already overwritten (oldest={self.oldest})")
+
+
+class EnergyVad:
+    """
+    Frame-level voice activity detector.
+
+    A frame counts as speech when its RMS clears both the static `silence_threshold`
+    and an adaptive noise floor (a running estimate of the background level), so a
+    steady hum just under the threshold does not keep utterances open.
+    """
+
+    def __init__(self, silence_threshold: float, floor_ratio: float = 2.0, floor_decay: float = 0.95):
+        self.silence_threshold = silence_threshold
+        self.floor_ratio = floor_ratio
+        self.floor_decay = floor_decay
+        self.noise_floor = 0.0
+
+    def is_speech(self, rms: float) -> bool:
+        threshold = max(self.silence_threshold, self.noise_floor * self.floor_ratio)
+        speech = rms > threshold
+
+        # Note: only non-speech frames feed the floor, so long utterances can't raise it
+        if not speech:
+            self.noise_floor = self.floor_decay * self.noise_floor + (1 - self.floor_decay) * rms
+        return speech
+
+
+class VadSegmenter:
+    """
+    Turns a stream of fixed-size frames into utterance windows (absolute frame
+    indices). Cuts at pauses of `min_silence_ms`, drops blips shorter than
+    `min_speech_ms`, and force-cuts utterances at `max_utterance_s` on the
+    quietest recent frame.
+    """
+
+    def __init__(
+        self,
+        rate: int,
+        frame_ms: int,
+        silence_threshold: float,
+        min_silence_ms: int,
+        min_speech_ms: int,
+        speech_pad_ms: int,
+        max_utterance_s: float,
+    ):
+        self.vad = EnergyVad(silence_threshold)
+        self.frame_frames = int(rate * frame_ms / 1000)
+        self.min_silence_frames = int(rate * min_silence_ms / 1000)
+        self.min_speech_frames = int(rate * min_speech_ms / 1000)
+        self.pad_frames = int(rate * speech_pad_ms / 1000)
+        self.max_frames = int(rate * max_utterance_s)
+
+        self._speech_start: Optional[int] = None
+        self._last_speech_end = 0
+        self._speech_frames = 0
+        self._last_cut_end = 0
+        self._quietest: Optional[tuple[float, int]] = None
+
+    def push(self, frame_start: int, rms: float) -> Optional[tuple[int, int]]:
+        """Feed one frame; returns an (start, end) window when an utterance closes."""
+        frame_end = frame_start + self.frame_frames
+        speech = self.vad.is_speech(rms)
+
+        if self._speech_start is None:
+            if speech:
+                self._open(frame_start)
+                self._last_speech_end = frame_end
+                self._speech_frames = self.frame_frames
+            return None
+
+        if speech:
+            self._last_speech_end = frame_end
+            self._speech_frames += self.frame_frames
+
+        # Candidate force-cut points only come from the back half of the utterance
+        if frame_end - self._speech_start > self.max_frames // 2:
+            if self._quietest is None or rms <= self._quietest[0]:
+                self._quietest = (rms, frame_end)
+
+        if frame_end - self._last_speech_end >= self.min_silence_frames:
+            return self._cut(min(self._last_speech_end + self.pad_frames, frame_end), reopen_at=None)
+
+        if frame_end - self._speech_start >= self.max_frames:
+            cut_at = self._quietest[1] if self._quietest else frame_end
+            return self._cut(cut_at, reopen_at=cut_at)
+
+        return None
+
+    def retain_from(self, position: int) -> int:
+        """Earliest frame the segmenter may still need once it has consumed up to `position`."""
+        start = self._speech_start if self._speech_start is not None else position
+        return max(0, start - self.pad_frames)
+
+    def flush(self, written: int) -> Optional[tuple[int, int]]:
+        """Close any open utterance (e.g. when the source ends)."""
+        if self._speech_start is None:
+            return None
+        return self._cut(min(written, self._last_speech_end + self.pad_frames), reopen_at=None)
+
+    def _open(self, start: int):
+        self._speech_start = start
+        self._speech_frames = 0
+        self._quietest = None
+
+    def _cut(self, end: int, reopen_at: Optional[int]) -> Optional[tuple[int, int]]:
+        start = max(self._last_cut_end, self._speech_start - self.pad_frames, 0)
+        keep = self._speech_frames >= self.min_speech_frames
+
+        self._speech_start = None
+        if reopen_at is not None:
+            self._open(reopen_at)
+            self._speech_frames = self.frame_frames
+
+        if not keep:
+            return None
+
+        self._last_cut_end = end
+        return start, end
+
+
+class SharedAudioRing:
+    """
+    float32 ring in `multiprocessing.shared_memory`, used to hand audio to a worker
+    process without pickling it. The creating side owns (and unlinks) the block;
+    the other side attaches by name. Callers keep at most `capacity` frames in
+    flight, so a window is never overwritten while it is being read.
+    """
+
+    def __init__(self, capacity_frames: int, name: Optional[str] = None):
+        from multiprocessing import shared_memory
+
+        self.capacity = capacity_frames
+        self.owner = name is None
+        nbytes = capacity_frames * np.dtype(np.float32).itemsize
+        self._shm = shared_memory.SharedMemory(name=name, create=self.owner, size=nbytes)
+        self.name = self._shm.name
+
+        if not self.owner:
+            # Note: only the creator unlinks; keep this process's resource tracker from doing it at exit
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(self._shm._name, "shared_memory")
+        self.array = np.ndarray((capacity_frames,), dtype=np.float32, buffer=self._shm.buf)
+        self._cursor = 0
+
+    def write(self, samples: np.ndarray) -> int:
+        """Copy samples in at the cursor; returns the ring position they start at."""
+        n = len(samples)
+        if n > self.capacity:
+            raise ValueError(f"Window of {n} frames exceeds shared ring capacity {self.capacity}")
+
+        start = self._cursor
+        first = min(n, self.capacity - start)
+        self.array[start:start + first] = samples[:first]
+        if first < n:
+            self.array[:n - first] = samples[first:]
+        self._cursor = (start + n) % self.capacity
+        return start
+
+    def read(self, start: int, n: int) -> np.ndarray:
+        """Zero-copy view when contiguous, otherwise one concatenated copy."""
+        end = start + n
+        if end <= self.capacity:
+            return self.array[start:end]
+        return np.concatenate((self.array[start:], self.array[:end - self.capacity]))
+
+    def close(self):
+        del self.array
+        self._shm.close()
+        if self.owner:
+            self._shm.unlink()
@@ -3,7 +3,7 @@ import ast
 import json
 import pprint
 import re
-from dataclasses import asdict, is_dataclass
+from dataclasses import asdict, is_dataclass, replace
 from typing import Any, List, Optional, Tuple
 from rachel.core.model import Flag, FlagSource, ExitReason, RawTranscriptSegment
 
@@ -278,12 +278,13 @@ def debug(*objs):
         else:
             print(cleaned)
 
-def merge_segments_by_words_with_cutoff(
+def collect_words_with_cutoff(
     segments: List[RawTranscriptSegment],
     chunk_offset: float,
     cutoff: float = 0.0,
     verbose: bool = False,
-) -> Optional[tuple[float, float, str]]:
+) -> List[Tuple[float, float, str]]:
+    """Flatten segment words to (absolute start, absolute end, text), dropping words ending before `cutoff`."""
     merged_words = []
 
     for seg_idx, seg in enumerate(segments):
@@ -302,19 +303,26 @@ def merge_segments_by_words_with_cutoff(
             if verbose:
                 debug("No words in segment!")
 
-    if not merged_words:
-        debug("No words made it past the cutoff.")
-        return None
-
-    start = merged_words[0][0]
-    end = merged_words[-1][1]
-    text = " ".join(w for _, _, w in merged_words)
-
-    if verbose:
-        debug(f"\n✅ Merged segment: {start:.2f}–{end:.2f} ({end - start:.2f}s)")
-
-    return start, end, text
+    return merged_words
 
 
+def shift_segment(seg: RawTranscriptSegment, delta: float) -> RawTranscriptSegment:
+    return replace(
+        seg,
+        start=seg.start + delta,
+        end=seg.end + delta,
+        words=[replace(w, start=w.start + delta, end=w.end + delta) for w in (seg.words or [])],
+    )
 
 
+def split_segments_by_window(
+    segments: List[RawTranscriptSegment],
+    window_s: float,
+    count: int,
+) -> List[List[RawTranscriptSegment]]:
+    """Undo `pad_to_clip_windows`: route each segment to its chunk's slot and make it chunk-relative."""
+    results: List[List[RawTranscriptSegment]] = [[] for _ in range(count)]
+    for seg in segments:
+        idx = min(count - 1, max(0, int((seg.start + 1e-3) // window_s)))
+        results[idx].append(shift_segment(seg, -idx * window_s))
+    return results
@@ -0,0 +1,64 @@
+# src/rachel/utils/local_agreement.py
+
+from typing import List, Tuple
+from rachel.utils.common import normalize
+
+# (absolute start, absolute end, text)
+TimedWord = Tuple[float, float, str]
+
+
+class LocalAgreement:
+    """
+    LocalAgreement-2 commit policy for re-decoded audio buffers.
+
+    Every decode of the growing buffer yields a word hypothesis. A word is committed
+    only once two consecutive hypotheses agree on it (as part of a common prefix after
+    the last committed word); everything after that prefix stays provisional.
+    """
+
+    def __init__(self, tolerance: float = 0.1, max_ngram: int = 5):
+        self.tolerance = tolerance
+        self.max_ngram = max_ngram
+        self.committed_end = 0.0
+        self._previous: List[TimedWord] = []
+        self._committed_tail: List[TimedWord] = []
+
+    def update(self, words: List[TimedWord]) -> Tuple[List[TimedWord], List[TimedWord]]:
+        """Feed a fresh hypothesis; returns (newly committed words, provisional words)."""
+        new = [w for w in words if w[0] >= self.committed_end - self.tolerance]
+        new = self._drop_recommitted_head(new)
+
+        agreed = []
+        for current, previous in zip(new, self._previous):
+            if normalize(current[2]) != normalize(previous[2]):
+                break
+            agreed.append(current)
+
+        if agreed:
+            self.committed_end = agreed[-1][1]
+            self._committed_tail = (self._committed_tail + agreed)[-self.max_ngram:]
+
+        self._previous = new[len(agreed):]
+        return agreed, self._previous
+
+    def flush(self) -> List[TimedWord]:
+        """Commit whatever is still provisional (end of stream)."""
+        remaining, self._previous = self._previous, []
+        if remaining:
+            self.committed_end = remaining[-1][1]
+        return remaining
+
+    def _drop_recommitted_head(self, new: List[TimedWord]) -> List[TimedWord]:
+        """
+        Words straddling the commit point are often re-emitted at the head of the next
+        hypothesis; drop the longest head n-gram that repeats the committed tail.
+        """
+        if not new or not self._committed_tail or abs(new[0][0] - self.committed_end) > 1.0:
+            return new
+
+        tail = [normalize(w[2]) for w in self._committed_tail]
+        head = [normalize(w[2]) for w in new[:self.max_ngram]]
+        for n in range(min(len(tail), len(head)), 0, -1):
+            if tail[-n:] == head[:n]:
+                return new[n:]
+        return new
@@ -1,8 +1,26 @@
 import time, psutil
+import threading
 
-def record_metrics(label: str, started_at: float, audio_duration: float = None, segment_count: int = None, tokens: int = None):
+_process = psutil.Process()
+_counters: dict[str, int] = {}
+_counters_lock = threading.Lock()
+
+
+def increment(name: str, amount: int = 1):
+    """Bump a named pipeline counter (exposed on /metrics/stream)."""
+    with _counters_lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+def counters_snapshot() -> dict[str, int]:
+    with _counters_lock:
+        return dict(_counters)
+
+
+def record_metrics(label: str, started_at: float, audio_duration: float = None, segment_count: int = None, tokens: int = None, extra: dict = None):
     elapsed = time.time() - started_at
-    cpu = psutil.Process().cpu_percent(interval=0.1)
+    # Note: non-blocking; a 0.1s sampling interval here used to stall every caller
+    cpu = _process.cpu_percent(interval=None)
     mem = psutil.Process().memory_info().rss / 1e6
 
     rtf = (elapsed / audio_duration) if audio_duration else None
@@ -14,5 +32,7 @@ def record_metrics(label: str, started_at: float, audio_duration: float = None,
         print(f" | segments={segment_count}", end="")
     if tokens is not None:
         print(f" | tokens={tokens}", end="")
+    for key, value in (extra or {}).items():
+        print(f" | {key}={value}", end="")
 
     print("\n")
\ No newline at end of file
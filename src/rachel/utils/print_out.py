@@ -6,7 +6,7 @@ from rachel.utils.common import debug
 audio_cfg = get_config().audio
 summarization_cfg = get_config().summarization
 
-def print_audio_config(audio_cfg, FORMAT):
+def print_audio_config(audio_cfg):
     # Print configuration
     print("*" * 60)
     print("Audio Configuration")
@@ -15,8 +15,15 @@ def print_audio_config(audio_cfg, FORMAT):
     print(f"\tchunk                      = {audio_cfg.chunk} samples")
     print(f"\tchannels                   = {audio_cfg.channels}")
     print(f"\trate                       = {audio_cfg.rate} Hz")
-    print(f"\tformat                     = {FORMAT} (paInt16)")
+    print("\tformat                     = paInt16")
     print(f"\tsilence_threshold          = {audio_cfg.silence_threshold} (RMS)")
+    print(f"\tchunking                   = {audio_cfg.chunking}")
+    print(f"\tsource                     = {audio_cfg.source}" + (f" ({audio_cfg.source_path})" if audio_cfg.source_path else ""))
+    if audio_cfg.source != "mic":
+        print(f"\tspeed                      = {audio_cfg.speed or 'unthrottled'}")
+    if audio_cfg.chunking == "vad":
+        print(f"\tvad_min_silence_ms         = {audio_cfg.vad_min_silence_ms}ms")
+        print(f"\tmax_utterance_duration     = {audio_cfg.max_utterance_duration}s")
 
 def print_audio_capture_started():
     print("\n" * 5)
@@ -3,6 +3,7 @@
 import json
 from typing import Deque, Optional, List
 from dataclasses import dataclass
+from rachel.core.config import get_config
 from rachel.core.model import ShallowTranscriptContext, FlagSource, Flag
 from rachel.runtime.runtime import transcript_archive, transcript_archive_lock
 
@@ -225,19 +226,9 @@ IMPORTANT:
 - Do NOT wrap your response in triple backticks (e.g. ```json)
 """.strip()
 
-def generate_shallow_prompt(pc: PromptContext) -> str:
-    context_block = json.dumps([p.strip() for p in pc.context])
-    transcript_text = json.dumps(pc.text.strip())
-
-    return f"""
-Use the Context only to clarify meaning — extract *only* verbatim substrings from the Transcript.
-
-Context:
-{context_block}
-
-Transcript:
-{transcript_text}
+SHALLOW_PROMPT_LEAD = "Use the Context only to clarify meaning — extract *only* verbatim substrings from the Transcript."
 
+SHALLOW_PROMPT_INSTRUCTIONS = """
 TASK:
 1. Extract exact phrases (verbatim substrings) from the Transcript that are interesting or worth looking up. These include:
    - Named people, countries, cities, or regions
@@ -264,4 +255,44 @@ RULES:
 OUTPUT (Return valid Python literals):
 Flags: list[str] — must be a valid Python list of quoted strings or an empty list []
 SemanticSummary: str — must be a single Python string (quoted) or an empty string
-""".strip()
\ No newline at end of file
+""".strip()
+
+
+# Note: with prefix_cache the constant block goes first so its KV cache can be computed once and reused
+SHALLOW_PROMPT_PREAMBLE = f"{SHALLOW_PROMPT_LEAD}\n\n{SHALLOW_PROMPT_INSTRUCTIONS}"
+
+
+def generate_shallow_prompt(pc: PromptContext, prefix_first: Optional[bool] = None) -> str:
+    """
+    Shallow prompt. The original layout (instructions after the transcript) is kept unless
+    `prefix_first` (default: shallow_LLM.prefix_cache) moves the whole preamble to the front;
+    adapters are trained on one layout, so train and serve with the same setting.
+    """
+    if prefix_first is None:
+        prefix_first = get_config().model.shallow_LLM.prefix_cache
+
+    context_block = json.dumps([p.strip() for p in pc.context])
+    transcript_text = json.dumps(pc.text.strip())
+
+    if prefix_first:
+        return f"""
+{SHALLOW_PROMPT_PREAMBLE}
+
+Context:
+{context_block}
+
+Transcript:
+{transcript_text}
+""".strip()
+
+    return f"""
+{SHALLOW_PROMPT_LEAD}
+
+Context:
+{context_block}
+
+Transcript:
+{transcript_text}
+
+{SHALLOW_PROMPT_INSTRUCTIONS}
+""".strip()
@@ -0,0 +1,418 @@
+# src/rachel/utils/semantic_index.py
+
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional, Tuple
+import numpy as np
+
+VECTORS_FILE = "vectors.npy"
+TIMESTAMPS_FILE = "timestamps.npy"
+
+
+class RingMatrixIndex:
+    """
+    Fixed-capacity window of unit-norm embeddings stored as one preallocated float32
+    `(capacity, dim)` matrix plus a timestamp per row. New vectors overwrite the oldest
+    row (ring cursor); similarity against the live window is a single matvec.
+    With `path`, both arrays are memory-mapped `.npy` files in that directory, so
+    every add is written through in place and the window survives restarts.
+    Callers hold their own lock.
+    """
+
+    def __init__(self, capacity: int, dim: Optional[int] = None, path: Optional[str] = None):
+        if capacity <= 0:
+            raise ValueError(f"RingMatrixIndex capacity must be positive, got {capacity}")
+
+        self.capacity = capacity
+        self.dim = dim
+        self.path: Optional[Path] = Path(path) if path else None
+        self.vectors: Optional[np.ndarray] = None
+        # Note: empty rows carry -inf so the age mask excludes them without a separate size check
+        self.timestamps = np.full(capacity, -np.inf, dtype=np.float64)
+        self.cursor = 0
+        self.size = 0
+
+        if self.path is not None and (self.path / VECTORS_FILE).exists():
+            self._open()
+        elif dim is not None:
+            self._allocate(dim)
+
+    def _allocate(self, dim: int):
+        self.dim = dim
+        if self.path is None:
+            self.vectors = np.zeros((self.capacity, dim), dtype=np.float32)
+            return
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.vectors = np.lib.format.open_memmap(
+            self.path / VECTORS_FILE, mode="w+", dtype=np.float32, shape=(self.capacity, dim)
+        )
+        timestamps = np.lib.format.open_memmap(
+            self.path / TIMESTAMPS_FILE, mode="w+", dtype=np.float64, shape=(self.capacity,)
+        )
+        timestamps[:] = self.timestamps
+        self.timestamps = timestamps
+
+    def _open(self):
+        """Map a persisted window back in; pages are only read when a query touches them."""
+        try:
+            vectors = np.lib.format.open_memmap(self.path / VECTORS_FILE, mode="r+")
+            timestamps = np.lib.format.open_memmap(self.path / TIMESTAMPS_FILE, mode="r+")
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not reopen semantic window at {self.path} ({e}); starting empty")
+            self._discard()
+            return
+
+        rows, dim = vectors.shape
+        if timestamps.shape != (rows,) or (self.dim is not None and dim != self.dim):
+            print(f"⚠️ Semantic window at {self.path} does not match (dim={dim}); starting empty")
+            del vectors, timestamps
+            self._discard()
+            return
+
+        if rows != self.capacity:
+            # Note: capacity changed; carry over the newest rows in time order
+            order = np.argsort(timestamps)
+            order = order[np.isfinite(timestamps[order])][-self.capacity:]
+            kept_vectors, kept_timestamps = np.array(vectors[order]), np.array(timestamps[order])
+            del vectors, timestamps
+            self._allocate(dim)
+            for vec, ts in zip(kept_vectors, kept_timestamps):
+                RingMatrixIndex.add(self, vec, float(ts))
+        else:
+            self.dim = dim
+            self.vectors = vectors
+            self.timestamps = timestamps
+            self.size = int(np.count_nonzero(np.isfinite(timestamps)))
+            self.cursor = self._recover_cursor()
+
+        self._reindex()
+        print(f"📂 Reopened semantic window: {self.size} vectors from {self.path}")
+
+    def _recover_cursor(self) -> int:
+        """
+        Rows are written in time order, so the cursor (oldest row) is right after the newest one.
+        A partial ring fills rows 0..size-1; a full one has a single drop in time where it wrapped
+        (ties from batched adds rule out a plain argmax).
+        """
+        if self.size < self.capacity:
+            return self.size
+        drops = np.flatnonzero(self.timestamps < np.roll(self.timestamps, 1))
+        return int(drops[-1]) if len(drops) else 0
+
+    def _discard(self):
+        for name in (VECTORS_FILE, TIMESTAMPS_FILE):
+            try:
+                os.remove(self.path / name)
+            except FileNotFoundError:
+                pass
+
+    def _reindex(self):
+        """Hook for subclasses to rebuild derived structures after reopening or resetting the window."""
+
+    def _check_dim(self, vec: np.ndarray):
+        """
+        The embedding model may have changed since the window was persisted (or first filled):
+        on a width mismatch, discard the old rows and reallocate for the new width.
+        """
+        if self.vectors is None or vec.shape[-1] == self.dim:
+            return
+
+        print(f"⚠️ Semantic window holds dim={self.dim} vectors but got dim={vec.shape[-1]}; starting empty")
+        self.vectors = None
+        self.timestamps = np.full(self.capacity, -np.inf, dtype=np.float64)
+        self.cursor = 0
+        self.size = 0
+        if self.path is not None:
+            self._discard()
+        self._allocate(vec.shape[-1])
+        self._reindex()
+
+    def flush(self):
+        for array in (self.vectors, self.timestamps):
+            if isinstance(array, np.memmap):
+                array.flush()
+
+    def add(self, vec: np.ndarray, timestamp: float) -> int:
+        """Store `vec` at the cursor, overwriting the oldest row; returns the row used."""
+        self._check_dim(vec)
+        if self.vectors is None:
+            self._allocate(vec.shape[-1])
+
+        row = self.cursor
+        self.vectors[row] = vec
+        # Note: timestamp last; a row only becomes live once its vector is fully written
+        self.timestamps[row] = timestamp
+        self.cursor = (row + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        return row
+
+    def live_mask(self, since: float) -> np.ndarray:
+        return self.timestamps > since
+
+    def max_similarity(self, vec: np.ndarray, since: float) -> Tuple[Optional[float], int]:
+        """
+        Highest cosine similarity between `vec` and rows stored after `since`.
+        Returns (None, 0) when nothing in the window is recent enough.
+        """
+        self._check_dim(vec)
+        if self.vectors is None:
+            return None, 0
+
+        live = self.live_mask(since)
+        live_count = int(np.count_nonzero(live))
+        if live_count == 0:
+            return None, 0
+
+        sims = self.vectors @ vec
+        sims[~live] = -np.inf
+        return float(sims.max()), live_count
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class _EvictingRingIndex(RingMatrixIndex, ABC):
+    """
+    Ring index with an ANN structure on top. Rows are written in time order, so expired
+    rows are always a contiguous run starting at the oldest; eviction walks that run
+    and removes each row from the ANN structure (as does overwriting a full ring).
+    """
+
+    def __init__(self, capacity: int, dim: Optional[int] = None, path: Optional[str] = None):
+        self._head = 0       # absolute insertion number of the oldest row still indexed
+        self._added = 0      # absolute number of rows ever added
+        super().__init__(capacity, dim, path)
+
+    def _reindex(self):
+        # Note: ANN structures are not persisted; rebuild them from the reopened rows (oldest first)
+        self._head = self.cursor if self.size == self.capacity else 0
+        self._added = self._head + self.size
+        for n in range(self._head, self._added):
+            self._insert(n % self.capacity)
+
+    def add(self, vec: np.ndarray, timestamp: float) -> int:
+        self._check_dim(vec)
+        if self._added - self._head >= self.capacity:
+            self._remove(self._head % self.capacity)
+            self._head += 1
+
+        row = super().add(vec, timestamp)
+        self._added += 1
+        self._insert(row)
+        return row
+
+    def evict(self, since: float):
+        while self._head < self._added and self.timestamps[self._head % self.capacity] <= since:
+            self._remove(self._head % self.capacity)
+            self._head += 1
+
+    def max_similarity(self, vec: np.ndarray, since: float) -> Tuple[Optional[float], int]:
+        self._check_dim(vec)
+        self.evict(since)
+        live_count = self._added - self._head
+        if live_count == 0:
+            return None, 0
+        return self._search(vec, since), live_count
+
+    @abstractmethod
+    def _insert(self, row: int):
+        """Add ring row `row` to the ANN structure."""
+        pass
+
+    @abstractmethod
+    def _remove(self, row: int):
+        """Drop ring row `row` from the ANN structure."""
+        pass
+
+    @abstractmethod
+    def _search(self, vec: np.ndarray, since: float) -> float:
+        """Best similarity among the indexed (live) rows."""
+        pass
+
+
+class IvfRingIndex(_EvictingRingIndex):
+    """
+    Pure-numpy inverted-file index: rows are bucketed by nearest of `nlist` spherical
+    k-means centroids and a query only scans the `nprobe` closest buckets. Falls back
+    to the exact scan until there is enough data to cluster, and re-clusters each time
+    the ring has fully turned over. Higher `nprobe` = better recall, slower queries.
+    """
+
+    def __init__(self, capacity: int, nlist: int = 0, nprobe: int = 8, dim: Optional[int] = None, path: Optional[str] = None):
+        self.nlist = nlist or max(1, int(np.sqrt(capacity)))
+        self.nprobe = max(1, min(nprobe, self.nlist))
+        self.train_size = min(capacity, self.nlist * 32)
+        self.centroids: Optional[np.ndarray] = None
+        self._trained_at = 0
+
+        self.assignment = np.full(capacity, -1, dtype=np.int32)
+        self._position = np.full(capacity, -1, dtype=np.int64)
+        self._lists = [np.empty(16, dtype=np.int64) for _ in range(self.nlist)]
+        self._list_len = np.zeros(self.nlist, dtype=np.int64)
+        super().__init__(capacity, dim, path)
+
+    def _reindex(self):
+        # Note: clustering is redone lazily once enough rows are live again
+        self.centroids = None
+        self._trained_at = 0
+        self.assignment.fill(-1)
+        self._position.fill(-1)
+        self._lists = [np.empty(16, dtype=np.int64) for _ in range(self.nlist)]
+        self._list_len = np.zeros(self.nlist, dtype=np.int64)
+        super()._reindex()
+
+    def _insert(self, row: int):
+        if self.centroids is None:
+            return
+        self._append(row, int(np.argmax(self.centroids @ self.vectors[row])))
+
+    def _append(self, row: int, cluster: int):
+        n = self._list_len[cluster]
+        if n == len(self._lists[cluster]):
+            grown = np.empty(2 * n, dtype=np.int64)
+            grown[:n] = self._lists[cluster]
+            self._lists[cluster] = grown
+        self._lists[cluster][n] = row
+        self._list_len[cluster] = n + 1
+        self.assignment[row] = cluster
+        self._position[row] = n
+
+    def _remove(self, row: int):
+        cluster = self.assignment[row]
+        if cluster < 0:
+            return
+
+        # Note: swap-with-last keeps each bucket dense without shifting
+        pos = self._position[row]
+        last = self._list_len[cluster] - 1
+        moved = self._lists[cluster][last]
+        self._lists[cluster][pos] = moved
+        self._position[moved] = pos
+        self._list_len[cluster] = last
+        self.assignment[row] = -1
+        self._position[row] = -1
+
+    def _live_rows(self) -> np.ndarray:
+        return np.arange(self._head, self._added) % self.capacity
+
+    def train(self, iterations: int = 10, sample_size: int = 20000, seed: int = 0):
+        """Spherical k-means on (a sample of) the live rows, then re-bucket every live row."""
+        rows = self._live_rows()
+        rng = np.random.default_rng(seed)
+        sample = self.vectors[rng.choice(rows, size=min(len(rows), sample_size), replace=False)]
+
+        centroids = sample[rng.choice(len(sample), size=min(self.nlist, len(sample)), replace=False)].copy()
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            for c in range(len(centroids)):
+                members = sample[labels == c]
+                if len(members):
+                    centroids[c] = members.sum(axis=0)
+            centroids /= np.maximum(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12)
+
+        self.centroids = centroids.astype(np.float32)
+        self.nlist = len(self.centroids)
+        self.nprobe = min(self.nprobe, self.nlist)
+        self._lists = [np.empty(16, dtype=np.int64) for _ in range(self.nlist)]
+        self._list_len = np.zeros(self.nlist, dtype=np.int64)
+        self.assignment.fill(-1)
+        self._position.fill(-1)
+
+        for start in range(0, len(rows), 8192):
+            chunk = rows[start:start + 8192]
+            for row, cluster in zip(chunk, np.argmax(self.vectors[chunk] @ self.centroids.T, axis=1)):
+                self._append(int(row), int(cluster))
+
+        self._trained_at = self._added
+
+    def _search(self, vec: np.ndarray, since: float) -> float:
+        live_count = self._added - self._head
+        stale = self._added - self._trained_at >= self.capacity
+        if self.centroids is None or stale:
+            if live_count < self.train_size:
+                return RingMatrixIndex.max_similarity(self, vec, since)[0]
+            self.train()
+
+        probes = np.argpartition(-(self.centroids @ vec), self.nprobe - 1)[:self.nprobe]
+        rows = np.concatenate([self._lists[c][:self._list_len[c]] for c in probes])
+        if len(rows) == 0:
+            return -1.0
+        return float((self.vectors[rows] @ vec).max())
+
+
+class HnswRingIndex(_EvictingRingIndex):
+    """
+    HNSW graph (hnswlib, inner-product space) over the ring rows; labels are row numbers,
+    so overwriting a row updates its graph node in place and eviction marks it deleted.
+    `ef_search` trades recall for latency.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        m: int = 16,
+        ef_construction: int = 200,
+        ef_search: int = 64,
+        dim: Optional[int] = None,
+        path: Optional[str] = None,
+    ):
+        import hnswlib
+
+        self._hnswlib = hnswlib
+        self.m = m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.index = None
+        super().__init__(capacity, dim, path)
+
+    def _reindex(self):
+        self._create_graph(self.dim)
+        super()._reindex()
+
+    def _allocate(self, dim: int):
+        super()._allocate(dim)
+        self._create_graph(dim)
+
+    def _create_graph(self, dim: int):
+        self.index = self._hnswlib.Index(space="ip", dim=dim)
+        self.index.init_index(max_elements=self.capacity, ef_construction=self.ef_construction, M=self.m)
+        self.index.set_ef(self.ef_search)
+
+    def _insert(self, row: int):
+        # Note: re-adding a deleted label un-deletes it and updates the vector
+        self.index.add_items(self.vectors[row:row + 1], np.array([row]))
+
+    def _remove(self, row: int):
+        self.index.mark_deleted(row)
+
+    def _search(self, vec: np.ndarray, since: float) -> float:
+        _, distances = self.index.knn_query(vec, k=1)
+        # Note: hnswlib's "ip" distance is 1 - dot
+        return float(1.0 - distances[0][0])
+
+
+def build_semantic_index(semantic_cfg, path: Optional[str] = None) -> RingMatrixIndex:
+    """Ring index for the configured `semantic.index` kind (exact | ivf | hnsw), persisted under `path` if given."""
+    kind = semantic_cfg.index
+
+    if kind == "hnsw":
+        try:
+            return HnswRingIndex(
+                semantic_cfg.context_limit,
+                m=semantic_cfg.hnsw_m,
+                ef_construction=semantic_cfg.hnsw_ef_construction,
+                ef_search=semantic_cfg.hnsw_ef_search,
+                path=path,
+            )
+        except ImportError:
+            print("⚠️ hnswlib is not installed; falling back to the numpy IVF semantic index")
+            kind = "ivf"
+
+    if kind == "ivf":
+        return IvfRingIndex(
+            semantic_cfg.context_limit, nlist=semantic_cfg.ivf_nlist, nprobe=semantic_cfg.ivf_nprobe, path=path
+        )
+
+    return RingMatrixIndex(semantic_cfg.context_limit, path=path)
@@ -0,0 +1,154 @@
+# src/rachel/utils/shallow_grammar.py
+
+import json
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+# Note: same shape as the training completions (see training/update_prompts.py), with the
+# "both empty or both present" invariant from validate_item baked in.
+SHALLOW_OUTPUT_GBNF = r'''
+root    ::= ws ws ( empty | flagged )
+ws      ::= [ \n]?
+empty   ::= "Flags: []\nSemanticSummary: \"\""
+flagged ::= "Flags: [" str ( ", " str )* "]\nSemanticSummary: " str
+str     ::= "\"" char+ "\""
+char    ::= [^"\\\x00-\x1f] | "\\" ( ["\\/bfnrt] | "u" hex hex hex hex )
+hex     ::= [0-9a-fA-F]
+'''.strip()
+
+HEAD = "Flags: ["
+EMPTY_TAIL = '\nSemanticSummary: ""'
+SUMMARY_HEAD = '\nSemanticSummary: "'
+FLAG_SEP = ', "'
+HEX_DIGITS = set("0123456789abcdefABCDEF")
+ESCAPES = set('"\\/bfnrt')
+MAX_LEADING_WS = 2
+
+START = ("start", 0)
+DONE = ("done",)
+
+State = Tuple
+
+
+def step(state: State, ch: str) -> Optional[State]:
+    """
+    Character-level FSM for SHALLOW_OUTPUT_GBNF. Returns the next state, or None if
+    `ch` is not allowed here. States are small hashable tuples so masks can be cached.
+    """
+    kind = state[0]
+
+    if kind == "start":
+        if ch in " \n" and state[1] < MAX_LEADING_WS:
+            return ("start", state[1] + 1)
+        return ("lit", HEAD, 1, ("list",)) if ch == HEAD[0] else None
+
+    if kind == "lit":
+        _, text, i, then = state
+        if ch != text[i]:
+            return None
+        return then if i + 1 == len(text) else ("lit", text, i + 1, then)
+
+    if kind == "list":
+        if ch == "]":
+            return ("lit", EMPTY_TAIL, 0, DONE)
+        return ("str", "flag", True) if ch == '"' else None
+
+    if kind == "str":
+        _, ctx, empty = state
+        if ch == '"':
+            if empty:
+                return None
+            return ("after_flag",) if ctx == "flag" else DONE
+        if ch == "\\":
+            return ("esc", ctx)
+        if ord(ch) < 0x20:
+            return None
+        return ("str", ctx, False)
+
+    if kind == "esc":
+        if ch in ESCAPES:
+            return ("str", state[1], False)
+        return ("hex", state[1], 4) if ch == "u" else None
+
+    if kind == "hex":
+        if ch not in HEX_DIGITS:
+            return None
+        return ("str", state[1], False) if state[2] == 1 else ("hex", state[1], state[2] - 1)
+
+    if kind == "after_flag":
+        if ch == ",":
+            return ("lit", FLAG_SEP, 1, ("str", "flag", True))
+        if ch == "]":
+            return ("lit", SUMMARY_HEAD, 0, ("str", "summary", True))
+        return None
+
+    return None
+
+
+def advance(state: Optional[State], text: str) -> Optional[State]:
+    for ch in text:
+        if state is None:
+            return None
+        state = step(state, ch)
+    return state
+
+
+class ShallowGrammarVocab:
+    """
+    Token-level view of the FSM: which token ids may follow a given state. Tokens are
+    grouped by first character, so literal states only ever test a handful of them;
+    allowed sets are cached per state (string-body states repeat constantly).
+    """
+
+    def __init__(self, token_texts: Sequence[str], eos_ids: Iterable[int]):
+        self.token_texts = list(token_texts)
+        self.eos_ids = set(eos_ids)
+        self._by_first_char: Dict[str, List[int]] = {}
+        for token_id, text in enumerate(self.token_texts):
+            if text and token_id not in self.eos_ids:
+                self._by_first_char.setdefault(text[0], []).append(token_id)
+        self._allowed: Dict[State, Set[int]] = {}
+
+    def allowed(self, state: State) -> Set[int]:
+        cached = self._allowed.get(state)
+        if cached is not None:
+            return cached
+
+        if state == DONE:
+            allowed = set(self.eos_ids)
+        else:
+            allowed = set()
+            for first_char, token_ids in self._by_first_char.items():
+                if step(state, first_char) is None:
+                    continue
+                for token_id in token_ids:
+                    if advance(state, self.token_texts[token_id]) is not None:
+                        allowed.add(token_id)
+
+        self._allowed[state] = allowed
+        return allowed
+
+    def next_state(self, state: State, token_id: int) -> Optional[State]:
+        if state == DONE:
+            return DONE
+        return advance(state, self.token_texts[token_id])
+
+
+CONSTRAINED_OUTPUT_RE = re.compile(r'^\s*Flags: (\[.*?\])\nSemanticSummary: (".*")\s*$', re.DOTALL)
+
+
+def parse_constrained_shallow_output(raw: str) -> Tuple[List[str], str]:
+    """
+    Strict parser for grammar-constrained output. Anything that doesn't match the
+    grammar exactly (e.g. generation cut off by max_tokens) counts as no flags.
+    """
+    match = CONSTRAINED_OUTPUT_RE.match(raw)
+    if not match:
+        print(f"⚠️ Constrained shallow output incomplete, treating as no flags: {raw!r}")
+        return [], ""
+
+    try:
+        return json.loads(match.group(1)), json.loads(match.group(2))
+    except json.JSONDecodeError:
+        print(f"⚠️ Constrained shallow output failed to decode: {raw!r}")
+        return [], ""
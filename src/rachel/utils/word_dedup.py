@@ -0,0 +1,76 @@
+# src/rachel/utils/word_dedup.py
+
+import re
+from collections import deque
+from typing import Deque, Dict, List, Tuple
+
+# (absolute start, absolute end, text)
+TimedWord = Tuple[float, float, str]
+
+_TOKEN_STRIP = re.compile(r"[^\w']+")
+
+
+def token_key(text: str) -> int:
+    """Hash of a word with case and punctuation removed."""
+    return hash(_TOKEN_STRIP.sub("", text.lower().replace("’", "'")))
+
+
+class WordDeduplicator:
+    """
+    Trims re-transcribed overlap by aligning incoming word timestamps against a
+    rolling index of already committed words.
+
+    An incoming word is a duplicate when it starts inside committed audio and either
+    matches a committed word (same normalized token, start within `slack` seconds)
+    or sits mostly before the commit point. The first word that starts past the
+    commit point ends the overlap, so each chunk costs O(words).
+    """
+
+    def __init__(self, tolerance: float = 0.1, slack: float = 0.5, horizon: float = 30.0):
+        self.tolerance = tolerance
+        self.slack = slack
+        self.horizon = horizon
+        self.committed_end = 0.0
+        self._words: Deque[Tuple[float, int]] = deque()         # (start, key) in commit order
+        self._by_key: Dict[int, Deque[float]] = {}               # key -> committed start times
+
+    def trim(self, words: List[TimedWord]) -> List[TimedWord]:
+        for i, (start, end, text) in enumerate(words):
+            if start >= self.committed_end - self.tolerance:
+                return words[i:]
+
+            if self._matches(start, token_key(text)):
+                continue
+
+            # Note: an unmatched word straddling the commit point is kept if most of it is new audio
+            if (start + end) / 2 > self.committed_end:
+                return words[i:]
+
+        return []
+
+    def commit(self, words: List[TimedWord]):
+        for start, end, text in words:
+            key = token_key(text)
+            self._words.append((start, key))
+            self._by_key.setdefault(key, deque()).append(start)
+            self.committed_end = max(self.committed_end, end)
+
+        # Evict words that can no longer overlap anything incoming
+        while self._words and self._words[0][0] < self.committed_end - self.horizon:
+            start, key = self._words.popleft()
+            starts = self._by_key[key]
+            starts.popleft()
+            if not starts:
+                del self._by_key[key]
+
+    def _matches(self, start: float, key: int) -> bool:
+        starts = self._by_key.get(key)
+        if not starts:
+            return False
+        # Note: scan newest first; overlap only ever lines up with the recent tail
+        for committed_start in reversed(starts):
+            if abs(committed_start - start) <= self.slack:
+                return True
+            if committed_start < start - self.slack:
+                break
+        return False
@@ -0,0 +1,87 @@
+# src/training/tune_prefilter.py
+
+import argparse
+import json
+import re
+from glob import glob
+from typing import List, Optional, Tuple
+
+from rachel.prefilter import DEFAULT_WEIGHTS, score_text
+from rachel.utils.common import parse_extract_list
+
+TRANSCRIPT_MARKER = re.compile(r"Transcript:\s*\n")
+
+
+def extract_transcript(prompt: str) -> Optional[str]:
+    """Pull the JSON-quoted Transcript line back out of a shallow prompt."""
+    match = TRANSCRIPT_MARKER.search(prompt)
+    if not match:
+        return None
+    try:
+        text, _ = json.JSONDecoder().raw_decode(prompt, match.end())
+    except json.JSONDecodeError:
+        return None
+    return text if isinstance(text, str) else None
+
+
+def load_examples(path: str) -> List[Tuple[str, bool]]:
+    examples = []
+    files = glob(f"{path}/**/training_hf.jsonl", recursive=True)
+    print(f"🔍 Loading {len(files)} training_hf.jsonl files from {path}")
+
+    for file_path in files:
+        with open(file_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    obj = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                text = extract_transcript(obj.get("prompt", ""))
+                if text is None:
+                    continue
+                examples.append((text, bool(parse_extract_list(obj.get("completion", "")))))
+
+    return examples
+
+
+def tune(examples: List[Tuple[str, bool]], rare_min_length: int, min_recall: float):
+    scored = [(score_text(text, rare_min_length=rare_min_length), flagged) for text, flagged in examples]
+    positives = sum(1 for _, flagged in scored if flagged)
+    total = len(scored)
+    if not total or not positives:
+        print("⚠️ Need both flagged and unflagged examples to tune.")
+        return
+
+    print(f"\n📊 {total} examples ({positives} flagged, {total - positives} empty)")
+    print("\nMean signal counts (flagged vs empty):")
+    for name in DEFAULT_WEIGHTS:
+        pos = sum(r.signals[name] for r, flagged in scored if flagged) / positives
+        neg = sum(r.signals[name] for r, flagged in scored if not flagged) / max(1, total - positives)
+        print(f"  {name:<12} {pos:6.2f}  vs {neg:6.2f}")
+
+    print("\nthreshold | skip rate | flagged recall | flagged skipped")
+    best = 0.0
+    for threshold in sorted({r.score for r, _ in scored} | {0.0}):
+        skipped = [flagged for r, flagged in scored if r.score < threshold]
+        missed = sum(skipped)
+        recall = 1 - missed / positives
+        print(f"  {threshold:7.2f} | {len(skipped) / total:9.1%} | {recall:14.1%} | {missed}")
+        if recall >= min_recall:
+            best = threshold
+
+    print(f"\n✅ Suggested summarization.prefilter_threshold: {best} (flagged recall >= {min_recall:.0%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tune the shallow prefilter threshold against training_hf.jsonl data.")
+    parser.add_argument("--path", required=True, help="Directory searched recursively for training_hf.jsonl files.")
+    parser.add_argument("--rare-min-length", type=int, default=7, help="Minimum length for a rare term.")
+    parser.add_argument("--min-recall", type=float, default=0.98, help="Fraction of flagged examples that must pass.")
+    args = parser.parse_args()
+
+    tune(load_examples(args.path), args.rare_min_length, args.min_recall)
+
+
+if __name__ == "__main__":
+    main()
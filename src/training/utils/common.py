@@ -5,9 +5,9 @@ import re
 import json
 from glob import glob
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from rachel.core.model import RawTranscriptSegment
-from rachel.utils.common import merge_segments_by_words_with_cutoff
+from rachel.utils.common import collect_words_with_cutoff
 
 
 BASE_OUTPUT_ROOT = "/DATA"
@@ -181,6 +181,18 @@ def validate_and_finalize_json(json_path: str) -> None:
 
 
 
+def merge_words_with_cutoff(
+    segments: List[RawTranscriptSegment],
+    chunk_offset: float,
+    cutoff: float = 0.0,
+) -> Optional[Tuple[float, float, str]]:
+    """(start, end, text) spanning the words that end after `cutoff`, or None if none do."""
+    words = collect_words_with_cutoff(segments, chunk_offset, cutoff)
+    if not words:
+        return None
+    return words[0][0], words[-1][1], " ".join(w for _, _, w in words)
+
+
 def merge_segments_entire_file(
     segments: List[RawTranscriptSegment],
     min_duration: float = 3.5,
@@ -197,7 +209,7 @@ def merge_segments_entire_file(
 
         buffer.append(seg)
 
-        result = merge_segments_by_words_with_cutoff(
+        result = merge_words_with_cutoff(
             buffer,
             chunk_offset=buffer[0].start,
             cutoff=min(last_end_time, buffer[0].start)
@@ -223,7 +235,7 @@ def merge_segments_entire_file(
             buffer = []
 
     if buffer:
-        result = merge_segments_by_words_with_cutoff(
+        result = merge_words_with_cutoff(
             buffer,
             chunk_offset=buffer[0].start,
             cutoff=min(last_end_time, buffer[0].start)
@@ -0,0 +1,54 @@
+import numpy as np
+
+from rachel.core.model import RawTranscriptSegment, RawTranscriptWord
+from rachel.utils.audio import pad_to_clip_windows
+from rachel.utils.common import split_segments_by_window
+
+RATE = 16000
+WINDOW_S = 30
+
+
+def collect_chunks(audio, clips, max_duration):
+    """faster-whisper 1.2's packing: consecutive clips share a window until it would exceed max_duration."""
+    windows, current, offset, duration = [], [], None, 0
+    for clip in clips:
+        start, end = int(clip["start"] * RATE), int(clip["end"] * RATE)
+        if current and duration + (end - start) > max_duration * RATE:
+            windows.append((offset, np.concatenate(current)))
+            current, duration = [], 0
+        if not current:
+            offset = clip["start"]
+        current.append(audio[start:end])
+        duration += end - start
+    windows.append((offset, np.concatenate(current)))
+    return windows
+
+
+def fake_decode(audio, clips):
+    """One segment per decode window, one word per run of constant non-zero samples (its value names it)."""
+    segments = []
+    for offset, window in collect_chunks(audio, clips, WINDOW_S):
+        edges = np.flatnonzero(np.diff(np.concatenate(([0.0], window, [0.0])))) / RATE
+        words = [
+            RawTranscriptWord(start=offset + s, end=offset + e, text=f"w{window[int(s * RATE)]:g}")
+            for s, e in zip(edges[::2], edges[1::2])
+        ]
+        if words:
+            segments.append(RawTranscriptSegment(
+                start=words[0].start, end=words[-1].end, text=" ".join(w.text for w in words), words=words,
+            ))
+    return segments
+
+
+def test_adjacent_chunks_keep_their_own_words_and_offsets():
+    first = np.zeros(2 * RATE, dtype=np.float32)
+    first[RATE // 2:RATE] = 1.0                 # word at 0.5-1.0s of chunk 0
+    second = np.zeros(2 * RATE, dtype=np.float32)
+    second[RATE // 4:RATE] = 2.0                # word at 0.25-1.0s of chunk 1
+
+    audio, clips = pad_to_clip_windows([first, second], RATE, WINDOW_S)
+    per_chunk = split_segments_by_window(fake_decode(audio, clips), WINDOW_S, 2)
+
+    assert [[w.text for s in segs for w in s.words] for segs in per_chunk] == [["w1"], ["w2"]]
+    assert [(w.start, w.end) for w in per_chunk[0][0].words] == [(0.5, 1.0)]
+    assert [(w.start, w.end) for w in per_chunk[1][0].words] == [(0.25, 1.0)]